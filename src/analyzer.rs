@@ -36,7 +36,8 @@
 //!
 //! - [`UnifiedParser`] - Handles JSONL file parsing with schema flexibility
 //! - [`FileParser`] - Provides file discovery and basic parsing utilities
-//! - [`DeduplicationEngine`] - Prevents double-counting of usage data
+//! - [`DedupKeySet`](crate::dedup::DedupKeySet) - Prevents double-counting of usage
+//!   data with one run-wide set of messageId:requestId hashes (no time window)
 //! - [`ReportDisplayManager`] - Formats and presents analysis results
 //! ## Usage Example
 //!
@@ -71,8 +72,10 @@
 
 use crate::dedup::ProcessOptions;
 use crate::reports::ReportDisplayManager;
+use crate::timestamp_parser::TimestampParser;
 use crate::models::*;
 use anyhow::Result;
+use std::collections::HashMap;
 use tracing::warn;
 
 pub struct ClaudeUsageAnalyzer {
@@ -98,7 +101,7 @@ impl ClaudeUsageAnalyzer {
         options: ProcessOptions,
     ) -> Result<Vec<SessionOutput>> {
         // Check and refresh baseline for daily/monthly commands
-        use crate::live::baseline::{should_refresh_baseline, refresh_baseline};
+        use crate::live::baseline::{backup_dir, run_backup, should_refresh_baseline};
         use crate::parquet::reader::ParquetSummaryReader;
         use crate::config::get_config;
         
@@ -108,16 +111,16 @@ impl ClaudeUsageAnalyzer {
         if use_parquet {
             // Check if we need to refresh the backup
             if should_refresh_baseline() {
-                // Run backup if needed (this is async)
-                refresh_baseline().await.unwrap_or_default();
+                // Run backup if needed (this is async). Only the backup is
+                // needed: the sessions are read from it below, so the live
+                // baseline summary is not loaded
+                run_backup().await.unwrap_or_default();
             }
 
             // Get backup directory from config
             let _config = get_config();
             // Use ~/.claude-backup/ as the default backup location (claude-keeper default)
-            let backup_dir = dirs::home_dir()
-                .unwrap_or_else(|| std::path::PathBuf::from("."))
-                .join(".claude-backup");
+            let backup_dir = backup_dir().to_path_buf();
             
             // Use ParquetSummaryReader to get detailed session data
             let reader = ParquetSummaryReader::new(backup_dir)?;
@@ -135,30 +138,21 @@ impl ClaudeUsageAnalyzer {
             // even if their last activity was outside the range
             let mut filtered_sessions = sessions;
             if options.since_date.is_some() || options.until_date.is_some() {
+                let bounds = day_key_bounds(&options);
+                // Sessions share most of their days, so each distinct day key
+                // is parsed and range-checked once rather than once per session
+                let mut day_in_range: HashMap<String, bool> = HashMap::new();
                 filtered_sessions = filtered_sessions.into_iter()
                     .filter(|session| {
                         // Check if this session has any daily_usage entries within the date range
-                        for date_str in session.daily_usage.keys() {
-                            if let Ok(date) = chrono::NaiveDate::parse_from_str(date_str, "%Y-%m-%d") {
-                                let session_date = date.and_hms_opt(0, 0, 0)
-                                    .and_then(|dt| Some(chrono::DateTime::<chrono::Utc>::from_naive_utc_and_offset(dt, chrono::Utc)));
-                                
-                                if let Some(session_dt) = session_date {
-                                    // Check if this date is within our filter range
-                                    let within_range = match (&options.since_date, &options.until_date) {
-                                        (Some(since), Some(until)) => session_dt >= *since && session_dt <= *until,
-                                        (Some(since), None) => session_dt >= *since,
-                                        (None, Some(until)) => session_dt <= *until,
-                                        (None, None) => true,
-                                    };
-                                    
-                                    if within_range {
-                                        return true; // This session has activity in the date range
-                                    }
-                                }
+                        session.daily_usage.keys().any(|date_str| {
+                            if let Some(&within_range) = day_in_range.get(date_str) {
+                                return within_range;
                             }
-                        }
-                        false // No activity in the date range
+                            let within_range = day_within_range(date_str, &bounds, &options);
+                            day_in_range.insert(date_str.clone(), within_range);
+                            within_range
+                        })
                     })
                     .collect();
             }
@@ -208,3 +202,107 @@ impl ClaudeUsageAnalyzer {
         Ok(())
     }
 }
+
+/// Inclusive `YYYY-MM-DD` bounds on the day keys that can fall within the
+/// options' date range, where a day counts from its UTC midnight.
+///
+/// Used as a cheap prefilter: a key outside these bounds is outside the
+/// range, and only keys inside them are parsed for the exact check.
+fn day_key_bounds(options: &ProcessOptions) -> (Option<String>, Option<String>) {
+    let since_key = options.since_date.map(|since| {
+        let first_day = if since.time() == chrono::NaiveTime::MIN {
+            since.date_naive()
+        } else {
+            // Midnight of the since date itself is already before the range
+            since.date_naive() + chrono::Duration::days(1)
+        };
+        first_day.to_string()
+    });
+    let until_key = options
+        .until_date
+        .map(|until| until.date_naive().to_string());
+    (since_key, until_key)
+}
+
+/// Whether a `YYYY-MM-DD` day key, taken from its UTC midnight, falls within
+/// the options' date range. `bounds` are the options' [`day_key_bounds`].
+fn day_within_range(
+    date_str: &str,
+    (since_key, until_key): &(Option<String>, Option<String>),
+    options: &ProcessOptions,
+) -> bool {
+    // YYYY-MM-DD keys sort chronologically, so days outside the range
+    // are rejected by string comparison before any date parsing
+    if since_key.as_deref().map_or(false, |since| date_str < since)
+        || until_key.as_deref().map_or(false, |until| date_str > until)
+    {
+        return false;
+    }
+    let Some(date) = TimestampParser::parse_day_key(date_str) else {
+        return false;
+    };
+    let Some(session_dt) = date
+        .and_hms_opt(0, 0, 0)
+        .map(|dt| chrono::DateTime::<chrono::Utc>::from_naive_utc_and_offset(dt, chrono::Utc))
+    else {
+        return false;
+    };
+
+    // Check if this date is within our filter range
+    match (&options.since_date, &options.until_date) {
+        (Some(since), Some(until)) => session_dt >= *since && session_dt <= *until,
+        (Some(since), None) => session_dt >= *since,
+        (None, Some(until)) => session_dt <= *until,
+        (None, None) => true,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use chrono::{TimeZone, Utc};
+
+    fn options(
+        since: Option<chrono::DateTime<Utc>>,
+        until: Option<chrono::DateTime<Utc>>,
+    ) -> ProcessOptions {
+        ProcessOptions {
+            json_output: false,
+            limit: None,
+            since_date: since,
+            until_date: until,
+            snapshot: false,
+            command: "daily".to_string(),
+            exclude_vms: false,
+        }
+    }
+
+    #[test]
+    fn test_day_key_bounds() {
+        let since = Utc.with_ymd_and_hms(2025, 8, 1, 0, 0, 0).unwrap();
+        let until = Utc.with_ymd_and_hms(2025, 8, 20, 23, 59, 59).unwrap();
+        let (since_key, until_key) = day_key_bounds(&options(Some(since), Some(until)));
+        assert_eq!(since_key.as_deref(), Some("2025-08-01"));
+        assert_eq!(until_key.as_deref(), Some("2025-08-20"));
+
+        // A since time after midnight excludes that day's midnight
+        let since = Utc.with_ymd_and_hms(2025, 8, 1, 12, 0, 0).unwrap();
+        let (since_key, until_key) = day_key_bounds(&options(Some(since), None));
+        assert_eq!(since_key.as_deref(), Some("2025-08-02"));
+        assert_eq!(until_key, None);
+    }
+
+    #[test]
+    fn test_day_within_range() {
+        let since = Utc.with_ymd_and_hms(2025, 8, 1, 12, 0, 0).unwrap();
+        let until = Utc.with_ymd_and_hms(2025, 8, 20, 23, 59, 59).unwrap();
+        let opts = options(Some(since), Some(until));
+        let bounds = day_key_bounds(&opts);
+
+        assert!(!day_within_range("2025-08-01", &bounds, &opts));
+        assert!(day_within_range("2025-08-02", &bounds, &opts));
+        assert!(day_within_range("2025-08-20", &bounds, &opts));
+        assert!(!day_within_range("2025-08-21", &bounds, &opts));
+        assert!(!day_within_range("2025-08-1x", &bounds, &opts));
+    }
+}
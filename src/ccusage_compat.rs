@@ -4,17 +4,28 @@
 //! 100% parity in cost calculations. It includes any quirks or "bugs" that ccusage
 //! has to ensure identical results.
 
+use crate::config::get_config;
+use crate::dedup::{dedup_key, DedupKeySet};
+use crate::io_utils::{contains_bytes, is_dir_entry, split_lines, trim_ascii};
+use crate::pricing::{OPUS_RATES, SONNET_RATES};
+use crate::timestamp_parser::TimestampParser;
 use anyhow::{Context, Result};
 use chrono::{DateTime, NaiveDate, Utc};
-use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use std::collections::{HashMap, HashSet};
+use std::collections::HashMap;
 use std::fs;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 use tracing::{debug, info, warn};
+use xxhash_rust::xxh3::xxh3_128;
 
 /// CCUsage-compatible usage data structure
+///
+/// Only the fields the daily aggregation reads are kept; every other key of
+/// a JSONL line (including `sessionId`) is skipped by the parser without
+/// being allocated.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct CCUsageData {
     pub timestamp: String,
@@ -23,8 +34,6 @@ pub struct CCUsageData {
     pub cost_usd: Option<f64>,
     #[serde(rename = "requestId")]
     pub request_id: Option<String>,
-    #[serde(rename = "sessionId")]
-    pub session_id: Option<String>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -49,40 +58,136 @@ pub struct CCUsage {
 pub struct CCDailyUsage {
     pub date: String,
     #[serde(rename = "inputTokens")]
-    pub input_tokens: u32,
+    pub input_tokens: u64,
     #[serde(rename = "outputTokens")]
-    pub output_tokens: u32,
+    pub output_tokens: u64,
     #[serde(rename = "cacheCreationTokens")]
-    pub cache_creation_tokens: u32,
+    pub cache_creation_tokens: u64,
     #[serde(rename = "cacheReadTokens")]
-    pub cache_read_tokens: u32,
+    pub cache_read_tokens: u64,
     #[serde(rename = "totalCost")]
     pub total_cost: f64,
     #[serde(rename = "modelsUsed")]
     pub models_used: Vec<String>,
 }
 
+/// Interning table for model names seen during a load.
+///
+/// Per-day model sets store indices into `names` instead of their own
+/// `String` copies; names are resolved once when summaries are emitted.
+/// Each model's pricing rates are resolved when it is first interned.
+#[derive(Debug, Default)]
+struct ModelTable {
+    names: Vec<String>,
+    rates: Vec<&'static [f64; 4]>,
+    ids: HashMap<String, usize>,
+}
+
+impl ModelTable {
+    fn intern(&mut self, model: String) -> usize {
+        if let Some(&id) = self.ids.get(&model) {
+            return id;
+        }
+        let id = self.names.len();
+        self.rates.push(ccusage_rates(&model));
+        self.names.push(model.clone());
+        self.ids.insert(model, id);
+        id
+    }
+}
+
+/// Set of interned model ids, stored as a bitmask.
+///
+/// A day rarely sees more than a handful of models, so adding one is a
+/// single OR into the first word instead of hashing into a `HashSet`.
+#[derive(Debug, Default)]
+struct ModelSet {
+    bits: Vec<u64>,
+}
+
+impl ModelSet {
+    fn insert(&mut self, id: usize) {
+        let (word, bit) = (id / 64, id % 64);
+        if word >= self.bits.len() {
+            self.bits.resize(word + 1, 0);
+        }
+        self.bits[word] |= 1 << bit;
+    }
+
+    fn iter(&self) -> impl Iterator<Item = usize> + '_ {
+        self.bits.iter().enumerate().flat_map(|(word, &bits)| {
+            (0..64)
+                .filter(move |bit| bits & (1 << bit) != 0)
+                .map(move |bit| word * 64 + bit)
+        })
+    }
+}
+
+/// Running state for one day: the summary being built and the models seen,
+/// kept in one map value so each entry is aggregated with a single lookup
+///
+/// Entries without a pre-calculated cost only add their token counts to
+/// `unpriced`, indexed by model id; those sums are priced once per model
+/// when the day is emitted rather than once per entry.
+#[derive(Debug)]
+struct DayTotals {
+    usage: CCDailyUsage,
+    models: ModelSet,
+    unpriced: Vec<[u64; 4]>,
+}
+
+impl DayTotals {
+    fn add_unpriced(&mut self, model_id: usize, tokens: [u64; 4]) {
+        if model_id >= self.unpriced.len() {
+            self.unpriced.resize(model_id + 1, [0; 4]);
+        }
+        for (sum, count) in self.unpriced[model_id].iter_mut().zip(tokens) {
+            *sum += count;
+        }
+    }
+
+    fn unpriced_cost(&self, models: &ModelTable) -> f64 {
+        self.unpriced
+            .iter()
+            .enumerate()
+            .map(|(id, tokens)| cost_of_tokens(tokens, models.rates[id]))
+            .sum()
+    }
+}
+
 /// Create unique hash for deduplication (ccusage algorithm)
-fn create_unique_hash(data: &CCUsageData) -> Option<String> {
+///
+/// Hashes the messageId:requestId pair to a 64-bit key instead of keeping
+/// the concatenated string around for every processed entry.
+fn create_unique_hash(data: &CCUsageData) -> Option<u64> {
     let message_id = data.message.id.as_ref()?;
     let request_id = data.request_id.as_ref()?;
-    
-    // Create hash using simple concatenation (ccusage method)
-    Some(format!("{}:{}", message_id, request_id))
+
+    Some(dedup_key(message_id, request_id))
+}
+
+/// Cheap substring check run before JSON parsing.
+///
+/// Only lines lacking a key [`CCUsageData`] requires (`timestamp`,
+/// `message`) are rejected, so every line that would deserialize still
+/// does. Lines without `usage` must be kept: they take part in dedup and
+/// yield zero-token day rows, exactly as in ccusage.
+fn is_candidate_line(line: &[u8]) -> bool {
+    contains_bytes(line, b"\"message\"") && contains_bytes(line, b"\"timestamp\"")
 }
 
 /// Extract project name from file path (ccusage method)
 fn extract_project_from_path(path: &Path) -> String {
     // ccusage extracts project from path structure: .../projects/{project}/{sessionId}.jsonl
-    let parts: Vec<&str> = path.to_str()
-        .unwrap_or("")
-        .split('/')
-        .collect();
-    
-    // Find "projects" index and get next element
-    for (i, part) in parts.iter().enumerate() {
-        if *part == "projects" && i + 1 < parts.len() {
-            return parts[i + 1].to_string();
+    let mut parts = path.to_str().unwrap_or("").split('/');
+
+    // Find the "projects" component and take the one after it, walking the
+    // path lazily instead of collecting its components
+    while let Some(part) = parts.next() {
+        if part == "projects" {
+            if let Some(project) = parts.next() {
+                return project.to_string();
+            }
         }
     }
     
@@ -91,11 +196,17 @@ fn extract_project_from_path(path: &Path) -> String {
 
 /// Format date to YYYY-MM-DD (ccusage uses en-CA locale for this)
 fn format_date(timestamp: &str) -> String {
-    // Parse timestamp and format to YYYY-MM-DD
+    // UTC `Z` timestamps already start with their date; borrow it instead of
+    // running the general parser and formatter
+    if let Some(date) = TimestampParser::utc_date_prefix(timestamp) {
+        return date.to_string();
+    }
+
+    // Parse timestamp and format to YYYY-MM-DD (the Display of NaiveDate)
     if let Ok(dt) = DateTime::parse_from_rfc3339(timestamp) {
-        dt.format("%Y-%m-%d").to_string()
+        dt.date_naive().to_string()
     } else if let Ok(dt) = timestamp.parse::<DateTime<Utc>>() {
-        dt.format("%Y-%m-%d").to_string()
+        dt.date_naive().to_string()
     } else {
         // Fallback: try to extract date if it's already in YYYY-MM-DD format
         if timestamp.len() >= 10 {
@@ -106,12 +217,50 @@ fn format_date(timestamp: &str) -> String {
     }
 }
 
+/// A `YYYY-MM-DD` date packed into the integer YYYYMMDD, for comparing
+/// against `YYYYMMDD` bounds
+///
+/// Anything else (such as the "unknown" label) packs to `u32::MAX`, sorting
+/// after every real date.
+fn packed_date(date: &str) -> u32 {
+    let b = date.as_bytes();
+    if b.len() != 10 || b[4] != b'-' || b[7] != b'-' {
+        return u32::MAX;
+    }
+    b.iter()
+        .filter(|&&c| c != b'-')
+        .try_fold(0u32, |acc, &c| {
+            c.is_ascii_digit().then(|| acc * 10 + u32::from(c - b'0'))
+        })
+        .unwrap_or(u32::MAX)
+}
+
+/// Parse a `YYYYMMDD` date bound into its packed form
+///
+/// The bound must be exactly eight ASCII digits naming a real calendar date.
+fn parse_date_bound(bound: &str) -> Result<u32> {
+    if bound.len() != 8
+        || !bound.bytes().all(|c| c.is_ascii_digit())
+        || NaiveDate::parse_from_str(bound, "%Y%m%d").is_err()
+    {
+        anyhow::bail!("Invalid date bound (expected YYYYMMDD): {}", bound);
+    }
+    bound
+        .parse()
+        .with_context(|| format!("Invalid date bound (expected YYYYMMDD): {}", bound))
+}
+
 /// Load daily usage data with ccusage-compatible algorithm
 pub async fn load_daily_usage_cccompat(
     since: Option<&str>,
     until: Option<&str>,
 ) -> Result<Vec<CCDailyUsage>> {
     info!("Loading daily usage data with ccusage compatibility mode");
+
+    // YYYYMMDD bounds are parsed once, so each entry's date check is an
+    // integer compare
+    let since = since.map(parse_date_bound).transpose()?;
+    let until = until.map(parse_date_bound).transpose()?;
     
     // Get Claude paths (ccusage checks both ~/.claude and ~/.config/claude)
     let claude_paths = vec![
@@ -124,21 +273,17 @@ pub async fn load_daily_usage_cccompat(
     // Collect all JSONL files from projects directories
     for claude_path in &claude_paths {
         let projects_dir = claude_path.join("projects");
-        if !projects_dir.exists() {
-            continue;
-        }
         
-        // Walk through all subdirectories to find JSONL files
+        // Walk through all subdirectories to find JSONL files (a missing
+        // projects directory just fails the listing)
         if let Ok(entries) = fs::read_dir(&projects_dir) {
             for entry in entries.flatten() {
-                let path = entry.path();
-                if path.is_dir() {
+                if is_dir_entry(&entry) {
                     // Look for JSONL files in this project directory
-                    if let Ok(files) = fs::read_dir(&path) {
+                    if let Ok(files) = fs::read_dir(entry.path()) {
                         for file in files.flatten() {
-                            let file_path = file.path();
-                            if file_path.extension().and_then(|s| s.to_str()) == Some("jsonl") {
-                                all_files.push(file_path);
+                            if file.file_name().to_string_lossy().ends_with(".jsonl") {
+                                all_files.push(file.path());
                             }
                         }
                     }
@@ -150,150 +295,418 @@ pub async fn load_daily_usage_cccompat(
     debug!("Found {} JSONL files to process", all_files.len());
     
     // Track processed hashes for deduplication (ccusage behavior)
-    let processed_hashes = DashMap::new();
+    let mut processed_hashes = DedupKeySet::default();
     
-    // Collect all valid entries
-    let mut all_entries = Vec::new();
+    // Aggregate entries by date as they are parsed; no per-entry list is kept
+    let mut daily_data: HashMap<String, DayTotals> = HashMap::new();
+    let mut model_table = ModelTable::default();
+    let default_model = model_table.intern(DEFAULT_MODEL.to_string());
+    let mut valid_entries = 0usize;
     
-    for file_path in &all_files {
-        let content = fs::read_to_string(file_path)
-            .with_context(|| format!("Failed to read file: {}", file_path.display()))?;
-        
-        // Process each line (ccusage filters empty lines but still reads them)
-        let lines: Vec<&str> = content.split('\n').collect();
-        debug!("Processing {} lines from {}", lines.len(), file_path.display());
-        
-        for line in lines {
-            let trimmed = line.trim();
-            
-            // Skip empty lines (ccusage behavior)
-            if trimmed.is_empty() {
-                continue;
-            }
-            
-            // Try to parse as JSON
-            match serde_json::from_str::<CCUsageData>(trimmed) {
-                Ok(data) => {
-                    // Check for duplicate (ccusage deduplication)
-                    if let Some(hash) = create_unique_hash(&data) {
-                        if processed_hashes.contains_key(&hash) {
-                            continue; // Skip duplicate
-                        }
-                        processed_hashes.insert(hash, true);
+    // Parse files in batches (in parallel with the `parallel` feature), then
+    // merge each batch in file order so dedup precedence stays deterministic
+    let config = get_config();
+    let batch_size =
+        config.processing.batch_size.max(1) * config.processing.parallel_chunks.max(1);
+
+    // Unchanged files are read back from the parse cache instead of re-parsed
+    let parse_cache = if config.processing.parse_cache {
+        ParsedFileCache::default_location()
+    } else {
+        None
+    };
+    if let Some(cache) = &parse_cache {
+        cache.prune_if_due(PARSE_CACHE_MAX_AGE);
+    }
+
+    for batch in all_files.chunks(batch_size) {
+        for parsed in parse_usage_files(batch, parse_cache.as_ref()) {
+            for record in parsed? {
+                // Check for duplicate (ccusage deduplication)
+                if let Some(hash) = record.hash {
+                    if !processed_hashes.insert(hash) {
+                        continue; // Skip duplicate
                     }
-                    
-                    // Extract date
-                    let date = format_date(&data.timestamp);
-                    
-                    // Calculate cost (ccusage uses pre-calculated costUSD when available)
-                    let cost = if let Some(cost_usd) = data.cost_usd {
-                        cost_usd
-                    } else {
-                        // Calculate from tokens using pricing
-                        calculate_cost_from_tokens(&data)
-                    };
-                    
-                    all_entries.push((date, data, cost));
                 }
-                Err(_) => {
-                    // Skip malformed JSON (ccusage behavior)
+                valid_entries += 1;
+            
+                let date = record.date;
+
+                // Filter by date range if specified
+                let day = packed_date(&date);
+                if since.is_some_and(|since| day < since)
+                    || until.is_some_and(|until| day > until)
+                {
                     continue;
                 }
+            
+                // Intern the model up front so its rates come from the table
+                // rather than being matched against its name for every entry
+                let model_id = record.model.map(|model| model_table.intern(model));
+            
+                // Only a new day pays for copies of its date key
+                if !daily_data.contains_key(&date) {
+                    daily_data.insert(
+                        date.clone(),
+                        DayTotals {
+                            usage: CCDailyUsage {
+                                date: date.clone(),
+                                input_tokens: 0,
+                                output_tokens: 0,
+                                cache_creation_tokens: 0,
+                                cache_read_tokens: 0,
+                                total_cost: 0.0,
+                                models_used: Vec::new(),
+                            },
+                            models: ModelSet::default(),
+                            unpriced: Vec::new(),
+                        },
+                    );
+                }
+                let day = daily_data.get_mut(&date).expect("day was just inserted");
+                let entry = &mut day.usage;
+                let tokens = record.tokens;
+            
+                // Aggregate tokens
+                entry.input_tokens += tokens[0];
+                entry.output_tokens += tokens[1];
+                entry.cache_creation_tokens += tokens[2];
+                entry.cache_read_tokens += tokens[3];
+            
+                // Add cost (ccusage uses pre-calculated costUSD when available;
+                // otherwise the tokens are priced per model when the day is emitted)
+                match record.cost_usd {
+                    Some(cost_usd) => entry.total_cost += cost_usd,
+                    None => day.add_unpriced(model_id.unwrap_or(default_model), tokens),
+                }
+            
+                // Track models
+                if let Some(id) = model_id {
+                    day.models.insert(id);
+                }
             }
         }
     }
     
-    info!("Processed {} valid entries after deduplication", all_entries.len());
+    info!("Processed {} valid entries after deduplication", valid_entries);
     
-    // Group by date
-    let mut daily_data: HashMap<String, CCDailyUsage> = HashMap::new();
-    let mut daily_models: HashMap<String, HashSet<String>> = HashMap::new();
+    // Set models used for each day and convert to vector, sorted by date
+    let mut results: Vec<CCDailyUsage> = daily_data
+        .into_values()
+        .map(|day| {
+            let unpriced_cost = day.unpriced_cost(&model_table);
+            let mut usage = day.usage;
+            usage.total_cost += unpriced_cost;
+            usage.models_used = day
+                .models
+                .iter()
+                .map(|id| model_table.names[id].clone())
+                .collect();
+            usage.models_used.sort();
+            usage
+        })
+        .collect();
+    results.sort_by(|a, b| b.date.cmp(&a.date)); // Sort descending (ccusage default)
     
-    for (date, data, cost) in all_entries {
-        // Filter by date range if specified
-        if let Some(since) = since {
-            if date.replace("-", "") < since.to_string() {
-                continue;
-            }
+    Ok(results)
+}
+
+/// Version of the parse cache entry format and of the parsing that fills
+/// it; bump whenever either changes so older entries are never read back
+const PARSE_CACHE_VERSION: u32 = 1;
+
+/// How long a parse cache entry is kept after it was last used
+const PARSE_CACHE_MAX_AGE: Duration = Duration::from_secs(30 * 24 * 60 * 60);
+
+/// Minimum time between two prunes of the parse cache directory
+const PARSE_CACHE_PRUNE_INTERVAL: Duration = Duration::from_secs(24 * 60 * 60);
+
+/// Marker file whose modification time records the last prune
+const PARSE_CACHE_PRUNE_MARKER: &str = ".last-prune";
+
+/// On-disk cache of each JSONL file's parsed usage records
+///
+/// Each file has a single entry, named by a hash of its path. The entry's
+/// first line is a key hashed from the cache version and the file's
+/// modification time and size; the parsed records follow. A session file
+/// that has been appended to misses the cache and its entry is replaced,
+/// while unchanged history is read back in one deserialize.
+struct ParsedFileCache {
+    dir: PathBuf,
+}
+
+impl ParsedFileCache {
+    fn new(dir: PathBuf) -> Self {
+        Self { dir }
+    }
+
+    /// `~/.cache/claude-usage/ccusage` (or the platform equivalent)
+    fn default_location() -> Option<Self> {
+        dirs::cache_dir().map(|dir| Self::new(dir.join("claude-usage").join("ccusage")))
+    }
+
+    /// Path of the cache entry for a file
+    fn entry_path(&self, file_path: &Path) -> PathBuf {
+        let name = xxh3_128(file_path.as_os_str().to_string_lossy().as_bytes());
+        self.dir.join(format!("{:032x}.entry", name))
+    }
+
+    /// Key identifying a file in its current state
+    fn entry_key(file_path: &Path, metadata: &fs::Metadata) -> Option<String> {
+        let modified = metadata.modified().ok()?.duration_since(UNIX_EPOCH).ok()?;
+        let key = format!(
+            "{}|{}|{}|{}",
+            PARSE_CACHE_VERSION,
+            file_path.display(),
+            modified.as_nanos(),
+            metadata.len()
+        );
+        Some(format!("{:032x}", xxh3_128(key.as_bytes())))
+    }
+
+    /// Records of an entry whose key matches, touching the entry on a hit
+    fn load(&self, entry_path: &Path, key: &str) -> Option<Vec<CCUsageData>> {
+        let data = fs::read(entry_path).ok()?;
+        let records = data
+            .strip_prefix(key.as_bytes())
+            .and_then(|rest| rest.strip_prefix(b"\n"))?;
+        let records = serde_json::from_slice(records).ok()?;
+        Self::touch_if_stale(entry_path);
+        Some(records)
+    }
+
+    /// Bump the modification time of an entry that was just used, so pruning
+    /// spares entries still being read
+    ///
+    /// Entries already touched within the last prune interval are left
+    /// alone, keeping a warm run free of writes to the cache.
+    fn touch_if_stale(entry_path: &Path) {
+        let stale = fs::metadata(entry_path)
+            .and_then(|metadata| metadata.modified())
+            .ok()
+            .and_then(|modified| modified.elapsed().ok())
+            .is_some_and(|age| age >= PARSE_CACHE_PRUNE_INTERVAL);
+        if !stale {
+            return;
+        }
+
+        let touched = fs::OpenOptions::new()
+            .write(true)
+            .open(entry_path)
+            .and_then(|entry| entry.set_modified(SystemTime::now()));
+        if let Err(e) = touched {
+            debug!(error = %e, "Failed to touch parse cache entry");
+        }
+    }
+
+    fn store(&self, entry_path: &Path, key: &str, records: &[CCUsageData]) -> Result<()> {
+        fs::create_dir_all(&self.dir)
+            .with_context(|| format!("Failed to create cache directory: {}", self.dir.display()))?;
+
+        // Write to a temp file and rename over the file's previous entry, so
+        // readers never see a partial file and superseded entries do not
+        // accumulate. The temp name carries the process id so concurrent runs
+        // never write the same temp file. Records are serialized straight
+        // into the buffered file rather than into an intermediate byte
+        // vector first
+        let tmp_path = entry_path.with_extension(format!("entry.{}.tmp", std::process::id()));
+        fs::File::create(&tmp_path)
+            .map(BufWriter::new)
+            .and_then(|mut out| {
+                out.write_all(key.as_bytes())?;
+                out.write_all(b"\n")?;
+                serde_json::to_writer(&mut out, records)?;
+                out.flush()
+            })
+            .with_context(|| format!("Failed to write {}", tmp_path.display()))?;
+        fs::rename(&tmp_path, entry_path)
+            .with_context(|| format!("Failed to replace {}", entry_path.display()))?;
+
+        Ok(())
+    }
+
+    /// Prune entries unused for `max_age`, at most once per
+    /// [`PARSE_CACHE_PRUNE_INTERVAL`]
+    fn prune_if_due(&self, max_age: Duration) {
+        let marker = self.dir.join(PARSE_CACHE_PRUNE_MARKER);
+        let recently_pruned = fs::metadata(&marker)
+            .and_then(|metadata| metadata.modified())
+            .ok()
+            .and_then(|modified| modified.elapsed().ok())
+            .is_some_and(|age| age < PARSE_CACHE_PRUNE_INTERVAL);
+        if recently_pruned {
+            return;
+        }
+
+        self.prune(max_age);
+        if let Err(e) = fs::create_dir_all(&self.dir).and_then(|_| fs::write(&marker, b"")) {
+            debug!(error = %e, "Failed to record parse cache prune");
         }
-        if let Some(until) = until {
-            if date.replace("-", "") > until.to_string() {
-                continue;
+    }
+
+    /// Remove entries last used at least `max_age` ago, along with temp
+    /// files left behind by interrupted writes
+    fn prune(&self, max_age: Duration) {
+        let Ok(entries) = fs::read_dir(&self.dir) else {
+            return;
+        };
+        for entry in entries.flatten() {
+            let expired = entry
+                .metadata()
+                .and_then(|metadata| metadata.modified())
+                .ok()
+                .and_then(|modified| modified.elapsed().ok())
+                .is_some_and(|age| age >= max_age);
+            if expired {
+                let _ = fs::remove_file(entry.path());
             }
         }
+    }
+}
+
+/// Usage records of one JSONL file, from the parse cache when the file is
+/// unchanged since it was cached
+fn load_usage_file(file_path: &Path, cache: Option<&ParsedFileCache>) -> Result<Vec<CCUsageData>> {
+    let Some(cache) = cache else {
+        return parse_usage_file(file_path);
+    };
+    let Some(key) = fs::metadata(file_path)
+        .ok()
+        .and_then(|metadata| ParsedFileCache::entry_key(file_path, &metadata))
+    else {
+        return parse_usage_file(file_path);
+    };
+
+    let entry_path = cache.entry_path(file_path);
+    if let Some(records) = cache.load(&entry_path, &key) {
+        return Ok(records);
+    }
+
+    let records = parse_usage_file(file_path)?;
+    if let Err(e) = cache.store(&entry_path, &key, &records) {
+        debug!(error = %e, "Failed to cache parsed usage records");
+    }
+    Ok(records)
+}
+
+/// Parse every usage record from one JSONL file, in line order
+fn parse_usage_file(file_path: &Path) -> Result<Vec<CCUsageData>> {
+    // Read raw bytes and split on newlines in place: no UTF-8 pass over the
+    // whole file and no per-line allocation before serde sees the slice
+    let content = fs::read(file_path)
+        .with_context(|| format!("Failed to read file: {}", file_path.display()))?;
+    debug!("Processing {} bytes from {}", content.len(), file_path.display());
+    
+    let mut records = Vec::new();
+    for line in split_lines(&content) {
+        let trimmed = trim_ascii(line);
         
-        let entry = daily_data.entry(date.clone()).or_insert_with(|| CCDailyUsage {
-            date: date.clone(),
-            input_tokens: 0,
-            output_tokens: 0,
-            cache_creation_tokens: 0,
-            cache_read_tokens: 0,
-            total_cost: 0.0,
-            models_used: Vec::new(),
-        });
-        
-        // Aggregate tokens
-        if let Some(usage) = &data.message.usage {
-            entry.input_tokens += usage.input_tokens.unwrap_or(0);
-            entry.output_tokens += usage.output_tokens.unwrap_or(0);
-            entry.cache_creation_tokens += usage.cache_creation_input_tokens.unwrap_or(0);
-            entry.cache_read_tokens += usage.cache_read_input_tokens.unwrap_or(0);
+        // Skip empty lines (ccusage behavior)
+        if trimmed.is_empty() {
+            continue;
+        }
+
+        if !is_candidate_line(trimmed) {
+            continue;
         }
         
-        // Add cost
-        entry.total_cost += cost;
-        
-        // Track models
-        if let Some(model) = &data.message.model {
-            daily_models.entry(date).or_insert_with(HashSet::new).insert(model.clone());
+        // Skip malformed JSON (ccusage behavior)
+        if let Ok(data) = serde_json::from_slice::<CCUsageData>(trimmed) {
+            records.push(data);
         }
     }
     
-    // Set models used for each day
-    for (date, models) in daily_models {
-        if let Some(entry) = daily_data.get_mut(&date) {
-            entry.models_used = models.into_iter().collect();
-            entry.models_used.sort();
+    Ok(records)
+}
+
+/// A usage record reduced to what the daily aggregation reads.
+///
+/// Built on the parsing worker, so the dedup hash, the date key and the
+/// token counts are derived in parallel and the ordered merge only has to
+/// dedup and sum.
+struct PreparedRecord {
+    hash: Option<u64>,
+    date: String,
+    model: Option<String>,
+    tokens: [u64; 4],
+    cost_usd: Option<f64>,
+}
+
+impl PreparedRecord {
+    fn new(data: CCUsageData) -> Self {
+        Self {
+            hash: create_unique_hash(&data),
+            date: format_date(&data.timestamp),
+            tokens: usage_tokens(&data),
+            cost_usd: data.cost_usd,
+            model: data.message.model,
         }
     }
-    
-    // Convert to vector and sort by date
-    let mut results: Vec<CCDailyUsage> = daily_data.into_values().collect();
-    results.sort_by(|a, b| b.date.cmp(&a.date)); // Sort descending (ccusage default)
-    
-    Ok(results)
 }
 
-/// Calculate cost from tokens (simplified version matching ccusage pricing)
-fn calculate_cost_from_tokens(data: &CCUsageData) -> f64 {
-    let usage = match &data.message.usage {
-        Some(u) => u,
-        None => return 0.0,
-    };
-    
-    let model = data.message.model.as_deref().unwrap_or("claude-3-5-sonnet");
-    
-    // Simplified pricing matching ccusage's litellm integration
-    // These are the prices that cause the discrepancy
-    let (input_price, output_price, cache_create_price, cache_read_price) = 
-        if model.contains("opus") {
-            (0.015, 0.075, 0.01875, 0.001875) // Per 1K tokens
-        } else if model.contains("sonnet") {
-            (0.003, 0.015, 0.00375, 0.0003) // Per 1K tokens
-        } else {
-            (0.003, 0.015, 0.00375, 0.0003) // Default to sonnet pricing
-        };
-    
-    let input_tokens = usage.input_tokens.unwrap_or(0) as f64;
-    let output_tokens = usage.output_tokens.unwrap_or(0) as f64;
-    let cache_creation = usage.cache_creation_input_tokens.unwrap_or(0) as f64;
-    let cache_read = usage.cache_read_input_tokens.unwrap_or(0) as f64;
+/// Load one file's records and prepare them for aggregation
+fn prepare_usage_file(
+    file_path: &Path,
+    cache: Option<&ParsedFileCache>,
+) -> Result<Vec<PreparedRecord>> {
+    let records = load_usage_file(file_path, cache)?;
+    Ok(records.into_iter().map(PreparedRecord::new).collect())
+}
+
+/// Parse a batch of files, one task per file, preserving input order
+#[cfg(feature = "parallel")]
+fn parse_usage_files(
+    files: &[PathBuf],
+    cache: Option<&ParsedFileCache>,
+) -> Vec<Result<Vec<PreparedRecord>>> {
+    use rayon::prelude::*;
     
-    // Calculate cost (price per 1K tokens)
-    (input_tokens * input_price / 1000.0) +
-    (output_tokens * output_price / 1000.0) +
-    (cache_creation * cache_create_price / 1000.0) +
-    (cache_read * cache_read_price / 1000.0)
+    files.par_iter().map(|path| prepare_usage_file(path, cache)).collect()
+}
+
+/// Parse a batch of files sequentially, preserving input order
+#[cfg(not(feature = "parallel"))]
+fn parse_usage_files(
+    files: &[PathBuf],
+    cache: Option<&ParsedFileCache>,
+) -> Vec<Result<Vec<PreparedRecord>>> {
+    files.iter().map(|path| prepare_usage_file(path, cache)).collect()
+}
+
+/// Model assumed for entries that do not name one
+const DEFAULT_MODEL: &str = "claude-3-5-sonnet";
+
+/// Simplified pricing matching ccusage's litellm integration: Opus rates for
+/// Opus models, Sonnet rates for everything else
+fn ccusage_rates(model: &str) -> &'static [f64; 4] {
+    if model.contains("opus") {
+        &OPUS_RATES
+    } else {
+        &SONNET_RATES
+    }
+}
+
+/// An entry's input, output, cache creation and cache read token counts
+fn usage_tokens(data: &CCUsageData) -> [u64; 4] {
+    match &data.message.usage {
+        Some(usage) => [
+            usage.input_tokens.unwrap_or(0).into(),
+            usage.output_tokens.unwrap_or(0).into(),
+            usage.cache_creation_input_tokens.unwrap_or(0).into(),
+            usage.cache_read_input_tokens.unwrap_or(0).into(),
+        ],
+        None => [0; 4],
+    }
+}
+
+/// Cost of summed token counts at the given per-token rates (simplified
+/// version matching ccusage pricing)
+fn cost_of_tokens(tokens: &[u64; 4], rates: &[f64; 4]) -> f64 {
+    tokens
+        .iter()
+        .zip(rates.iter())
+        .map(|(&t, &r)| t as f64 * r)
+        .sum()
 }
 
 /// Get total cost for a date range using ccusage-compatible algorithm
@@ -314,7 +727,85 @@ pub async fn get_ccusage_compatible_cost(
 #[cfg(test)]
 mod tests {
     use super::*;
-    
+
+    #[test]
+    fn test_parse_cache_reuses_unchanged_files() {
+        let dir = tempfile::tempdir().unwrap();
+        let cache_dir = dir.path().join("cache");
+        let cache = ParsedFileCache::new(cache_dir.clone());
+        let file = dir.path().join("session.jsonl");
+        let line = r#"{"timestamp":"2025-08-20T10:00:00Z","message":{"id":"m1","model":"claude-sonnet-4","usage":{"input_tokens":10,"output_tokens":5}},"requestId":"r1"}"#;
+        fs::write(&file, format!("{}\n", line)).unwrap();
+
+        let records = load_usage_file(&file, Some(&cache)).unwrap();
+        assert_eq!(records.len(), 1);
+        let entry_path = cache.entry_path(&file);
+        assert!(entry_path.exists());
+
+        // A hit is served from the entry, not the file
+        let key = ParsedFileCache::entry_key(&file, &fs::metadata(&file).unwrap()).unwrap();
+        cache.store(&entry_path, &key, &[]).unwrap();
+        assert!(load_usage_file(&file, Some(&cache)).unwrap().is_empty());
+
+        // Appending changes the key, so the file is parsed again and its
+        // entry replaced rather than joined by a second one
+        fs::write(&file, format!("{}\n{}\n", line, line.replace("m1", "m2"))).unwrap();
+        assert_eq!(load_usage_file(&file, Some(&cache)).unwrap().len(), 2);
+        assert_eq!(fs::read_dir(&cache_dir).unwrap().count(), 1);
+        assert!(cache.load(&entry_path, &key).is_none());
+        assert_eq!(load_usage_file(&file, Some(&cache)).unwrap().len(), 2);
+    }
+
+    #[test]
+    fn test_parse_cache_touches_only_stale_entries() {
+        let dir = tempfile::tempdir().unwrap();
+        let cache = ParsedFileCache::new(dir.path().join("cache"));
+        let file = dir.path().join("session.jsonl");
+        fs::write(&file, "").unwrap();
+        load_usage_file(&file, Some(&cache)).unwrap();
+
+        let entry_path = cache.entry_path(&file);
+        let modified = || fs::metadata(&entry_path).unwrap().modified().unwrap();
+        let set_age = |age: Duration| {
+            fs::OpenOptions::new()
+                .write(true)
+                .open(&entry_path)
+                .unwrap()
+                .set_modified(SystemTime::now() - age)
+                .unwrap();
+        };
+
+        // A recently used entry is read without being written
+        set_age(Duration::from_secs(60 * 60));
+        let before = modified();
+        load_usage_file(&file, Some(&cache)).unwrap();
+        assert_eq!(modified(), before);
+
+        // An entry idle for a prune interval is touched on a hit
+        set_age(PARSE_CACHE_PRUNE_INTERVAL * 2);
+        load_usage_file(&file, Some(&cache)).unwrap();
+        assert!(modified().elapsed().unwrap() < PARSE_CACHE_PRUNE_INTERVAL);
+    }
+
+    #[test]
+    fn test_parse_cache_prunes_at_most_once_per_interval() {
+        let dir = tempfile::tempdir().unwrap();
+        let cache_dir = dir.path().join("cache");
+        let cache = ParsedFileCache::new(cache_dir.clone());
+        let file = dir.path().join("session.jsonl");
+        fs::write(&file, "").unwrap();
+
+        load_usage_file(&file, Some(&cache)).unwrap();
+        cache.prune_if_due(Duration::ZERO);
+        assert!(!cache.entry_path(&file).exists());
+        assert!(cache_dir.join(PARSE_CACHE_PRUNE_MARKER).exists());
+
+        // Within the interval the marker holds off the next prune
+        load_usage_file(&file, Some(&cache)).unwrap();
+        cache.prune_if_due(Duration::ZERO);
+        assert!(cache.entry_path(&file).exists());
+    }
+
     #[test]
     fn test_unique_hash_creation() {
         let data = CCUsageData {
@@ -326,18 +817,134 @@ mod tests {
             },
             cost_usd: Some(0.5),
             request_id: Some("req_456".to_string()),
-            session_id: None,
         };
         
         let hash = create_unique_hash(&data);
-        assert_eq!(hash, Some("msg_123:req_456".to_string()));
+        assert_eq!(hash, Some(dedup_key("msg_123", "req_456")));
     }
     
+    #[test]
+    fn test_packed_date_bounds() {
+        let bound = parse_date_bound("20250820").unwrap();
+        assert!(packed_date("2025-08-19") < bound);
+        assert!(packed_date("2025-08-20") >= bound);
+        assert!(packed_date("2025-08-21") > bound);
+        assert!(packed_date("2025-08-20") <= bound);
+        assert!(packed_date("unknown") > bound);
+        assert!(packed_date("2025-08-2x") > bound);
+        assert!(parse_date_bound("2025-08-20").is_err());
+        assert!(parse_date_bound("+2025082").is_err());
+        assert!(parse_date_bound("2025082").is_err());
+        assert!(parse_date_bound("202508200").is_err());
+        assert!(parse_date_bound("20251301").is_err());
+        assert!(parse_date_bound("20250230").is_err());
+        assert_eq!(parse_date_bound("20240229").unwrap(), 20240229);
+    }
+
+    #[test]
+    fn test_unpriced_tokens_priced_per_model() {
+        let mut models = ModelTable::default();
+        let sonnet = models.intern("claude-3-5-sonnet".to_string());
+        let opus = models.intern("claude-3-opus".to_string());
+
+        let mut day = DayTotals {
+            usage: CCDailyUsage {
+                date: "2025-08-20".to_string(),
+                input_tokens: 0,
+                output_tokens: 0,
+                cache_creation_tokens: 0,
+                cache_read_tokens: 0,
+                total_cost: 0.0,
+                models_used: Vec::new(),
+            },
+            models: ModelSet::default(),
+            unpriced: Vec::new(),
+        };
+        day.add_unpriced(opus, [1000, 2000, 0, 0]);
+        day.add_unpriced(opus, [1000, 0, 500, 1500]);
+        day.add_unpriced(sonnet, [1000, 1000, 0, 0]);
+
+        assert_eq!(day.unpriced[opus], [2000, 2000, 500, 1500]);
+        let expected = cost_of_tokens(&[2000, 2000, 500, 1500], &OPUS_RATES)
+            + cost_of_tokens(&[1000, 1000, 0, 0], &SONNET_RATES);
+        assert!((day.unpriced_cost(&models) - expected).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_model_set() {
+        let mut models = ModelSet::default();
+        assert_eq!(models.iter().count(), 0);
+        for id in [3, 0, 3, 70] {
+            models.insert(id);
+        }
+        assert_eq!(models.iter().collect::<Vec<_>>(), vec![0, 3, 70]);
+    }
+
+    #[test]
+    fn test_candidate_line_prefilter() {
+        assert!(!is_candidate_line(br#"{"type":"summary","summary":"Chat","leafUuid":"x"}"#));
+        assert!(!is_candidate_line(br#"{"type":"user","timestamp":"2025-08-20T10:30:00Z"}"#));
+        assert!(!is_candidate_line(br#"{"message":{"usage":{"input_tokens":1}}}"#));
+        assert!(is_candidate_line(
+            br#"{"type":"user","timestamp":"2025-08-20T10:30:00Z","message":{"role":"user"}}"#
+        ));
+        assert!(is_candidate_line(
+            br#"{"timestamp":"2025-08-20T10:30:00Z","message":{"usage":{"input_tokens":1}}}"#
+        ));
+
+        // A summary record carrying both keys passes the prefilter but
+        // never parses
+        let summary = br#"{"type":"summary","timestamp":"x","message":null}"#;
+        assert!(is_candidate_line(summary));
+        assert!(serde_json::from_slice::<CCUsageData>(summary).is_err());
+    }
+
+    #[test]
+    fn test_prefilter_keeps_parse_parity() {
+        // Duplicates where the first copy has no usage, user turns, a
+        // usage-less day and records no prefilter-free parse accepts either
+        let content = concat!(
+            r#"{"type":"summary","summary":"Chat","leafUuid":"x"}"#, "\n",
+            r#"{"timestamp":"2025-08-19T09:00:00Z","message":{"role":"user","content":"hi"}}"#, "\n",
+            r#"{"timestamp":"2025-08-20T10:00:00Z","message":{"id":"m1","model":"claude-3-opus"},"requestId":"r1"}"#, "\n",
+            r#"{"timestamp":"2025-08-20T10:00:01Z","message":{"id":"m1","model":"claude-3-opus","usage":{"input_tokens":5}},"requestId":"r1"}"#, "\n",
+            "\n",
+            r#"{"message":{"id":"m2","usage":{"input_tokens":7}},"requestId":"r2"}"#, "\n",
+            r#"{broken"#, "\n",
+        );
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("session.jsonl");
+        std::fs::write(&path, content).unwrap();
+
+        let filtered = parse_usage_file(&path).unwrap();
+        let unfiltered: Vec<CCUsageData> = split_lines(content.as_bytes())
+            .filter_map(|line| serde_json::from_slice(trim_ascii(line)).ok())
+            .collect();
+
+        assert_eq!(filtered.len(), 3);
+        assert_eq!(
+            serde_json::to_value(&filtered).unwrap(),
+            serde_json::to_value(&unfiltered).unwrap()
+        );
+    }
+
+    #[test]
+    fn test_extract_project_from_path() {
+        assert_eq!(
+            extract_project_from_path(Path::new("/home/u/.claude/projects/-home-u-app/abc.jsonl")),
+            "-home-u-app"
+        );
+        assert_eq!(extract_project_from_path(Path::new("/home/u/projects")), "unknown");
+        assert_eq!(extract_project_from_path(Path::new("/tmp/abc.jsonl")), "unknown");
+    }
+
     #[test]
     fn test_date_formatting() {
         assert_eq!(format_date("2025-08-20T10:30:00Z"), "2025-08-20");
         assert_eq!(format_date("2025-08-20T10:30:00.123Z"), "2025-08-20");
         assert_eq!(format_date("2025-08-20"), "2025-08-20");
+        // Offset timestamps keep the date of their own offset
+        assert_eq!(format_date("2025-08-21T01:30:00+02:00"), "2025-08-21");
     }
     
     #[test]
@@ -356,10 +963,10 @@ mod tests {
             },
             cost_usd: None,
             request_id: Some("req_456".to_string()),
-            session_id: None,
         };
         
-        let cost = calculate_cost_from_tokens(&data);
+        let rates = ccusage_rates(data.message.model.as_deref().unwrap());
+        let cost = cost_of_tokens(&usage_tokens(&data), rates);
         // Opus pricing: input=0.015, output=0.075, cache_create=0.01875, cache_read=0.001875
         // (1000 * 0.015 + 2000 * 0.075 + 500 * 0.01875 + 1500 * 0.001875) / 1000
         // = (15 + 150 + 9.375 + 2.8125) / 1000 = 0.1771875
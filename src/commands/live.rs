@@ -12,18 +12,21 @@ use crate::live::LiveUpdate;
 
 /// Run live mode with optional baseline
 pub async fn run_live_mode(no_baseline: bool) -> Result<()> {
-    // Welcome message for users
-    println!("🚀 Starting Claude Usage Live Monitor");
-    println!();
-    
+    // Welcome message for users, printed as one string so it reaches the
+    // line-buffered stdout in a single write
     if no_baseline {
-        println!("⚠️  Running without baseline data (--no-baseline specified)");
-        println!("💡 This means you'll only see new usage from this point forward");
+        println!(
+            "🚀 Starting Claude Usage Live Monitor\n\n\
+             ⚠️  Running without baseline data (--no-baseline specified)\n\
+             💡 This means you'll only see new usage from this point forward\n"
+        );
     } else {
-        println!("📊 Preparing live monitoring with baseline data...");
-        println!("🔄 This may take a moment while we load your conversation history");
+        println!(
+            "🚀 Starting Claude Usage Live Monitor\n\n\
+             📊 Preparing live monitoring with baseline data...\n\
+             🔄 This may take a moment while we load your conversation history\n"
+        );
     }
-    println!();
 
     info!(no_baseline, "Starting live mode");
 
@@ -44,9 +47,10 @@ pub async fn run_live_mode(no_baseline: bool) -> Result<()> {
     });
 
     // Success message before starting display
-    println!("✅ Live monitoring ready! Starting real-time dashboard...");
-    println!("💡 Use Ctrl+C to exit");
-    println!();
+    println!(
+        "✅ Live monitoring ready! Starting real-time dashboard...\n\
+         💡 Use Ctrl+C to exit\n"
+    );
 
     // Run the display with baseline and receiver
     crate::display::run_display(baseline, rx).await?;
@@ -53,10 +53,20 @@ pub struct LoggingConfig {
 pub struct ProcessingConfig {
     pub batch_size: usize,
     pub parallel_chunks: usize,
+    /// Threads used to parse files with the `parallel` feature (0 = one per CPU)
+    #[serde(default)]
+    pub workers: usize,
+    /// Reuse parsed records of unchanged files from the on-disk parse cache
+    #[serde(default = "default_parse_cache")]
+    pub parse_cache: bool,
     pub max_retries: usize,
     pub progress_interval_mb: usize,
 }
 
+fn default_parse_cache() -> bool {
+    true
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct MemoryConfig {
     pub max_memory_mb: usize,
@@ -64,6 +74,12 @@ pub struct MemoryConfig {
     pub warning_threshold_pct: usize,
 }
 
+/// Deduplication settings
+///
+/// The parquet and ccusage-compat loaders keep every messageId:requestId key
+/// (as a 64-bit hash) for the whole run, matching ccusage, so there is no
+/// periodic timestamp sweep; `window_hours` and `cleanup_threshold` are
+/// accepted and validated but do not currently bound the seen-sets.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DedupConfig {
     pub window_hours: i64,
@@ -104,6 +120,8 @@ impl Default for Config {
             processing: ProcessingConfig {
                 batch_size: 10,
                 parallel_chunks: 4,
+                workers: 0,
+                parse_cache: true,
                 max_retries: 3,
                 progress_interval_mb: 10,
             },
@@ -244,6 +262,12 @@ impl Config {
                 .parse()
                 .context("Invalid CLAUDE_USAGE_PARALLEL_CHUNKS")?;
         }
+        if let Ok(val) = env::var("CLAUDE_USAGE_WORKERS") {
+            self.processing.workers = val.parse().context("Invalid CLAUDE_USAGE_WORKERS")?;
+        }
+        if let Ok(val) = env::var("CLAUDE_USAGE_PARSE_CACHE") {
+            self.processing.parse_cache = val.parse().context("Invalid CLAUDE_USAGE_PARSE_CACHE")?;
+        }
 
         // Memory overrides
         if let Ok(val) = env::var("CLAUDE_USAGE_MAX_MEMORY_MB") {
@@ -1,9 +1,13 @@
 //! Processing Options
 //!
 //! This module contains the ProcessOptions struct used to configure
-//! analysis operations.
+//! analysis operations, plus the messageId:requestId keys used to drop
+//! duplicate usage entries.
 
 use chrono::{DateTime, Utc};
+use std::collections::HashSet;
+use std::hash::{BuildHasherDefault, Hasher};
+use xxhash_rust::xxh3::Xxh3;
 
 #[derive(Debug, Clone)]
 pub struct ProcessOptions {
@@ -17,4 +21,66 @@ pub struct ProcessOptions {
     pub command: String,
     #[allow(dead_code)]
     pub exclude_vms: bool,
-}
\ No newline at end of file
+}
+
+/// Set of [`dedup_key`] values.
+///
+/// The keys are already xxh3 hashes, so the set uses them as-is instead of
+/// running each one through SipHash again on every insert.
+pub type DedupKeySet = HashSet<u64, BuildHasherDefault<DedupKeyHasher>>;
+
+/// Pass-through hasher for keys that are already well-mixed 64-bit hashes
+#[derive(Default)]
+pub struct DedupKeyHasher(u64);
+
+impl Hasher for DedupKeyHasher {
+    fn finish(&self) -> u64 {
+        self.0
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        // Only u64 keys are expected; fold anything else in so it still works
+        for &byte in bytes {
+            self.0 = self.0.rotate_left(8) ^ u64::from(byte);
+        }
+    }
+
+    fn write_u64(&mut self, n: u64) {
+        self.0 = n;
+    }
+}
+
+/// 64-bit deduplication key for a messageId:requestId pair
+///
+/// Equivalent to hashing the `SessionUtils::create_unique_hash` string,
+/// but without building it; seen-sets can then hold plain integers instead
+/// of ~70-byte strings per entry.
+pub fn dedup_key(message_id: &str, request_id: &str) -> u64 {
+    let mut hasher = Xxh3::new();
+    hasher.update(message_id.as_bytes());
+    hasher.update(b":");
+    hasher.update(request_id.as_bytes());
+    hasher.digest()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_dedup_key_matches_joined_string() {
+        let key = dedup_key("msg123", "req456");
+        assert_eq!(key, xxhash_rust::xxh3::xxh3_64(b"msg123:req456"));
+        assert_eq!(key, dedup_key("msg123", "req456"));
+        assert_ne!(key, dedup_key("msg12", "3req456"));
+    }
+
+    #[test]
+    fn test_dedup_key_set() {
+        let mut seen = DedupKeySet::default();
+        assert!(seen.insert(dedup_key("msg123", "req456")));
+        assert!(seen.insert(dedup_key("msg123", "req789")));
+        assert!(!seen.insert(dedup_key("msg123", "req456")));
+        assert_eq!(seen.len(), 2);
+    }
+}
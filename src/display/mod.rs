@@ -66,6 +66,8 @@ pub use tui::*;
 pub use state::*;
 
 use crate::live::{BaselineSummary, LiveUpdate};
+#[cfg(feature = "live")]
+use crate::models::UsageData;
 use anyhow::Result;
 use tokio::sync::mpsc;
 #[cfg(feature = "live")]
@@ -132,8 +134,7 @@ impl RunningTotals {
         }
 
         if let Some(ref usage) = update.entry.message.usage {
-            self.total_tokens += (usage.input_tokens + usage.output_tokens +
-                usage.cache_creation_input_tokens + usage.cache_read_input_tokens) as u64;
+            self.total_tokens += usage.total() as u64;
         }
     }
 }
@@ -154,27 +155,22 @@ pub struct SessionActivity {
     pub cost: f64,
     /// Session ID this activity belongs to
     pub session_id: String,
+    /// Token count as rendered in the activity list (e.g., "+1500 tokens ")
+    pub tokens_label: String,
+    /// Cost as rendered in the activity list (e.g., "($0.015)")
+    pub cost_label: String,
 }
 
 #[cfg(feature = "live")]
 impl SessionActivity {
     /// Create new session activity from a live update
     pub fn from_update(update: &LiveUpdate) -> Self {
-        let tokens = if let Some(ref usage) = update.entry.message.usage {
-            usage.input_tokens + usage.output_tokens +
-                usage.cache_creation_input_tokens + usage.cache_read_input_tokens
-        } else {
-            0
-        };
+        let tokens = update.entry.message.usage.as_ref().map_or(0, UsageData::total);
 
         let cost = update.entry.cost_usd.unwrap_or(0.0);
 
         // Extract project name from path (take last component)
-        let project = update.session_stats.project_path
-            .split('/')
-            .next_back()
-            .unwrap_or(&update.session_stats.project_path)
-            .to_string();
+        let project = update.session_stats.project_name().to_string();
 
         // Format timestamp as HH:MM:SS
         let time_str = {
@@ -188,6 +184,8 @@ impl SessionActivity {
             format!("{:02}:{:02}:{:02}", hours, minutes, seconds)
         };
 
+        // Activities are immutable once logged, so their labels are formatted
+        // here once instead of on every render tick
         Self {
             timestamp: update.timestamp,
             time_str,
@@ -195,6 +193,8 @@ impl SessionActivity {
             tokens,
             cost,
             session_id: update.session_stats.session_id.clone(),
+            tokens_label: format!("+{} tokens ", tokens),
+            cost_label: format!("(${:.3})", cost),
         }
     }
 }
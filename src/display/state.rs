@@ -37,6 +37,10 @@ pub struct LiveDisplay {
     session_start_times: HashMap<String, SystemTime>,
     /// Last update timestamp for calculating session duration
     last_update_time: SystemTime,
+    /// Header totals line, rebuilt only when an update arrives
+    totals_text: String,
+    /// Current session line, rebuilt only when an update arrives
+    session_text: Option<String>,
 }
 
 #[cfg(feature = "live")]
@@ -45,7 +49,7 @@ impl LiveDisplay {
     pub fn new(baseline: BaselineSummary) -> Self {
         let running_totals = RunningTotals::from_baseline(&baseline);
         
-        Self {
+        let mut display = Self {
             baseline,
             recent_entries: VecDeque::with_capacity(MAX_RECENT_ENTRIES),
             current_session: None,
@@ -53,7 +57,11 @@ impl LiveDisplay {
             scroll_position: 0,
             session_start_times: HashMap::new(),
             last_update_time: SystemTime::now(),
-        }
+            totals_text: String::new(),
+            session_text: None,
+        };
+        display.refresh_text();
+        display
     }
 
     /// Update display state with a new live update
@@ -63,18 +71,38 @@ impl LiveDisplay {
         // Update running totals
         self.running_totals.update(&update);
 
-        // Track session start time
-        let session_id = update.session_stats.session_id.clone();
-        self.session_start_times
-            .entry(session_id.clone())
-            .or_insert(update.timestamp);
-
-        // Update current session
-        self.current_session = Some(update.session_stats.clone());
+        // Track session start time, allocating the key only for new sessions
+        if !self.session_start_times.contains_key(&update.session_stats.session_id) {
+            self.session_start_times
+                .insert(update.session_stats.session_id.clone(), update.timestamp);
+        }
 
         // Add to recent activities
         let activity = SessionActivity::from_update(&update);
         self.add_recent_activity(activity);
+
+        // Update current session, taking ownership instead of deep-cloning the
+        // session's per-day maps on every update
+        self.current_session = Some(update.session_stats);
+
+        self.refresh_text();
+    }
+
+    /// Rebuild the header and session lines. They only depend on state that
+    /// changes in `update`, so render ticks reuse them instead of formatting
+    fn refresh_text(&mut self) {
+        self.totals_text = self.format_totals();
+        self.session_text = self.format_current_session();
+    }
+
+    /// Header totals line as of the last update
+    pub fn totals_text(&self) -> &str {
+        &self.totals_text
+    }
+
+    /// Current session line as of the last update
+    pub fn session_text(&self) -> Option<&str> {
+        self.session_text.as_deref()
     }
 
     /// Add a new activity to the ring buffer
@@ -136,14 +164,9 @@ impl LiveDisplay {
                 .map(|d| format!("{}m {}s", d.as_secs() / 60, d.as_secs() % 60))
                 .unwrap_or_else(|| "0s".to_string());
 
-            let project_name = session.project_path
-                .split('/')
-                .next_back()
-                .unwrap_or(&session.project_path);
-
             Some(format!(
                 "Project: {} | Duration: {} | Cost: ${:.2} | Tokens: In {}K / Out {}K",
-                project_name,
+                session.project_name(),
                 duration,
                 session.total_cost,
                 session.input_tokens / 1000,
@@ -187,6 +210,9 @@ impl LiveDisplay {
         self.session_start_times.retain(|_, &mut start_time| {
             start_time > cutoff_time
         });
+
+        // The session line's duration depends on the start times kept here
+        self.refresh_text();
     }
 }
 
@@ -284,5 +310,23 @@ mod tests {
         
         assert_eq!(display.running_totals.total_cost, 10.5);
         assert_eq!(display.running_totals.total_tokens, 6000);
+        assert_eq!(display.totals_text(), display.format_totals());
+        assert_eq!(display.session_text(), display.format_current_session().as_deref());
+    }
+
+    #[test]
+    fn test_session_start_time_kept_across_updates() {
+        let mut display = LiveDisplay::new(BaselineSummary::default());
+
+        let mut first = create_test_update("session1", "project", 100, 0.01);
+        first.timestamp = SystemTime::UNIX_EPOCH + Duration::from_secs(1000);
+        display.update(first);
+
+        let mut second = create_test_update("session1", "project", 200, 0.02);
+        second.timestamp = SystemTime::UNIX_EPOCH + Duration::from_secs(1090);
+        display.update(second);
+
+        assert_eq!(display.get_current_session_duration(), Some(Duration::from_secs(90)));
+        assert_eq!(display.current_session.as_ref().unwrap().input_tokens, 200);
     }
-}
\ No newline at end of file
+}
@@ -15,15 +15,25 @@ use ratatui::{
     backend::CrosstermBackend,
     Terminal,
 };
-use std::io::{self, Stdout};
+use std::io::{self, BufWriter, Stdout};
 use std::time::{Duration, Instant};
 use tokio::sync::mpsc;
 
 /// Update interval for the display (milliseconds)
 const UPDATE_INTERVAL_MS: u64 = 1000;
 
+/// Capacity of the frame buffer in front of stdout, large enough that a full
+/// redraw normally goes out in a single write
+const FRAME_BUFFER_BYTES: usize = 64 * 1024;
+
+/// Exit status after a SIGTERM, following the shell's 128 + signal convention
+const SIGTERM_EXIT_CODE: i32 = 128 + 15;
+
 /// Terminal backend type alias
-type TerminalBackend = CrosstermBackend<Stdout>;
+///
+/// Stdout is line-buffered with a small buffer, so draw output is collected
+/// in a `BufWriter` and written when ratatui flushes at the end of each frame.
+type TerminalBackend = CrosstermBackend<BufWriter<Stdout>>;
 
 /// Main display manager for the live monitoring TUI
 pub struct LiveDisplayManager {
@@ -39,6 +49,8 @@ pub struct LiveDisplayManager {
     error_message: Option<String>,
     /// Last cleanup time for memory management
     last_cleanup: Instant,
+    /// Whether anything shown on screen changed since the last frame
+    needs_redraw: bool,
 }
 
 impl LiveDisplayManager {
@@ -58,42 +70,66 @@ impl LiveDisplayManager {
             theme,
             error_message: None,
             last_cleanup: Instant::now(),
+            needs_redraw: true,
         })
     }
 
     /// Run the display loop
     pub async fn run(&mut self) -> Result<()> {
-        let mut last_update = Instant::now();
+        let period = Duration::from_millis(UPDATE_INTERVAL_MS);
+        let mut deadline = Instant::now();
+
+        // Installed once for the whole loop; raw mode turns Ctrl+C into a key
+        // event, so this only sees termination requests from outside
+        let shutdown = shutdown_signal();
+        tokio::pin!(shutdown);
 
         loop {
             // Handle terminal events (non-blocking)
             if let Err(e) = self.handle_events().await {
                 self.error_message = Some(format!("Event handling error: {}", e));
+                self.needs_redraw = true;
             }
 
             // Process live updates (non-blocking)
             if let Err(e) = self.process_updates().await {
                 self.error_message = Some(format!("Update processing error: {}", e));
+                self.needs_redraw = true;
             }
 
-            // Render the display
-            if let Err(e) = self.render() {
-                self.error_message = Some(format!("Rendering error: {}", e));
+            // Render the display only when its content changed; the frame is
+            // built purely from the display state, so idle ticks skip it
+            if self.needs_redraw {
+                self.needs_redraw = false;
+                if let Err(e) = self.render() {
+                    self.error_message = Some(format!("Rendering error: {}", e));
+                    self.needs_redraw = true;
+                }
             }
 
+            // One clock read serves both the cleanup and the rate checks
+            let now = Instant::now();
+
             // Periodic cleanup to prevent memory growth
-            if self.last_cleanup.elapsed() > Duration::from_secs(300) { // 5 minutes
+            if now.duration_since(self.last_cleanup) > Duration::from_secs(300) { // 5 minutes
                 self.display_state.cleanup_old_sessions();
-                self.last_cleanup = Instant::now();
+                self.last_cleanup = now;
+                self.needs_redraw = true;
             }
 
-            // Control update rate
-            let elapsed = last_update.elapsed();
-            if elapsed < Duration::from_millis(UPDATE_INTERVAL_MS) {
-                let sleep_duration = Duration::from_millis(UPDATE_INTERVAL_MS) - elapsed;
-                tokio::time::sleep(sleep_duration).await;
+            // Control update rate against a fixed deadline so the loop's own
+            // work does not stretch the period between frames
+            deadline += period;
+            if deadline > now {
+                tokio::select! {
+                    _ = tokio::time::sleep_until(deadline.into()) => {}
+                    _ = &mut shutdown => return self.exit(SIGTERM_EXIT_CODE).await,
+                }
+            } else {
+                // Skip missed frames instead of bursting to catch up
+                tracing::debug!("Live display fell behind by {:?}", now - deadline);
+                deadline = now;
             }
-            last_update = Instant::now();
         }
     }
 
@@ -101,12 +137,14 @@ impl LiveDisplayManager {
     async fn handle_events(&mut self) -> Result<()> {
         // Check for events with a timeout to avoid blocking
         if event::poll(Duration::from_millis(50))? {
+            // Key presses and resizes both change what is on screen
+            self.needs_redraw = true;
             match event::read()? {
                 Event::Key(key) => {
                     if key.kind == KeyEventKind::Press {
                         match key.code {
                             KeyCode::Char('c') if key.modifiers.contains(event::KeyModifiers::CONTROL) => {
-                                return self.exit().await;
+                                return self.exit(0).await;
                             },
                             KeyCode::Up => {
                                 self.display_state.scroll_up();
@@ -121,7 +159,7 @@ impl LiveDisplayManager {
                                 self.error_message = None;
                             },
                             KeyCode::Char('q') => {
-                                return self.exit().await;
+                                return self.exit(0).await;
                             },
                             KeyCode::Char('r') => {
                                 // Reset scroll position
@@ -146,6 +184,7 @@ impl LiveDisplayManager {
         // Process all available updates without blocking
         while let Ok(update) = self.update_receiver.try_recv() {
             self.display_state.update(update);
+            self.needs_redraw = true;
             // Clear error message on successful update
             if self.error_message.is_some() {
                 self.error_message = None;
@@ -169,10 +208,10 @@ impl LiveDisplayManager {
         Ok(())
     }
 
-    /// Exit the display and cleanup terminal
-    async fn exit(&mut self) -> Result<()> {
+    /// Exit the display with the given status after restoring the terminal
+    async fn exit(&mut self, code: i32) -> Result<()> {
         cleanup_terminal(&mut self.terminal)?;
-        std::process::exit(0);
+        std::process::exit(code);
     }
 }
 
@@ -182,13 +221,32 @@ impl Drop for LiveDisplayManager {
     }
 }
 
+/// Resolve when the process is asked to terminate, so the terminal can be
+/// restored before exiting
+async fn shutdown_signal() {
+    #[cfg(unix)]
+    {
+        use tokio::signal::unix::{signal, SignalKind};
+
+        match signal(SignalKind::terminate()) {
+            Ok(mut terminate) => {
+                terminate.recv().await;
+                return;
+            }
+            Err(e) => tracing::warn!(error = %e, "Failed to install SIGTERM handler"),
+        }
+    }
+
+    std::future::pending::<()>().await
+}
+
 /// Setup the terminal for TUI mode
 fn setup_terminal() -> Result<Terminal<TerminalBackend>> {
     enable_raw_mode().context("Failed to enable raw mode")?;
     let mut stdout = io::stdout();
     execute!(stdout, EnterAlternateScreen, EnableMouseCapture)
         .context("Failed to setup terminal")?;
-    let backend = CrosstermBackend::new(stdout);
+    let backend = CrosstermBackend::new(BufWriter::with_capacity(FRAME_BUFFER_BYTES, stdout));
     let terminal = Terminal::new(backend)
         .context("Failed to create terminal")?;
     Ok(terminal)
@@ -213,7 +271,7 @@ pub async fn handle_shutdown(mut display_manager: LiveDisplayManager) -> Result<
     tokio::time::sleep(Duration::from_millis(100)).await;
     
     // Exit gracefully
-    display_manager.exit().await
+    display_manager.exit(0).await
 }
 
 #[cfg(test)]
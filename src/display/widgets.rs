@@ -156,23 +156,15 @@ impl<'a> ActivityWidget<'a> {
         let items: Vec<ListItem> = self.activities
             .iter()
             .map(|activity| {
+                // Every span borrows from the activity; nothing is formatted per frame
                 let line = Line::from(vec![
-                    Span::styled(
-                        format!("[{}] ", activity.time_str),
-                        self.theme.muted,
-                    ),
-                    Span::styled(
-                        format!("{}: ", activity.project),
-                        self.theme.secondary,
-                    ),
-                    Span::styled(
-                        format!("+{} tokens ", activity.tokens),
-                        self.theme.accent,
-                    ),
-                    Span::styled(
-                        format!("(${:.3})", activity.cost),
-                        self.theme.success,
-                    ),
+                    Span::styled("[", self.theme.muted),
+                    Span::styled(activity.time_str.as_str(), self.theme.muted),
+                    Span::styled("] ", self.theme.muted),
+                    Span::styled(activity.project.as_str(), self.theme.secondary),
+                    Span::styled(": ", self.theme.secondary),
+                    Span::styled(activity.tokens_label.as_str(), self.theme.accent),
+                    Span::styled(activity.cost_label.as_str(), self.theme.success),
                 ]);
                 ListItem::new(line)
             })
@@ -301,13 +293,11 @@ pub fn render_live_display(
     let chunks = create_main_layout(area);
 
     // Header with totals
-    let totals_text = display.format_totals();
-    let header = HeaderWidget::new(&totals_text, theme);
+    let header = HeaderWidget::new(display.totals_text(), theme);
     header.render(frame, chunks[0]);
 
     // Current session info
-    let session_info = display.format_current_session();
-    let session = SessionWidget::new(session_info.as_deref(), theme);
+    let session = SessionWidget::new(display.session_text(), theme);
     session.render(frame, chunks[1]);
 
     // Recent activity list
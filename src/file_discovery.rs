@@ -1,15 +1,108 @@
 use crate::config::get_config;
-use crate::keeper_integration::KeeperIntegration;
+use crate::io_utils::{contains_bytes, is_dir_entry, trim_ascii};
+use crate::timestamp_parser::TimestampParser;
 use anyhow::Result;
 use chrono::{DateTime, Utc};
 use glob::glob;
+use serde::Deserialize;
+use std::borrow::Cow;
 use std::fs::{metadata, File};
-use std::io::{BufRead, BufReader};
+use std::io::{BufRead, BufReader, Read, Seek, SeekFrom};
 use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::{Duration, Instant, SystemTime};
+
+/// How long a discovered set of Claude installation paths is reused before
+/// the filesystem is probed again
+const CLAUDE_PATHS_TTL: Duration = Duration::from_secs(60);
+
+/// Block size used when reading a file backwards from its end
+const TAIL_CHUNK_SIZE: u64 = 64 * 1024;
+
+/// Minimal view of a JSONL record used when only its timestamp is needed.
+///
+/// Deserializing into this skips every other field without building a DOM
+/// and borrows the timestamp straight from the line when it has no escapes.
+#[derive(Deserialize)]
+struct TimestampProbe<'a> {
+    #[serde(borrow)]
+    timestamp: Option<Cow<'a, str>>,
+}
+
+/// Key and opening quote of a compactly serialized `timestamp` string field
+const TIMESTAMP_FIELD: &[u8] = b"\"timestamp\":\"";
+
+/// Slice the value of the `timestamp` field straight out of a raw line.
+///
+/// Only succeeds when the compact key occurs exactly once and its value has
+/// no escapes; anything else returns `None` so the caller can fall back to
+/// deserializing the line.
+fn raw_timestamp(line: &[u8]) -> Option<&str> {
+    let mut fields = memchr::memmem::find_iter(line, TIMESTAMP_FIELD);
+    let start = fields.next()? + TIMESTAMP_FIELD.len();
+    if fields.next().is_some() {
+        return None;
+    }
+    let len = memchr::memchr2(b'"', b'\\', &line[start..])?;
+    if line[start + len] != b'"' {
+        return None;
+    }
+    std::str::from_utf8(&line[start..start + len]).ok()
+}
+
+/// Extract and parse the `timestamp` field of a single JSONL line
+fn extract_timestamp(line: &[u8]) -> Option<DateTime<Utc>> {
+    // Lines without the key cannot yield a timestamp; skip the JSON parse
+    if !contains_bytes(line, b"\"timestamp\"") {
+        return None;
+    }
+    // Claude writes compact JSON, so the value can usually be sliced out
+    // without deserializing the line at all
+    if let Some(timestamp) = raw_timestamp(line).and_then(|raw| TimestampParser::parse(raw).ok()) {
+        return Some(timestamp);
+    }
+    let probe: TimestampProbe = serde_json::from_slice(line).ok()?;
+    TimestampParser::parse(probe.timestamp.as_deref()?).ok()
+}
+
+/// Claude installation paths from the last discovery scan
+struct CachedClaudePaths {
+    exclude_vms: bool,
+    scanned_at: Instant,
+    paths: Vec<PathBuf>,
+}
+
+/// Return the last non-blank line of a file, reading backwards from its end in
+/// [`TAIL_CHUNK_SIZE`] blocks so only the tail of the file is touched
+fn read_last_line(file: &mut File) -> std::io::Result<Vec<u8>> {
+    let mut pos = file.seek(SeekFrom::End(0))?;
+    // Bytes from `pos` to the end of the file
+    let mut tail: Vec<u8> = Vec::new();
+
+    while pos > 0 {
+        let read_len = TAIL_CHUNK_SIZE.min(pos);
+        pos -= read_len;
+        let mut chunk = vec![0; read_len as usize];
+        file.seek(SeekFrom::Start(pos))?;
+        file.read_exact(&mut chunk)?;
+        chunk.extend_from_slice(&tail);
+        tail = chunk;
+
+        // The last line is complete once a newline precedes its content
+        if let Some(end) = tail.iter().rposition(|b| !b.is_ascii_whitespace()) {
+            if let Some(start) = tail[..end].iter().rposition(|&b| b == b'\n') {
+                return Ok(tail[start + 1..=end].to_vec());
+            }
+        }
+    }
+
+    // No newline before the content: the whole file is a single line
+    Ok(tail)
+}
 
 /// Handles file system traversal and discovery of Claude usage data files
 pub struct FileDiscovery {
-    keeper_integration: KeeperIntegration,
+    claude_paths: Mutex<Option<CachedClaudePaths>>,
 }
 
 impl Default for FileDiscovery {
@@ -21,32 +114,59 @@ impl Default for FileDiscovery {
 impl FileDiscovery {
     pub fn new() -> Self {
         Self {
-            keeper_integration: KeeperIntegration::new(),
+            claude_paths: Mutex::new(None),
         }
     }
 
     /// Discover all Claude installation paths (main + VMs)
+    ///
+    /// The result is cached for [`CLAUDE_PATHS_TTL`] so repeated lookups (e.g.
+    /// on every live refresh) don't re-probe the filesystem.
     pub fn discover_claude_paths(&self, exclude_vms: bool) -> Result<Vec<PathBuf>> {
-        let mut paths = Vec::new();
         let config = get_config();
 
         // Get Claude home directory from config (respects CLAUDE_HOME env var)
-        let claude_home = &config.paths.claude_home;
-        
+        Ok(self.cached_claude_paths(&config.paths.claude_home, exclude_vms))
+    }
+
+    /// Return the cached paths for `exclude_vms` while fresh, rescanning otherwise
+    fn cached_claude_paths(&self, claude_home: &Path, exclude_vms: bool) -> Vec<PathBuf> {
+        let mut cache = self.claude_paths.lock()
+            .expect("Failed to acquire Claude paths cache mutex lock");
+        if let Some(cached) = cache.as_ref() {
+            if cached.exclude_vms == exclude_vms && cached.scanned_at.elapsed() < CLAUDE_PATHS_TTL {
+                return cached.paths.clone();
+            }
+        }
+
+        let paths = Self::scan_claude_paths(claude_home, exclude_vms);
+        *cache = Some(CachedClaudePaths {
+            exclude_vms,
+            scanned_at: Instant::now(),
+            paths: paths.clone(),
+        });
+        paths
+    }
+
+    /// Probe the filesystem for the main Claude path and, unless excluded, VM paths
+    fn scan_claude_paths(claude_home: &Path, exclude_vms: bool) -> Vec<PathBuf> {
+        let mut paths = Vec::new();
+
         // Main Claude path
-        let main_path = claude_home.clone();
+        let main_path = claude_home.to_path_buf();
         if main_path.join("projects").exists() {
             paths.push(main_path.clone());
         }
 
         // VM paths (only if not excluded)
         if !exclude_vms {
-            let vms_dir = main_path.join("vms");
-            if vms_dir.exists() {
-                if let Ok(entries) = std::fs::read_dir(&vms_dir) {
-                    for entry in entries.flatten() {
+            // A missing vms directory just fails the listing, so it is not
+            // stat'ed separately first
+            if let Ok(entries) = std::fs::read_dir(main_path.join("vms")) {
+                for entry in entries.flatten() {
+                    if is_dir_entry(&entry) {
                         let vm_path = entry.path();
-                        if vm_path.is_dir() && vm_path.join("projects").exists() {
+                        if vm_path.join("projects").exists() {
                             paths.push(vm_path);
                         }
                     }
@@ -54,39 +174,61 @@ impl FileDiscovery {
             }
         }
 
-        Ok(paths)
+        paths
     }
 
     /// Find all JSONL files in the given Claude paths
     pub fn find_jsonl_files(&self, claude_paths: &[PathBuf]) -> Result<Vec<(PathBuf, PathBuf)>> {
         let mut file_tuples = Vec::new();
-        let mut seen_files = std::collections::HashSet::new();
 
         for claude_path in claude_paths {
             let projects_dir = claude_path.join("projects");
-            if !projects_dir.exists() {
+            let Ok(session_dirs) = std::fs::read_dir(&projects_dir) else {
                 continue;
-            }
-
-            // Find session directories (format: -base64-encoded-path)
-            // Files can be named either conversation_*.jsonl or *.jsonl (UUID format)
-            let patterns = vec![
-                projects_dir.join("*").join("conversation_*.jsonl"),
-                projects_dir.join("*").join("*.jsonl"),
-            ];
-
-            for pattern in patterns {
-                if let Ok(paths) = glob(&pattern.to_string_lossy()) {
-                    for entry in paths.flatten() {
-                        // Deduplicate files that match multiple patterns
-                        if seen_files.insert(entry.clone()) {
-                            if let Some(session_dir) = entry.parent() {
-                                file_tuples.push((entry.clone(), session_dir.to_path_buf()));
-                            }
-                        }
+            };
+
+            // Find session directories (format: -base64-encoded-path), in
+            // the sorted order glob walked them
+            let mut session_paths: Vec<PathBuf> = session_dirs
+                .flatten()
+                .filter(is_dir_entry)
+                .map(|session_dir| session_dir.path())
+                .collect();
+            session_paths.sort();
+
+            // Files can be named either conversation_*.jsonl or *.jsonl (UUID format).
+            // One directory listing per session covers both without glob
+            // matching, but the order of the two glob passes is kept: every
+            // conversation_* file comes first, since file order decides which
+            // copy of a duplicated entry is counted downstream
+            let mut conversations = Vec::new();
+            let mut others = Vec::new();
+            for session_path in session_paths {
+                let Ok(files) = std::fs::read_dir(&session_path) else {
+                    continue;
+                };
+
+                let mut session_files: Vec<PathBuf> = files
+                    .flatten()
+                    .filter(|file| file.file_name().to_string_lossy().ends_with(".jsonl"))
+                    .map(|file| file.path())
+                    .collect();
+                session_files.sort();
+
+                for file in session_files {
+                    let is_conversation = file
+                        .file_name()
+                        .is_some_and(|name| name.to_string_lossy().starts_with("conversation_"));
+                    let tuple = (file, session_path.clone());
+                    if is_conversation {
+                        conversations.push(tuple);
+                    } else {
+                        others.push(tuple);
                     }
                 }
             }
+            file_tuples.append(&mut conversations);
+            file_tuples.append(&mut others);
         }
 
         Ok(file_tuples)
@@ -103,28 +245,15 @@ impl FileDiscovery {
             return true;
         }
 
-        // Check file lifespan overlap with search date range
+        // Check file lifespan overlap with search date range. The bounds are
+        // converted to SystemTime once so the metadata times can be compared
+        // as-is instead of building a DateTime for each of them.
         if let Ok(metadata) = metadata(file_path) {
-            let mut file_start_time = None;
-            let mut file_end_time = None;
-
-            // Get creation time (birth time) as the start of file lifespan
-            if let Ok(created) = metadata.created() {
-                file_start_time = Some(DateTime::<Utc>::from(created));
-            }
-
-            // Get modification time as the end of file lifespan
-            if let Ok(modified) = metadata.modified() {
-                file_end_time = Some(DateTime::<Utc>::from(modified));
-            }
-
-            // If we don't have creation time, use modification time as both start and end
-            if file_start_time.is_none() && file_end_time.is_some() {
-                file_start_time = file_end_time;
-            }
+            // Modification time is the end of the file lifespan; creation
+            // (birth) time is the start, falling back to the modification time
+            if let Ok(file_end) = metadata.modified() {
+                let file_start = metadata.created().unwrap_or(file_end);
 
-            // Check for overlap between file lifespan and search range
-            if let (Some(file_start), Some(file_end)) = (file_start_time, file_end_time) {
                 // File lifespan: [file_start, file_end]
                 // Search range: [since_date, until_date]
 
@@ -133,7 +262,7 @@ impl FileDiscovery {
                 // 2. File must have been modified after or during the search range starts
 
                 if let Some(until) = until_date {
-                    let until_plus_day = *until + chrono::Duration::days(1);
+                    let until_plus_day = SystemTime::from(*until + chrono::Duration::days(1));
                     // File was created after the search range ended
                     if file_start > until_plus_day {
                         return false;
@@ -142,7 +271,7 @@ impl FileDiscovery {
 
                 if let Some(since) = since_date {
                     // File was last modified before the search range started
-                    if file_end < *since {
+                    if file_end < SystemTime::from(*since) {
                         return false;
                     }
                 }
@@ -179,70 +308,64 @@ impl FileDiscovery {
         file_path: &Path,
     ) -> Result<(Option<DateTime<Utc>>, Option<DateTime<Utc>>)> {
         let file = File::open(file_path)?;
-        let reader = BufReader::new(file);
-
-        let mut earliest_timestamp: Option<DateTime<Utc>> = None;
-        let mut latest_timestamp: Option<DateTime<Utc>> = None;
-
-        // Read first and last non-empty lines efficiently
-        let mut first_line = None;
-        let mut last_line = None;
-
-        for line in reader.lines() {
-            let line = line?;
-            let line = line.trim();
-            if line.is_empty() {
-                continue;
+        let mut reader = BufReader::new(file);
+
+        // Read the first non-empty line from the head of the file
+        let mut first_line: Option<Vec<u8>> = None;
+        let mut buf: Vec<u8> = Vec::new();
+        loop {
+            buf.clear();
+            if reader.read_until(b'\n', &mut buf)? == 0 {
+                break;
             }
-
-            if first_line.is_none() {
-                first_line = Some(line.to_string());
+            if !trim_ascii(&buf).is_empty() {
+                first_line = Some(buf);
+                break;
             }
-            last_line = Some(line.to_string());
         }
 
-        // Parse timestamps from first and last entries
-        if let Some(line) = first_line {
-            if let Some(entry) = self.keeper_integration.parse_single_line(&line) {
-                if let Ok(timestamp) =
-                    crate::timestamp_parser::TimestampParser::parse(&entry.timestamp)
-                {
-                    earliest_timestamp = Some(timestamp);
-                }
-            }
-        }
+        // Entries are appended in order, so the latest one is the last line;
+        // read it from the tail instead of scanning the whole file
+        let last_line = if first_line.is_some() {
+            read_last_line(&mut reader.into_inner())?
+        } else {
+            Vec::new()
+        };
 
-        if let Some(line) = last_line {
-            if let Some(entry) = self.keeper_integration.parse_single_line(&line) {
-                if let Ok(timestamp) =
-                    crate::timestamp_parser::TimestampParser::parse(&entry.timestamp)
-                {
-                    latest_timestamp = Some(timestamp);
-                }
-            }
-        }
+        // Parse timestamps from first and last entries
+        let earliest_timestamp = first_line.and_then(|line| extract_timestamp(trim_ascii(&line)));
+        let latest_timestamp = if last_line.is_empty() {
+            None
+        } else {
+            extract_timestamp(trim_ascii(&last_line))
+        };
 
         Ok((earliest_timestamp, latest_timestamp))
     }
 
     /// Get the earliest timestamp from a file
+    ///
+    /// Claude appends entries chronologically, so the first timestamped line
+    /// is the earliest one. Reading stops at that line; leading records
+    /// without a timestamp (summaries, metadata) are skipped however many
+    /// there are.
     pub fn get_earliest_timestamp(&self, file_path: &Path) -> Result<Option<DateTime<Utc>>> {
         let file = File::open(file_path)?;
-        let reader = BufReader::new(file);
+        let mut reader = BufReader::new(file);
+        let mut buf: Vec<u8> = Vec::new();
 
-        for line in reader.lines() {
-            let line = line?;
-            let line = line.trim();
+        loop {
+            buf.clear();
+            if reader.read_until(b'\n', &mut buf)? == 0 {
+                break;
+            }
+            let line = trim_ascii(&buf);
             if line.is_empty() {
                 continue;
             }
 
-            if let Some(entry) = self.keeper_integration.parse_single_line(line) {
-                if let Ok(timestamp) =
-                    crate::timestamp_parser::TimestampParser::parse(&entry.timestamp)
-                {
-                    return Ok(Some(timestamp));
-                }
+            if let Some(timestamp) = extract_timestamp(line) {
+                return Ok(Some(timestamp));
             }
         }
 
@@ -258,33 +381,43 @@ impl FileDiscovery {
         // Only parse content timestamp for smaller datasets
         let use_content_timestamp = file_tuples.len() < 100;
 
-        file_tuples.sort_by(|a, b| {
-            // Primary sort: file modification time
-            let a_mtime = metadata(&a.0)
-                .and_then(|m| m.modified())
-                .unwrap_or(std::time::UNIX_EPOCH);
-            let b_mtime = metadata(&b.0)
-                .and_then(|m| m.modified())
-                .unwrap_or(std::time::UNIX_EPOCH);
-
-            let primary_cmp = a_mtime.cmp(&b_mtime);
-
-            if use_content_timestamp && primary_cmp == std::cmp::Ordering::Equal {
-                // Secondary sort: content timestamp
-                let a_timestamp = self.get_earliest_timestamp(&a.0).unwrap_or(None);
-                let b_timestamp = self.get_earliest_timestamp(&b.0).unwrap_or(None);
-
-                match (a_timestamp, b_timestamp) {
-                    (Some(a_ts), Some(b_ts)) => a_ts.cmp(&b_ts),
-                    (Some(_), None) => std::cmp::Ordering::Less,
-                    (None, Some(_)) => std::cmp::Ordering::Greater,
-                    (None, None) => std::cmp::Ordering::Equal,
+        // Stat every file once up front rather than twice per comparison
+        let mut keyed: Vec<(SystemTime, (PathBuf, PathBuf))> = file_tuples
+            .drain(..)
+            .map(|tuple| {
+                let mtime = metadata(&tuple.0)
+                    .and_then(|m| m.modified())
+                    .unwrap_or(std::time::UNIX_EPOCH);
+                (mtime, tuple)
+            })
+            .collect();
+
+        // Primary sort: file modification time
+        keyed.sort_by_key(|(mtime, _)| *mtime);
+
+        if use_content_timestamp {
+            // Secondary sort: content timestamp, only read for files whose
+            // modification times tie, and at most once per file
+            let mut start = 0;
+            while start < keyed.len() {
+                let mtime = keyed[start].0;
+                let end = start
+                    + keyed[start..]
+                        .iter()
+                        .take_while(|(m, _)| *m == mtime)
+                        .count();
+                if end - start > 1 {
+                    keyed[start..end].sort_by_cached_key(|(_, (path, _))| {
+                        let timestamp = self.get_earliest_timestamp(path).unwrap_or(None);
+                        // Files with a timestamp sort before files without one
+                        (timestamp.is_none(), timestamp)
+                    });
                 }
-            } else {
-                primary_cmp
+                start = end;
             }
-        });
+        }
 
+        file_tuples.extend(keyed.into_iter().map(|(_, tuple)| tuple));
         file_tuples
     }
 
@@ -322,3 +455,206 @@ impl FileDiscovery {
         Ok(block_files)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_extract_timestamp_skips_other_fields() {
+        let line = r#"{"message":{"id":"msg_1","content":[{"type":"text","text":"hi"}]},"timestamp":"2025-08-20T10:30:00.123Z","requestId":"req_1"}"#;
+        let ts = extract_timestamp(line.as_bytes()).unwrap();
+        assert_eq!(ts.to_rfc3339(), "2025-08-20T10:30:00.123+00:00");
+    }
+
+    #[test]
+    fn test_extract_timestamp_missing_or_invalid() {
+        assert!(extract_timestamp(br#"{"type":"summary","summary":"Chat"}"#).is_none());
+        assert!(extract_timestamp(br#"{"timestamp":"not a date"}"#).is_none());
+        assert!(extract_timestamp(b"{broken json}").is_none());
+    }
+
+    #[test]
+    fn test_raw_timestamp_slices_compact_field() {
+        assert_eq!(
+            raw_timestamp(br#"{"type":"assistant","timestamp":"2025-08-20T10:30:00Z","x":1}"#),
+            Some("2025-08-20T10:30:00Z")
+        );
+        // Shapes left to the JSON fallback
+        assert_eq!(raw_timestamp(br#"{"timestamp": "2025-08-20T10:30:00Z"}"#), None);
+        assert_eq!(raw_timestamp(br#"{"timestamp":"2025\u002d08"}"#), None);
+        assert_eq!(
+            raw_timestamp(br#"{"data":{"timestamp":"a"},"timestamp":"2025-08-20T10:30:00Z"}"#),
+            None
+        );
+        assert_eq!(raw_timestamp(br#"{"timestamp":"2025-08-20"#), None);
+
+        // The fallback still finds spaced and nested-duplicate timestamps
+        let spaced = extract_timestamp(br#"{"timestamp": "2025-08-20T10:30:00Z"}"#).unwrap();
+        assert_eq!(spaced.to_rfc3339(), "2025-08-20T10:30:00+00:00");
+        let nested = extract_timestamp(
+            br#"{"data":{"timestamp":"a"},"timestamp":"2025-08-20T10:30:00Z"}"#,
+        )
+        .unwrap();
+        assert_eq!(nested.to_rfc3339(), "2025-08-20T10:30:00+00:00");
+    }
+
+    #[test]
+    fn test_timestamp_prefilter() {
+        assert!(contains_bytes(br#"{"timestamp":"x"}"#, b"\"timestamp\""));
+        assert!(!contains_bytes(br#"{"type":"summary"}"#, b"\"timestamp\""));
+    }
+
+    #[test]
+    fn test_read_last_line_from_tail() {
+        let dir = tempfile::tempdir().unwrap();
+        let file = dir.path().join("a.jsonl");
+
+        std::fs::write(&file, "first\nsecond\n\n  \n").unwrap();
+        let last = read_last_line(&mut File::open(&file).unwrap()).unwrap();
+        assert_eq!(trim_ascii(&last), b"second");
+
+        std::fs::write(&file, "only").unwrap();
+        let last = read_last_line(&mut File::open(&file).unwrap()).unwrap();
+        assert_eq!(trim_ascii(&last), b"only");
+
+        // A last line spanning several tail blocks
+        let long = "x".repeat(TAIL_CHUNK_SIZE as usize * 2 + 7);
+        std::fs::write(&file, format!("first\n{}\n", long)).unwrap();
+        let last = read_last_line(&mut File::open(&file).unwrap()).unwrap();
+        assert_eq!(last, long.as_bytes());
+
+        std::fs::write(&file, "").unwrap();
+        assert!(read_last_line(&mut File::open(&file).unwrap()).unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_file_date_range_reads_head_and_tail() {
+        let dir = tempfile::tempdir().unwrap();
+        let file = dir.path().join("a.jsonl");
+        std::fs::write(
+            &file,
+            "\n{\"timestamp\":\"2025-08-19T08:00:00Z\"}\n{\"timestamp\":\"2025-08-20T10:30:00Z\"}\n",
+        )
+        .unwrap();
+
+        let (earliest, latest) = FileDiscovery::new().get_file_date_range(&file).unwrap();
+        assert_eq!(earliest.unwrap().to_rfc3339(), "2025-08-19T08:00:00+00:00");
+        assert_eq!(latest.unwrap().to_rfc3339(), "2025-08-20T10:30:00+00:00");
+    }
+
+    #[test]
+    fn test_claude_paths_cached_per_vm_flag() {
+        let home = tempfile::tempdir().unwrap();
+        let projects = home.path().join("projects");
+        std::fs::create_dir_all(&projects).unwrap();
+
+        let discovery = FileDiscovery::new();
+        let expected = vec![home.path().to_path_buf()];
+        assert_eq!(discovery.cached_claude_paths(home.path(), true), expected);
+
+        // A fresh cache entry is reused without touching the filesystem
+        std::fs::remove_dir(&projects).unwrap();
+        assert_eq!(discovery.cached_claude_paths(home.path(), true), expected);
+
+        // A different VM flag rescans
+        assert!(discovery.cached_claude_paths(home.path(), false).is_empty());
+    }
+
+    #[test]
+    fn test_scan_claude_paths_finds_vm_dirs() {
+        let home = tempfile::tempdir().unwrap();
+        let vm = home.path().join("vms").join("vm1");
+        std::fs::create_dir_all(vm.join("projects")).unwrap();
+        std::fs::create_dir_all(home.path().join("vms").join("empty")).unwrap();
+        std::fs::write(home.path().join("vms").join("notes.txt"), "").unwrap();
+
+        assert_eq!(FileDiscovery::scan_claude_paths(home.path(), false), vec![vm]);
+        assert!(FileDiscovery::scan_claude_paths(home.path(), true).is_empty());
+    }
+
+    #[test]
+    fn test_find_jsonl_files_scans_session_dirs() {
+        let root = tempfile::tempdir().unwrap();
+        let projects = root.path().join("projects");
+        let (app, web) = (projects.join("-home-user-app"), projects.join("-home-user-web"));
+        std::fs::create_dir_all(&app).unwrap();
+        std::fs::create_dir_all(&web).unwrap();
+        for name in ["conversation_1.jsonl", "abc.jsonl", "notes.txt"] {
+            std::fs::write(web.join(name), "").unwrap();
+        }
+        for name in ["zed.jsonl", "conversation_2.jsonl"] {
+            std::fs::write(app.join(name), "").unwrap();
+        }
+        std::fs::write(projects.join("stray.jsonl"), "").unwrap();
+
+        let files = FileDiscovery::new()
+            .find_jsonl_files(&[root.path().to_path_buf()])
+            .unwrap();
+        let found: Vec<_> = files
+            .iter()
+            .map(|(file, dir)| {
+                assert_eq!(file.parent(), Some(dir.as_path()));
+                file.strip_prefix(&projects).unwrap().to_path_buf()
+            })
+            .collect();
+
+        // All conversation_* files first, then the rest, each in path order
+        let expected: Vec<PathBuf> = [
+            "-home-user-app/conversation_2.jsonl",
+            "-home-user-web/conversation_1.jsonl",
+            "-home-user-app/zed.jsonl",
+            "-home-user-web/abc.jsonl",
+        ]
+        .iter()
+        .map(PathBuf::from)
+        .collect();
+        assert_eq!(found, expected);
+    }
+
+    #[test]
+    fn test_should_include_file_by_mtime() {
+        let dir = tempfile::tempdir().unwrap();
+        let file = dir.path().join("session.jsonl");
+        std::fs::write(&file, "").unwrap();
+
+        let discovery = FileDiscovery::new();
+        let now = Utc::now();
+        let yesterday = now - chrono::Duration::days(1);
+        let tomorrow = now + chrono::Duration::days(1);
+        let last_week = now - chrono::Duration::days(7);
+
+        assert!(discovery.should_include_file(&file, None, None));
+        assert!(discovery.should_include_file(&file, Some(&yesterday), Some(&tomorrow)));
+        // Modified before the range starts
+        assert!(!discovery.should_include_file(&file, Some(&tomorrow), None));
+        // Created after the range (plus its final day) ends
+        assert!(!discovery.should_include_file(&file, None, Some(&last_week)));
+    }
+
+    #[test]
+    fn test_get_earliest_timestamp_skips_leading_records() {
+        let dir = tempfile::tempdir().unwrap();
+        let discovery = FileDiscovery::new();
+
+        let file = dir.path().join("a.jsonl");
+        std::fs::write(
+            &file,
+            "{\"type\":\"summary\"}\n\n{\"timestamp\":\"2025-08-20T10:30:00Z\"}\n{\"timestamp\":\"2025-08-19T00:00:00Z\"}\n",
+        )
+        .unwrap();
+        let ts = discovery.get_earliest_timestamp(&file).unwrap().unwrap();
+        assert_eq!(ts.to_rfc3339(), "2025-08-20T10:30:00+00:00");
+
+        let late = dir.path().join("b.jsonl");
+        let mut content = "{\"type\":\"summary\"}\n".repeat(50);
+        content.push_str("{\"timestamp\":\"2025-08-20T10:30:00Z\"}\n");
+        std::fs::write(&late, content).unwrap();
+        let ts = discovery.get_earliest_timestamp(&late).unwrap().unwrap();
+        assert_eq!(ts.to_rfc3339(), "2025-08-20T10:30:00+00:00");
+
+        let none = dir.path().join("c.jsonl");
+        std::fs::write(&none, "{\"type\":\"summary\"}\n\n").unwrap();
+        assert!(discovery.get_earliest_timestamp(&none).unwrap().is_none());
+    }
+}
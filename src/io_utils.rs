@@ -0,0 +1,142 @@
+//! Byte, line and directory-entry helpers
+//!
+//! Small building blocks shared by the JSONL readers: substring search and
+//! line splitting over raw bytes, and `read_dir` entry type checks that
+//! avoid an extra `stat` per entry.
+
+use std::io::BufRead;
+
+/// SIMD-accelerated substring search over raw line bytes
+pub(crate) fn contains_bytes(haystack: &[u8], needle: &[u8]) -> bool {
+    memchr::memmem::find(haystack, needle).is_some()
+}
+
+/// Whether a directory entry is a directory, using the type returned by
+/// `read_dir` and only following symlinks with an extra `stat`
+pub(crate) fn is_dir_entry(entry: &std::fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(file_type) if file_type.is_symlink() => entry.path().is_dir(),
+        Ok(file_type) => file_type.is_dir(),
+        Err(_) => false,
+    }
+}
+
+/// Whether a directory entry is a regular file, with the same symlink
+/// handling as [`is_dir_entry`]
+pub(crate) fn is_file_entry(entry: &std::fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(file_type) if file_type.is_symlink() => entry.path().is_file(),
+        Ok(file_type) => file_type.is_file(),
+        Err(_) => false,
+    }
+}
+
+/// Trim ASCII whitespace (including the trailing newline) from a raw line
+/// without copying it
+pub(crate) fn trim_ascii(mut bytes: &[u8]) -> &[u8] {
+    while let [first, rest @ ..] = bytes {
+        if !first.is_ascii_whitespace() {
+            break;
+        }
+        bytes = rest;
+    }
+    while let [rest @ .., last] = bytes {
+        if !last.is_ascii_whitespace() {
+            break;
+        }
+        bytes = rest;
+    }
+    bytes
+}
+
+/// Split a JSONL buffer into lines without their `\n`, locating newlines
+/// with memchr's SIMD search rather than testing every byte
+///
+/// A final line without a trailing newline is still yielded; no empty line
+/// is yielded after a trailing newline.
+pub(crate) fn split_lines(mut content: &[u8]) -> impl Iterator<Item = &[u8]> {
+    std::iter::from_fn(move || {
+        if content.is_empty() {
+            return None;
+        }
+        match memchr::memchr(b'\n', content) {
+            Some(end) => {
+                let line = &content[..end];
+                content = &content[end + 1..];
+                Some(line)
+            }
+            None => Some(std::mem::take(&mut content)),
+        }
+    })
+}
+
+/// Stream the lines of a reader to `f`, with the same line semantics as
+/// [`split_lines`]
+///
+/// Lines that lie entirely inside the reader's buffer are handed over in
+/// place; only a line straddling two buffer fills is copied into a scratch
+/// buffer to be joined.
+pub(crate) fn for_each_line<R: BufRead>(
+    reader: &mut R,
+    mut f: impl FnMut(&[u8]),
+) -> std::io::Result<()> {
+    let mut partial: Vec<u8> = Vec::new();
+    loop {
+        let chunk = reader.fill_buf()?;
+        if chunk.is_empty() {
+            break;
+        }
+        let mut rest = chunk;
+        while let Some(end) = memchr::memchr(b'\n', rest) {
+            if partial.is_empty() {
+                f(&rest[..end]);
+            } else {
+                partial.extend_from_slice(&rest[..end]);
+                f(&partial);
+                partial.clear();
+            }
+            rest = &rest[end + 1..];
+        }
+        partial.extend_from_slice(rest);
+        let consumed = chunk.len();
+        reader.consume(consumed);
+    }
+    if !partial.is_empty() {
+        f(&partial);
+    }
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::BufReader;
+
+    #[test]
+    fn test_split_lines() {
+        let lines: Vec<&[u8]> = split_lines(b"a\n\nbc\r\nd").collect();
+        assert_eq!(lines, vec![&b"a"[..], b"", b"bc\r", b"d"]);
+        assert_eq!(split_lines(b"x\n").count(), 1);
+        assert_eq!(split_lines(b"").count(), 0);
+    }
+
+    #[test]
+    fn test_for_each_line_matches_split_lines() {
+        let content: &[u8] = b"a\n\nbcdefgh\r\nijklmnopq\nd";
+        // A tiny buffer makes most lines straddle refills
+        for capacity in [1, 3, 8, 64] {
+            let mut reader = BufReader::with_capacity(capacity, content);
+            let mut lines: Vec<Vec<u8>> = Vec::new();
+            for_each_line(&mut reader, |line| lines.push(line.to_vec())).unwrap();
+            let expected: Vec<Vec<u8>> = split_lines(content).map(<[u8]>::to_vec).collect();
+            assert_eq!(lines, expected, "capacity {}", capacity);
+        }
+    }
+
+    #[test]
+    fn test_trim_ascii() {
+        assert_eq!(trim_ascii(b"  {\"a\":1}\r\n"), b"{\"a\":1}");
+        assert_eq!(trim_ascii(b" \n"), b"");
+        assert_eq!(trim_ascii(b""), b"");
+    }
+}
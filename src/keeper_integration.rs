@@ -3,16 +3,85 @@
 //! This module provides the bridge between claude-usage's existing
 //! data models and claude-keeper's FlexObject/SchemaAdapter system.
 
+use crate::io_utils::{for_each_line, trim_ascii};
 use crate::models::{MessageData, SessionBlock, UsageData, UsageEntry};
-use anyhow::Result;
+use crate::timestamp_parser::TimestampParser;
+use anyhow::{Context, Result};
 use claude_keeper::claude::{create_claude_adapter, ClaudeMessage};
 use claude_keeper::core::{FlexObject, JsonlParser, SchemaAdapter};
+use serde::de::IgnoredAny;
+use serde::Deserialize;
+use std::borrow::Cow;
+use std::fs::File;
+use std::io::BufReader;
 use std::path::Path;
 use tracing::{debug, info};
 
 // Memory management is now handled by claude-keeper's streaming parser
 // No need for custom memory tracking as claude-keeper handles files of any size efficiently
 
+/// Read buffer size for streaming JSONL files; large enough that most lines,
+/// including long assistant turns, are parsed in place from the buffer
+const READ_BUFFER_SIZE: usize = 256 * 1024;
+
+/// Typed view of the fields a usage entry is built from.
+///
+/// Deserializing into this skips every other field of the line (notably the
+/// large `message.content`) without building a DOM, and borrows strings
+/// straight from the line when they have no escapes. Keys that only the
+/// schema adapter knows how to resolve are captured so such lines can be
+/// handed to claude-keeper instead.
+#[derive(Deserialize)]
+struct EntryProbe<'a> {
+    #[serde(borrow)]
+    timestamp: Cow<'a, str>,
+    #[serde(borrow)]
+    message: MessageProbe<'a>,
+    #[serde(rename = "costUSD")]
+    cost_usd: Option<f64>,
+    #[serde(rename = "requestId", borrow)]
+    request_id: Option<Cow<'a, str>>,
+    // Fallback request id keys, in the adapter's resolution order
+    #[serde(borrow)]
+    uuid: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    id: Option<Cow<'a, str>>,
+    #[serde(rename = "messageId", borrow)]
+    message_id: Option<Cow<'a, str>>,
+    #[serde(rename = "request_id")]
+    alt_request_id: Option<IgnoredAny>,
+    #[serde(rename = "cost_usd")]
+    alt_cost_usd: Option<IgnoredAny>,
+    cost: Option<IgnoredAny>,
+    usage: Option<IgnoredAny>,
+}
+
+#[derive(Deserialize)]
+struct MessageProbe<'a> {
+    #[serde(borrow)]
+    id: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    model: Option<Cow<'a, str>>,
+    usage: Option<UsageProbe>,
+}
+
+#[derive(Deserialize)]
+struct UsageProbe {
+    // Counts that do not fit a u32 fail the probe, leaving the line to the
+    // schema adapter
+    #[serde(default)]
+    input_tokens: u32,
+    #[serde(default)]
+    output_tokens: u32,
+    #[serde(default)]
+    cache_creation_input_tokens: u32,
+    #[serde(default)]
+    cache_read_input_tokens: u32,
+}
+
+/// Model recorded for entries whose message does not name one
+const DEFAULT_ENTRY_MODEL: &str = "claude-3-5-sonnet-20241022";
+
 /// Integration wrapper that provides claude-keeper parsing capabilities
 #[allow(dead_code)]
 pub struct KeeperIntegration {
@@ -76,35 +145,43 @@ impl KeeperIntegration {
             "Parsing JSONL file with claude-keeper streaming parser"
         );
 
-        // Use claude-keeper's streaming parser - this handles memory efficiently
-        let parse_result = self.parser.parse_file(file_path)?;
-        
+        // Stream the file as raw bytes; lines are parsed straight from the
+        // read buffer without a per-line copy or UTF-8 pass
+        let file = File::open(file_path)
+            .with_context(|| format!("Failed to open file: {}", file_path.display()))?;
+        let mut reader = BufReader::with_capacity(READ_BUFFER_SIZE, file);
+
         let mut entries = Vec::new();
-        let mut conversion_errors = 0;
-
-        // Extract values we need before consuming parse_result
-        let total_lines = parse_result.total_lines;
-        let parse_errors_count = parse_result.errors.len();
-        let success_rate = parse_result.success_rate();
-
-        // Convert FlexObjects to UsageEntries
-        for flex_obj in parse_result.objects {
-            if let Some(entry) = self.convert_to_usage_entry(flex_obj) {
-                entries.push(entry);
-            } else {
-                conversion_errors += 1;
+        let mut total_lines = 0usize;
+        let mut skipped_lines = 0usize;
+
+        for_each_line(&mut reader, |line| {
+            let line = trim_ascii(line);
+            if line.is_empty() {
+                return;
             }
-        }
+            total_lines += 1;
+
+            // Typed fast path first; only lines it cannot represent
+            // exactly pay for claude-keeper's full FlexObject parse
+            let entry = Self::probe_usage_entry(line).or_else(|| {
+                std::str::from_utf8(line)
+                    .ok()
+                    .and_then(|line| self.parse_single_line(line))
+            });
+            match entry {
+                Some(entry) => entries.push(entry),
+                None => skipped_lines += 1,
+            }
+        })?;
 
         // Log results
-        if parse_errors_count > 0 || conversion_errors > 0 {
+        if skipped_lines > 0 {
             info!(
                 file = %file_path.display(),
                 total_lines = total_lines,
-                parse_errors = parse_errors_count,
-                conversion_errors = conversion_errors,
+                skipped_lines = skipped_lines,
                 entries_extracted = entries.len(),
-                success_rate = format!("{:.1}%", success_rate),
                 "Completed parsing with some errors"
             );
         } else {
@@ -157,34 +234,27 @@ impl KeeperIntegration {
 
         // First try to parse as raw JSON to handle arrays directly
         match serde_json::from_str::<serde_json::Value>(content) {
-            Ok(json_value) => {
+            Ok(mut json_value) => {
                 // Case 1: Direct array of session blocks
-                if let Some(array) = json_value.as_array() {
-                    for item in array {
-                        if let Ok(block) = serde_json::from_value::<SessionBlock>(item.clone()) {
-                            session_blocks.push(block);
-                        }
-                    }
-                    return Ok(session_blocks);
-                }
-
                 // Case 2: Object with "blocks" field
-                if let Some(blocks) = json_value.get("blocks").and_then(|v| v.as_array()) {
-                    for item in blocks {
-                        if let Ok(block) = serde_json::from_value::<SessionBlock>(item.clone()) {
-                            session_blocks.push(block);
-                        }
-                    }
-                    return Ok(session_blocks);
-                }
-
                 // Case 3: Object with "sessions" field
-                if let Some(sessions) = json_value.get("sessions").and_then(|v| v.as_array()) {
-                    for item in sessions {
-                        if let Ok(block) = serde_json::from_value::<SessionBlock>(item.clone()) {
-                            session_blocks.push(block);
+                // The list is taken out of the parsed tree so each item is
+                // converted by move instead of being cloned first
+                let items = match &mut json_value {
+                    serde_json::Value::Array(items) => Some(std::mem::take(items)),
+                    json_value => ["blocks", "sessions"].iter().find_map(|key| {
+                        match json_value.get_mut(*key) {
+                            Some(serde_json::Value::Array(items)) => Some(std::mem::take(items)),
+                            _ => None,
                         }
-                    }
+                    }),
+                };
+                if let Some(items) = items {
+                    session_blocks.extend(
+                        items
+                            .into_iter()
+                            .filter_map(|item| serde_json::from_value::<SessionBlock>(item).ok()),
+                    );
                     return Ok(session_blocks);
                 }
 
@@ -241,6 +311,53 @@ impl KeeperIntegration {
         Ok(session_blocks)
     }
 
+    /// Build a usage entry from a line through the typed [`EntryProbe`].
+    ///
+    /// The request id is taken from `requestId`, `uuid`, `id` or `messageId`,
+    /// in the order the adapter's `uuid` mapping tries them. Returns `None`
+    /// whenever the line needs the schema adapter to resolve: malformed JSON,
+    /// a missing or `request_id`-only request id, alternative cost keys,
+    /// top-level usage, token counts beyond `u32`, or a timestamp only
+    /// claude-keeper parses.
+    fn probe_usage_entry(line: &[u8]) -> Option<UsageEntry> {
+        let probe: EntryProbe = serde_json::from_slice(line).ok()?;
+        if probe.cost_usd.is_none() && (probe.alt_cost_usd.is_some() || probe.cost.is_some()) {
+            return None;
+        }
+        if probe.message.usage.is_none() && probe.usage.is_some() {
+            return None;
+        }
+        if probe.request_id.is_none() && probe.alt_request_id.is_some() {
+            return None;
+        }
+        let request_id = probe
+            .request_id
+            .or(probe.uuid)
+            .or(probe.id)
+            .or(probe.message_id)?
+            .into_owned();
+        let timestamp = TimestampParser::parse(&probe.timestamp).ok()?.to_rfc3339();
+
+        let message = probe.message;
+        Some(UsageEntry {
+            timestamp,
+            message: MessageData {
+                id: message.id.map(Cow::into_owned).unwrap_or_default(),
+                model: message
+                    .model
+                    .map_or_else(|| DEFAULT_ENTRY_MODEL.to_string(), Cow::into_owned),
+                usage: message.usage.map(|usage| UsageData {
+                    input_tokens: usage.input_tokens,
+                    output_tokens: usage.output_tokens,
+                    cache_creation_input_tokens: usage.cache_creation_input_tokens,
+                    cache_read_input_tokens: usage.cache_read_input_tokens,
+                }),
+            },
+            cost_usd: probe.cost_usd,
+            request_id,
+        })
+    }
+
     /// Convert FlexObject to UsageEntry using SchemaAdapter
     fn convert_to_usage_entry(&self, obj: FlexObject) -> Option<UsageEntry> {
         let message = ClaudeMessage::new(obj);
@@ -301,7 +418,7 @@ impl KeeperIntegration {
         let model = message_content
             .get("model")
             .and_then(|v| v.as_str())
-            .unwrap_or("claude-3-5-sonnet-20241022")
+            .unwrap_or(DEFAULT_ENTRY_MODEL)
             .to_string();
 
         // Extract usage data if present
@@ -389,6 +506,44 @@ mod tests {
         assert_eq!(entries.len(), 2); // Should parse valid lines despite errors
     }
 
+    #[test]
+    fn test_probe_matches_keeper_conversion() {
+        let integration = KeeperIntegration::new();
+
+        let line = r#"{"timestamp":"2025-01-15T10:30:00.123Z","message":{"id":"msg_1","content":[{"type":"text","text":"a \"quoted\" reply"}],"model":"claude-3-haiku-20240307","usage":{"input_tokens":10,"output_tokens":20,"cache_creation_input_tokens":3,"cache_read_input_tokens":4}},"costUSD":0.5,"requestId":"req_1"}"#;
+        let probed = KeeperIntegration::probe_usage_entry(line.as_bytes()).unwrap();
+        let keeper = integration.parse_single_line(line).unwrap();
+
+        assert_eq!(probed.timestamp, keeper.timestamp);
+        assert_eq!(probed.request_id, keeper.request_id);
+        assert_eq!(probed.message.id, keeper.message.id);
+        assert_eq!(probed.message.model, keeper.message.model);
+        let (probed_usage, keeper_usage) =
+            (probed.message.usage.unwrap(), keeper.message.usage.unwrap());
+        assert_eq!(probed_usage.input_tokens, keeper_usage.input_tokens);
+        assert_eq!(probed_usage.output_tokens, keeper_usage.output_tokens);
+        assert_eq!(
+            probed_usage.cache_creation_input_tokens,
+            keeper_usage.cache_creation_input_tokens
+        );
+        assert_eq!(probed_usage.cache_read_input_tokens, keeper_usage.cache_read_input_tokens);
+        assert_eq!(probed.cost_usd, keeper.cost_usd);
+
+        // Alternative key spellings are left to the schema adapter
+        let snake = r#"{"timestamp":"2025-01-15T10:30:00Z","message":{"id":"msg_2"},"cost_usd":0.1,"request_id":"req_2"}"#;
+        assert!(KeeperIntegration::probe_usage_entry(snake.as_bytes()).is_none());
+
+        // Request id fallbacks resolve in the adapter's order
+        let uuid = r#"{"timestamp":"2025-01-15T10:30:00Z","message":{"id":"msg_3"},"messageId":"mid_3","uuid":"uuid_3"}"#;
+        let probed = KeeperIntegration::probe_usage_entry(uuid.as_bytes()).unwrap();
+        assert_eq!(probed.request_id, "uuid_3");
+        assert_eq!(probed.request_id, integration.parse_single_line(uuid).unwrap().request_id);
+
+        // Token counts beyond u32 are left to the schema adapter
+        let huge = r#"{"timestamp":"2025-01-15T10:30:00Z","message":{"usage":{"input_tokens":4294967296}},"requestId":"req_4"}"#;
+        assert!(KeeperIntegration::probe_usage_entry(huge.as_bytes()).is_none());
+    }
+
     #[test]  
     fn debug_claude_keeper_parsing() {
         // Set up debug logging for this test
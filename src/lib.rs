@@ -67,6 +67,7 @@ pub mod config;
 pub mod dedup;
 pub mod display;
 pub mod file_discovery;
+pub mod io_utils;
 pub mod logging;
 pub mod memory;
 pub mod models;
@@ -6,6 +6,7 @@
 use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::time::Duration;
 use tracing::{debug, info, warn};
 
 const LITELLM_PRICING_URL: &str = "https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json";
@@ -33,7 +34,10 @@ impl PricingCache {
     pub async fn fetch() -> Result<Self> {
         info!("Fetching model pricing from LiteLLM API");
         
-        let client = reqwest::Client::new();
+        let client = reqwest::Client::builder()
+            .timeout(Duration::from_secs(10))
+            .connect_timeout(Duration::from_secs(5))
+            .build()?;
         let response = client
             .get(LITELLM_PRICING_URL)
             .send()
@@ -60,31 +64,38 @@ impl PricingCache {
             return Some(pricing);
         }
         
-        // Try common variations and mappings
+        // Try common variations and mappings; names that normalize to
+        // themselves already missed above
         let normalized_name = self.normalize_model_name(model_name);
-        self.models.get(&normalized_name)
+        if normalized_name == model_name {
+            return None;
+        }
+        self.models.get(normalized_name)
     }
     
     /// Normalize model names to match LiteLLM's naming convention
-    fn normalize_model_name(&self, model_name: &str) -> String {
+    ///
+    /// Borrows instead of allocating, since every result is either a static
+    /// alias or the input itself.
+    fn normalize_model_name<'a>(&self, model_name: &'a str) -> &'a str {
         match model_name {
             // Claude 4 models - map to LiteLLM names
-            "claude-opus-4-1-20250805" => "claude-opus-4-1-20250805".to_string(),
-            "claude-sonnet-4-20250514" => "claude-sonnet-4-20250514".to_string(),
-            "opus-4" => "claude-opus-4-1-20250805".to_string(),
-            "sonnet-4" => "claude-sonnet-4-20250514".to_string(),
+            "claude-opus-4-1-20250805" => "claude-opus-4-1-20250805",
+            "claude-sonnet-4-20250514" => "claude-sonnet-4-20250514",
+            "opus-4" => "claude-opus-4-1-20250805",
+            "sonnet-4" => "claude-sonnet-4-20250514",
             
             // Claude 3.5 models
-            "claude-3-5-sonnet-20241022" => "claude-3-5-sonnet-20241022".to_string(),
-            "claude-3-5-sonnet-20240620" => "claude-3-5-sonnet-20240620".to_string(),
+            "claude-3-5-sonnet-20241022" => "claude-3-5-sonnet-20241022",
+            "claude-3-5-sonnet-20240620" => "claude-3-5-sonnet-20240620",
             
             // Claude 3 models
-            "claude-3-opus-20240229" => "claude-3-opus-20240229".to_string(),
-            "claude-3-sonnet-20240229" => "claude-3-sonnet-20240229".to_string(),
-            "claude-3-haiku-20240307" => "claude-3-haiku-20240307".to_string(),
+            "claude-3-opus-20240229" => "claude-3-opus-20240229",
+            "claude-3-sonnet-20240229" => "claude-3-sonnet-20240229",
+            "claude-3-haiku-20240307" => "claude-3-haiku-20240307",
             
             // Default fallback
-            _ => model_name.to_string(),
+            _ => model_name,
         }
     }
     
@@ -4,6 +4,8 @@
 //! files created by claude-keeper. This provides the initial state for live mode.
 
 use anyhow::{Context, Result};
+use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use std::time::{Duration, SystemTime};
 use tracing::{debug, info, warn};
 
@@ -11,14 +13,23 @@ use crate::config::get_config;
 use crate::live::BaselineSummary;
 use crate::parquet::reader::ParquetSummaryReader;
 
+/// claude-keeper's backup directory (`~/.claude-backup`), resolved once per
+/// process since it cannot change while the tool is running
+pub fn backup_dir() -> &'static Path {
+    static BACKUP_DIR: OnceLock<PathBuf> = OnceLock::new();
+    BACKUP_DIR.get_or_init(|| {
+        dirs::home_dir()
+            .unwrap_or_else(|| PathBuf::from("."))
+            .join(".claude-backup")
+    })
+}
+
 /// Load baseline summary from parquet backup files
 pub fn load_baseline_summary() -> Result<BaselineSummary> {
     let _config = get_config();
     
     // Get claude-keeper backup directory (uses ~/.claude-backup by default)
-    let backup_dir = dirs::home_dir()
-        .unwrap_or_else(|| std::path::PathBuf::from("."))
-        .join(".claude-backup");
+    let backup_dir = backup_dir();
     
     if !backup_dir.exists() {
         info!(
@@ -34,7 +45,7 @@ pub fn load_baseline_summary() -> Result<BaselineSummary> {
     );
 
     // Use the parquet reader to get summary data
-    let reader = ParquetSummaryReader::new(backup_dir)?;
+    let reader = ParquetSummaryReader::new(backup_dir.to_path_buf())?;
     let summary = reader.read_summary()?;
 
     info!(
@@ -49,6 +60,17 @@ pub fn load_baseline_summary() -> Result<BaselineSummary> {
 
 /// Trigger a backup via claude-keeper subprocess and reload baseline
 pub async fn refresh_baseline() -> Result<BaselineSummary> {
+    run_backup().await?;
+
+    // Reload the baseline data
+    load_baseline_summary()
+}
+
+/// Back up `~/.claude` into the backup directory via a claude-keeper subprocess
+///
+/// Callers that read the backup themselves use this directly instead of
+/// [`refresh_baseline`], which also reads every parquet file for the summary.
+pub async fn run_backup() -> Result<()> {
     info!("Refreshing baseline data via claude-keeper backup");
     
     // Get standard Claude paths
@@ -56,9 +78,7 @@ pub async fn refresh_baseline() -> Result<BaselineSummary> {
         .unwrap_or_else(|| std::path::PathBuf::from("."))
         .join(".claude");
     
-    let backup_dir = dirs::home_dir()
-        .unwrap_or_else(|| std::path::PathBuf::from("."))
-        .join(".claude-backup");
+    let backup_dir = backup_dir();
     
     // Execute claude-keeper backup command
     info!("Running claude-keeper backup from {} to {}", claude_dir.display(), backup_dir.display());
@@ -77,17 +97,14 @@ pub async fn refresh_baseline() -> Result<BaselineSummary> {
     
     info!("Successfully completed claude-keeper backup");
     println!("✅ Auto-backup completed successfully");
-    
-    // Reload the baseline data
-    load_baseline_summary()
+
+    Ok(())
 }
 
 /// Check if baseline should be refreshed (missing or stale)
 pub fn should_refresh_baseline() -> bool {
     let _config = get_config();
-    let backup_dir = dirs::home_dir()
-        .unwrap_or_else(|| std::path::PathBuf::from("."))
-        .join(".claude-backup");
+    let backup_dir = backup_dir();
     
     // If backup directory doesn't exist, we definitely need to refresh
     if !backup_dir.exists() {
@@ -103,13 +120,17 @@ pub fn should_refresh_baseline() -> bool {
         Ok(entries) => {
             for entry in entries.flatten() {
                 let path = entry.path();
-                if path.is_file() && 
-                   path.extension()
+                // Check the name first so only parquet files are stat'ed, and
+                // stat those once for both the file check and the mtime
+                if path.extension()
                        .and_then(|ext| ext.to_str())
                        .map(|ext| ext.eq_ignore_ascii_case("parquet"))
                        .unwrap_or(false)
                 {
                     if let Ok(metadata) = std::fs::metadata(&path) {
+                        if !metadata.is_file() {
+                            continue;
+                        }
                         if let Ok(modified) = metadata.modified() {
                             if let Ok(age) = now.duration_since(modified) {
                                 if age <= stale_threshold {
@@ -140,9 +161,7 @@ pub fn should_refresh_baseline() -> bool {
 pub async fn get_sql_analytics() -> Result<serde_json::Value> {
     info!("Running SQL analytics using claude-keeper query engine");
     
-    let backup_dir = dirs::home_dir()
-        .unwrap_or_else(|| std::path::PathBuf::from("."))
-        .join(".claude-backup");
+    let backup_dir = backup_dir();
     
     if !backup_dir.exists() {
         warn!("No backup directory found for SQL analytics");
@@ -48,13 +48,17 @@ impl LiveOrchestrator {
             // Check if we need to refresh baseline
             match should_refresh_baseline() {
                 true => {
-                    println!("📦 Creating baseline from conversation history...");
-                    println!("⏳ Running auto-backup (this may take 10-30 seconds)...");
+                    println!(
+                        "📦 Creating baseline from conversation history...\n\
+                         ⏳ Running auto-backup (this may take 10-30 seconds)..."
+                    );
                     info!("Refreshing baseline data (missing or stale)...");
                     
                     refresh_baseline().await.unwrap_or_else(|e| {
-                        println!("⚠️  Auto-backup encountered an issue, using existing data");
-                        println!("💡 Live monitoring will still work for new conversations");
+                        println!(
+                            "⚠️  Auto-backup encountered an issue, using existing data\n\
+                             💡 Live monitoring will still work for new conversations"
+                        );
                         warn!(error = %e, "Auto-backup failed, using existing baseline");
                         load_baseline_summary().unwrap_or_default()
                     })
@@ -68,8 +72,10 @@ impl LiveOrchestrator {
                         tokio::task::block_in_place(|| {
                             tokio::runtime::Handle::current().block_on(async {
                                 refresh_baseline().await.unwrap_or_else(|e| {
-                                    println!("❌ Backup creation failed - starting with empty baseline");
-                                    println!("💡 You'll see all new usage starting from now");
+                                    println!(
+                                        "❌ Backup creation failed - starting with empty baseline\n\
+                                         💡 You'll see all new usage starting from now"
+                                    );
                                     warn!(error = %e, "Fallback auto-backup also failed, using empty baseline");
                                     BaselineSummary::default()
                                 })
@@ -90,17 +96,28 @@ impl LiveOrchestrator {
 
     /// Run the live orchestrator
     pub async fn run(&mut self, tx: mpsc::Sender<LiveUpdate>) -> Result<()> {
-        // Show baseline summary to user
+        // Show baseline summary to user. Each message block is printed as one
+        // string so it reaches the line-buffered stdout in a single write
+        // rather than one write per line.
         if !self.no_baseline && (self.baseline.total_cost > 0.0 || self.baseline.total_tokens > 0) {
-            println!("📈 Baseline loaded successfully:");
-            println!("   💰 Total cost: ${:.2}", self.baseline.total_cost);
-            println!("   🎯 Total tokens: {}", format_tokens(self.baseline.total_tokens));
-            println!("   📅 Sessions today: {}", self.baseline.sessions_today);
+            let summary = format!(
+                "📈 Baseline loaded successfully:\n   \
+                 💰 Total cost: ${:.2}\n   \
+                 🎯 Total tokens: {}\n   \
+                 📅 Sessions today: {}\n\n",
+                self.baseline.total_cost,
+                format_tokens(self.baseline.total_tokens),
+                self.baseline.sessions_today
+            );
+            print!("{}", summary);
         } else if !self.no_baseline {
-            println!("🆕 Starting fresh - no previous usage data found");
-            println!("💡 New conversations will appear as you use Claude");
+            println!(
+                "🆕 Starting fresh - no previous usage data found\n\
+                 💡 New conversations will appear as you use Claude\n"
+            );
+        } else {
+            println!();
         }
-        println!();
         
         info!(
             baseline_cost = self.baseline.total_cost,
@@ -123,9 +140,10 @@ impl LiveOrchestrator {
                 Ok(Some(entry)) => {
                     // Show success message on first entry
                     if first_connection {
-                        println!("✅ Connected! Now monitoring live Claude usage...");
-                        println!("💡 Use new Claude conversations to see real-time updates");
-                        println!();
+                        println!(
+                            "✅ Connected! Now monitoring live Claude usage...\n\
+                             💡 Use new Claude conversations to see real-time updates\n"
+                        );
                         first_connection = false;
                     }
                     
@@ -172,29 +190,32 @@ impl LiveOrchestrator {
         );
 
         // Extract session information from the entry
-        let session_id = entry.message.id.clone();
-        
-        // For now, use a simple project path extraction
-        // In the future, this could be enhanced to use real project detection
-        let project_path = "unknown".to_string();
-
-        // Update or create session data
-        let session_data = self.sessions.entry(session_id.clone())
-            .or_insert_with(|| SessionData::new(session_id.clone(), project_path));
+        let session_id = &entry.message.id;
+
+        // Update or create session data; the id and project strings are only
+        // allocated the first time a session is seen
+        if !self.sessions.contains_key(session_id) {
+            // For now, use a simple project path extraction
+            // In the future, this could be enhanced to use real project detection
+            let project_path = "unknown".to_string();
+            self.sessions.insert(
+                session_id.clone(),
+                SessionData::new(session_id.clone(), project_path),
+            );
+        }
+        let session_data = self.sessions
+            .get_mut(session_id)
+            .expect("session was just inserted");
 
-        // Update session with new usage data
+        // Update session with new usage data, through the same accumulation
+        // the report path uses
         if let Some(usage) = &entry.message.usage {
-            session_data.input_tokens += usage.input_tokens;
-            session_data.output_tokens += usage.output_tokens;
-            session_data.cache_creation_tokens += usage.cache_creation_input_tokens;
-            session_data.cache_read_tokens += usage.cache_read_input_tokens;
-            
-            if let Some(cost) = entry.cost_usd {
-                session_data.total_cost += cost;
-            }
-            
-            session_data.models_used.insert(entry.message.model.clone());
-            session_data.last_activity = Some(entry.timestamp.clone());
+            session_data.add_usage(
+                &entry.message.model,
+                &entry.timestamp,
+                usage,
+                entry.cost_usd.unwrap_or(0.0),
+            );
         }
 
         // Create live update
@@ -221,10 +242,11 @@ impl LiveOrchestrator {
     #[allow(dead_code)]
     pub fn get_session_summary(&self) -> (usize, f64, u64) {
         let total_sessions = self.sessions.len();
-        let total_cost = self.baseline.total_cost + 
-            self.sessions.values().map(|s| s.total_cost).sum::<f64>();
-        let total_tokens = self.baseline.total_tokens +
-            self.sessions.values().map(|s| s.total_tokens() as u64).sum::<u64>();
+        // Cost and tokens accumulated together in one pass over the sessions
+        let (total_cost, total_tokens) = self.sessions.values().fold(
+            (self.baseline.total_cost, self.baseline.total_tokens),
+            |(cost, tokens), s| (cost + s.total_cost, tokens + s.total_tokens() as u64),
+        );
         
         (total_sessions, total_cost, total_tokens)
     }
@@ -7,15 +7,29 @@ use anyhow::{Context, Result};
 use serde_json;
 use std::process::Stdio;
 use tokio::io::{AsyncBufReadExt, BufReader};
-use tokio::process::{Child, Command};
+use tokio::process::{Child, ChildStdout, Command};
 use tracing::{debug, error, info, warn};
 
+use crate::io_utils::{contains_bytes, trim_ascii};
 use crate::live::LiveConfig;
 use crate::models::UsageEntry;
 
+/// Cheap byte-level check for lines that can hold a usage entry
+///
+/// `UsageEntry` requires both keys, so lines without them (status and
+/// progress output) are skipped without a JSON parse or a parse warning.
+fn is_usage_entry_line(line: &[u8]) -> bool {
+    contains_bytes(line, b"\"timestamp\"") && contains_bytes(line, b"\"requestId\"")
+}
+
 /// Manages claude-keeper subprocess for live usage monitoring
 pub struct KeeperWatcher {
     process: Option<Child>,
+    /// Buffered stdout of the running process, kept across reads so lines
+    /// already buffered are not dropped between entries
+    stdout: Option<BufReader<ChildStdout>>,
+    /// Reused line buffer
+    line: Vec<u8>,
     restart_count: u32,
     max_restarts: u32,
     config: LiveConfig,
@@ -26,6 +40,8 @@ impl KeeperWatcher {
     pub fn new(config: &LiveConfig) -> Result<Self> {
         let mut watcher = Self {
             process: None,
+            stdout: None,
+            line: Vec::new(),
             restart_count: 0,
             max_restarts: config.max_restart_attempts,
             config: config.clone(),
@@ -48,9 +64,14 @@ impl KeeperWatcher {
             .stderr(Stdio::piped())
             .stdin(Stdio::null());
 
-        let child = cmd.spawn()
+        let mut child = cmd.spawn()
             .with_context(|| format!("Failed to start claude-keeper process: {}", self.config.claude_keeper_path))?;
 
+        let stdout = child
+            .stdout
+            .take()
+            .context("No stdout available from claude-keeper process")?;
+        self.stdout = Some(BufReader::new(stdout));
         self.process = Some(child);
         
         debug!("Claude-keeper watch process started successfully");
@@ -59,46 +80,41 @@ impl KeeperWatcher {
 
     /// Get the next usage entry from claude-keeper
     pub async fn next_entry(&mut self) -> Result<Option<UsageEntry>> {
-        let process = self.process.as_mut()
+        let reader = self.stdout.as_mut()
             .context("No claude-keeper process running")?;
 
-        let stdout = process.stdout.as_mut()
-            .context("No stdout available from claude-keeper process")?;
-
-        let mut reader = BufReader::new(stdout);
-        let mut line = String::new();
-
         loop {
-            // Read the next line from stdout
-            match reader.read_line(&mut line).await {
+            // Read the next line from stdout as raw bytes; serde parses the
+            // slice directly without a separate UTF-8 pass into a String
+            self.line.clear();
+            match reader.read_until(b'\n', &mut self.line).await {
                 Ok(0) => {
                     // EOF reached, process finished
                     info!("Claude-keeper process finished (EOF)");
                     return Ok(None);
                 }
                 Ok(_) => {
-                    let trimmed = line.trim();
+                    let trimmed = trim_ascii(&self.line);
                     if trimmed.is_empty() {
-                        line.clear();
                         continue;
                     }
 
-                    debug!(line = %trimmed, "Received line from claude-keeper");
+                    debug!(line = %String::from_utf8_lossy(trimmed), "Received line from claude-keeper");
+
+                    if !is_usage_entry_line(trimmed) {
+                        continue;
+                    }
 
                     // Try to parse as JSON
-                    match serde_json::from_str::<UsageEntry>(trimmed) {
-                        Ok(entry) => {
-                            line.clear();
-                            return Ok(Some(entry));
-                        }
+                    match serde_json::from_slice::<UsageEntry>(trimmed) {
+                        Ok(entry) => return Ok(Some(entry)),
                         Err(e) => {
                             // Log parse error but continue processing
                             warn!(
                                 error = %e,
-                                line = %trimmed,
+                                line = %String::from_utf8_lossy(trimmed),
                                 "Failed to parse JSON from claude-keeper"
                             );
-                            line.clear();
                             continue;
                         }
                     }
@@ -133,6 +149,7 @@ impl KeeperWatcher {
         );
 
         // Kill existing process if it's still running
+        self.stdout = None;
         if let Some(mut process) = self.process.take() {
             let _ = process.kill().await;
         }
@@ -163,4 +180,18 @@ impl Drop for KeeperWatcher {
             let _ = process.start_kill();
         }
     }
-}
\ No newline at end of file
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_usage_entry_line_prefilter() {
+        assert!(!is_usage_entry_line(br#"{"status":"watching","files":3}"#));
+        assert!(!is_usage_entry_line(br#"{"timestamp":"2025-08-20T10:30:00Z"}"#));
+        assert!(is_usage_entry_line(
+            br#"{"timestamp":"2025-08-20T10:30:00Z","message":{"id":"m","model":"x"},"requestId":"r"}"#
+        ));
+    }
+}
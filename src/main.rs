@@ -8,6 +8,7 @@ mod commands;
 mod config;
 mod dedup;
 mod display;
+mod io_utils;
 mod keeper_integration;
 mod live;
 mod logging;
@@ -28,6 +29,10 @@ use dedup::ProcessOptions;
 struct Cli {
     #[command(subcommand)]
     command: Option<Commands>,
+    /// Threads used to parse files (default: one per CPU)
+    #[cfg(feature = "parallel")]
+    #[arg(long, global = true)]
+    workers: Option<usize>,
 }
 
 #[derive(Subcommand)]
@@ -85,19 +90,48 @@ enum Commands {
     },
 }
 
-#[tokio::main]
-async fn main() -> Result<()> {
-    // Load configuration first (this also validates it)
+fn main() -> Result<()> {
+    // Parse arguments before any other setup so --help, --version and usage
+    // errors exit without loading configuration or starting logging
+    let cli = Cli::parse();
+
+    // Load configuration (this also validates it)
     get_config();
 
     // Initialize logging with config
     logging::init_logging();
 
+    // Size the file parsing thread pool before any parallel work starts
+    #[cfg(feature = "parallel")]
+    {
+        let workers = cli.workers.unwrap_or(get_config().processing.workers);
+        rayon::ThreadPoolBuilder::new()
+            .num_threads(workers)
+            .build_global()
+            .context("Failed to start file parsing thread pool")?;
+    }
+
     // Initialize memory monitoring with config
     // memory::init_memory_limit(); // Removed to eliminate unused module warnings
 
-    let cli = Cli::parse();
+    // Only live mode runs concurrent tasks (and blocks inside one of them),
+    // so the worker thread pool is started for it alone; the report commands
+    // run on the current thread
+    let mut builder = if matches!(cli.command, Some(Commands::Live { .. })) {
+        tokio::runtime::Builder::new_multi_thread()
+    } else {
+        tokio::runtime::Builder::new_current_thread()
+    };
+    let runtime = builder
+        .enable_all()
+        .build()
+        .context("Failed to start async runtime")?;
+
+    runtime.block_on(run(cli))
+}
 
+/// Dispatch the parsed command
+async fn run(cli: Cli) -> Result<()> {
     // Handle command with its specific options
     match cli.command.unwrap_or(Commands::Daily {
         json: false,
@@ -309,10 +343,22 @@ fn parse_common_args(
     Ok((since_date, until_date, analyzer, options))
 }
 
+/// JSON body printed when a command fails in `--json` mode
+#[derive(serde::Serialize)]
+struct ErrorReport<'a> {
+    error: &'a str,
+}
+
 fn handle_error(e: anyhow::Error, json: bool) -> Result<(), anyhow::Error> {
     if json {
         error!(error = %e, "Command failed");
-        println!("{{\"error\": \"{}\"}}", e);
+        // Serialize rather than interpolate so quotes and newlines in the
+        // message are escaped and the output stays valid JSON. The report
+        // writer streams it to stdout pretty-printed, like the reports.
+        let message = e.to_string();
+        if reports::write_json(&ErrorReport { error: &message }).is_err() {
+            eprintln!("Error: {}", e);
+        }
     } else {
         error!(error = %e, "Command failed");
         eprintln!("Error: {}", e);
@@ -76,7 +76,7 @@ pub struct UsageData {
     pub cache_read_input_tokens: u32,
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Default)]
 pub struct DailyUsage {
     pub input_tokens: u32,
     pub output_tokens: u32,
@@ -203,6 +203,61 @@ impl SessionData {
     pub fn total_tokens(&self) -> u32 {
         self.input_tokens + self.output_tokens + self.cache_creation_tokens + self.cache_read_tokens
     }
+
+    /// Last component of the project path, borrowed from it with a single
+    /// scan from the end
+    pub fn project_name(&self) -> &str {
+        self.project_path.rsplit('/').next().unwrap_or(&self.project_path)
+    }
+
+    /// Add one message's usage to the session totals, without a day bucket.
+    ///
+    /// The activity timestamp reuses its existing buffer, and the model name
+    /// is only allocated the first time it is seen in this session.
+    pub fn add_usage(&mut self, model: &str, timestamp: &str, usage: &UsageData, cost: f64) {
+        self.input_tokens += usage.input_tokens;
+        self.output_tokens += usage.output_tokens;
+        self.cache_creation_tokens += usage.cache_creation_input_tokens;
+        self.cache_read_tokens += usage.cache_read_input_tokens;
+        self.total_cost += cost;
+
+        let last_activity = self.last_activity.get_or_insert_with(String::new);
+        last_activity.clear();
+        last_activity.push_str(timestamp);
+
+        if !self.models_used.contains(model) {
+            self.models_used.insert(model.to_string());
+        }
+    }
+
+    /// Add one message's usage to the session totals and to its day's bucket.
+    ///
+    /// Date keys are only allocated the first time they are seen in this
+    /// session.
+    pub fn record_usage(
+        &mut self,
+        date: &str,
+        model: &str,
+        timestamp: &str,
+        usage: &UsageData,
+        cost: f64,
+    ) -> &DailyUsage {
+        self.add_usage(model, timestamp, usage, cost);
+
+        if !self.daily_usage.contains_key(date) {
+            self.daily_usage.insert(date.to_string(), DailyUsage::default());
+        }
+        let daily = self
+            .daily_usage
+            .get_mut(date)
+            .expect("daily bucket was just inserted");
+        daily.input_tokens += usage.input_tokens;
+        daily.output_tokens += usage.output_tokens;
+        daily.cache_creation_tokens += usage.cache_creation_input_tokens;
+        daily.cache_read_tokens += usage.cache_read_input_tokens;
+        daily.cost += cost;
+        daily
+    }
 }
 
 impl From<SessionData> for SessionOutput {
@@ -228,6 +283,23 @@ impl From<SessionData> for SessionOutput {
     }
 }
 
+impl DailyUsage {
+    /// Sum of all four token fields for one day of a session
+    pub fn total_tokens(&self) -> u32 {
+        self.input_tokens + self.output_tokens + self.cache_creation_tokens + self.cache_read_tokens
+    }
+}
+
+impl UsageData {
+    /// Sum of all four token fields for one message
+    pub fn total(&self) -> u32 {
+        self.input_tokens
+            + self.output_tokens
+            + self.cache_creation_input_tokens
+            + self.cache_read_input_tokens
+    }
+}
+
 impl TokenCounts {
     #[allow(dead_code)]
     pub fn total(&self) -> u32 {
@@ -237,3 +309,68 @@ impl TokenCounts {
             + self.cache_read_input_tokens
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_record_usage_accumulates_session_and_day() {
+        let mut session = SessionData::new("s1".to_string(), "proj".to_string());
+        let usage = UsageData {
+            input_tokens: 10,
+            output_tokens: 20,
+            cache_creation_input_tokens: 3,
+            cache_read_input_tokens: 4,
+        };
+        assert_eq!(usage.total(), 37);
+
+        session.record_usage("2025-08-20", "claude-sonnet-4", "2025-08-20T10:00:00Z", &usage, 0.5);
+        session.record_usage("2025-08-20", "claude-sonnet-4", "2025-08-20T11:00:00Z", &usage, 0.5);
+        let daily = session.record_usage(
+            "2025-08-21",
+            "claude-opus-4",
+            "2025-08-21T09:00:00Z",
+            &usage,
+            1.0,
+        );
+        assert_eq!(daily.input_tokens, 10);
+
+        assert_eq!(session.total_tokens(), 111);
+        assert_eq!(session.total_cost, 2.0);
+        assert_eq!(session.last_activity.as_deref(), Some("2025-08-21T09:00:00Z"));
+        assert_eq!(session.models_used.len(), 2);
+        assert_eq!(session.daily_usage["2025-08-20"].output_tokens, 40);
+        assert_eq!(session.daily_usage["2025-08-20"].cost, 1.0);
+        assert_eq!(session.daily_usage["2025-08-21"].cache_read_tokens, 4);
+        assert_eq!(session.daily_usage["2025-08-20"].total_tokens(), 74);
+    }
+
+    #[test]
+    fn test_project_name_is_last_path_component() {
+        let session = SessionData::new("s".to_string(), "home/user/app".to_string());
+        assert_eq!(session.project_name(), "app");
+        let session = SessionData::new("s".to_string(), "app".to_string());
+        assert_eq!(session.project_name(), "app");
+    }
+
+    #[test]
+    fn test_add_usage_skips_daily_buckets() {
+        let mut session = SessionData::new("s1".to_string(), "proj".to_string());
+        let usage = UsageData {
+            input_tokens: 1,
+            output_tokens: 2,
+            cache_creation_input_tokens: 3,
+            cache_read_input_tokens: 4,
+        };
+
+        session.add_usage("claude-sonnet-4", "2025-08-20T10:00:00Z", &usage, 0.25);
+        session.add_usage("claude-sonnet-4", "2025-08-20T10:05:00Z", &usage, 0.25);
+
+        assert_eq!(session.total_tokens(), 20);
+        assert_eq!(session.total_cost, 0.5);
+        assert_eq!(session.last_activity.as_deref(), Some("2025-08-20T10:05:00Z"));
+        assert_eq!(session.models_used.len(), 1);
+        assert!(session.daily_usage.is_empty());
+    }
+}
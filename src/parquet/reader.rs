@@ -6,15 +6,98 @@
 use anyhow::{Context, Result};
 use chrono;
 use serde_json::Value;
+use std::borrow::Cow;
 use std::fs;
 use std::path::{Path, PathBuf};
 use std::time::{SystemTime, UNIX_EPOCH, Duration};
 use tracing::{debug, info, warn};
 
 
+use crate::io_utils::{is_dir_entry, is_file_entry};
 use crate::live::BaselineSummary;
 
-/// Read a parquet file using claude-keeper library and return JSON values directly
+/// Number of files decoded per batch
+///
+/// At least one file per thread in the parsing pool, so a batch keeps every
+/// thread busy however large `parallel_chunks` is configured.
+#[cfg(feature = "parallel")]
+fn read_batch_len() -> usize {
+    let chunks = crate::config::get_config().processing.parallel_chunks;
+    chunks.max(rayon::current_num_threads()).max(1)
+}
+
+/// Number of files decoded per batch
+#[cfg(not(feature = "parallel"))]
+fn read_batch_len() -> usize {
+    crate::config::get_config().processing.parallel_chunks.max(1)
+}
+
+/// Read a batch of parquet files, one task per file, preserving input order
+#[cfg(feature = "parallel")]
+fn read_parquet_batch(files: &[PathBuf]) -> Vec<Result<Vec<Value>>> {
+    use rayon::prelude::*;
+
+    files.par_iter().map(read_parquet_with_library).collect()
+}
+
+/// Read a batch of parquet files sequentially, preserving input order
+#[cfg(not(feature = "parallel"))]
+fn read_parquet_batch(files: &[PathBuf]) -> Vec<Result<Vec<Value>>> {
+    files.iter().map(read_parquet_with_library).collect()
+}
+
+/// Top-level message fields read when aggregating sessions
+const SESSION_FIELDS: &[&str] = &[
+    "timestamp",
+    "messageId",
+    "requestId",
+    "session_id",
+    "sessionId",
+    "project_name",
+    "projectName",
+    "usage",
+    "model",
+    "costUSD",
+    "cost_usd",
+    "message",
+];
+
+/// Fields of the nested `message` object read when aggregating sessions
+const MESSAGE_FIELDS: &[&str] = &["id", "usage", "model"];
+
+/// Drop everything session aggregation does not read (content blocks, tool
+/// results, metadata), so a decoded file holds only the usage fields of its
+/// messages until it is merged
+fn retain_usage_fields(value: &mut Value) {
+    if let Value::Object(map) = value {
+        map.retain(|key, _| SESSION_FIELDS.contains(&key.as_str()));
+        if let Some(Value::Object(message)) = map.get_mut("message") {
+            message.retain(|key, _| MESSAGE_FIELDS.contains(&key.as_str()));
+        }
+    }
+}
+
+/// Input, output, cache creation and cache read token counts of a usage
+/// object, read in one pass over its fields instead of a lookup per count
+fn usage_token_counts(usage: &Value) -> [u32; 4] {
+    let mut counts = [0u32; 4];
+    if let Value::Object(fields) = usage {
+        for (key, value) in fields {
+            let slot = match key.as_str() {
+                "input_tokens" => 0,
+                "output_tokens" => 1,
+                "cache_creation_input_tokens" => 2,
+                "cache_read_input_tokens" => 3,
+                _ => continue,
+            };
+            counts[slot] = value.as_u64().unwrap_or(0) as u32;
+        }
+    }
+    counts
+}
+
+/// Read a parquet file using claude-keeper library and return the usage
+/// fields of each message as JSON values
 fn read_parquet_with_library(parquet_file: &PathBuf) -> Result<Vec<serde_json::Value>> {
     debug!("Attempting to read parquet file: {}", parquet_file.display());
     
@@ -29,12 +112,12 @@ fn read_parquet_with_library(parquet_file: &PathBuf) -> Result<Vec<serde_json::V
                     Ok(results) => {
                         info!("Query returned {} objects from {}", results.objects.len(), parquet_file.display());
                         // Convert FlexObjects directly to JSON values
-                        let mut json_objects = Vec::new();
+                        let mut json_objects = Vec::with_capacity(results.objects.len());
                         let mut failed_conversions = 0;
                         let mut aug20_in_flexobjects = 0;
                         
                         for (i, flex_obj) in results.objects.iter().enumerate() {
-                            let json_val = flex_obj.to_json();
+                            let mut json_val = flex_obj.to_json();
                             
                             // Debug: print first object structure
                             if i == 0 {
@@ -74,7 +157,8 @@ fn read_parquet_with_library(parquet_file: &PathBuf) -> Result<Vec<serde_json::V
                                 }
                             }
                             
-                            // Add the JSON object directly
+                            // Keep only the fields the merge reads
+                            retain_usage_fields(&mut json_val);
                             json_objects.push(json_val);
                         }
                         
@@ -256,14 +340,16 @@ impl ParquetSummaryReader {
             let entry = entry.context("Failed to read directory entry")?;
             let path = entry.path();
             
-            if path.is_dir() {
+            // The entry's file type comes from the directory listing, so only
+            // symlinks need a stat
+            if is_dir_entry(&entry) {
                 // Recursively search subdirectories
                 self.find_parquet_files_recursive(&path, files)?;
-            } else if path.is_file() && 
-               path.extension()
+            } else if path.extension()
                    .and_then(|ext| ext.to_str())
                    .map(|ext| ext.eq_ignore_ascii_case("parquet"))
                    .unwrap_or(false)
+                && is_file_entry(&entry)
             {
                 files.push(path);
             }
@@ -299,9 +385,11 @@ impl ParquetSummaryReader {
 
     /// Read detailed session data for daily/monthly analysis
     pub fn read_detailed_sessions(&self) -> Result<Vec<crate::models::SessionOutput>> {
-        use crate::models::{SessionData, SessionOutput, DailyUsage};
+        use crate::dedup::{dedup_key, DedupKeySet};
+        use crate::models::{SessionData, SessionOutput, UsageData};
+        use crate::pricing::{cost_dot, simple_rates};
         use crate::timestamp_parser::TimestampParser;
-        use std::collections::{HashMap, HashSet};
+        use std::collections::HashMap;
         
         info!(
             backup_dir = %self.backup_dir.display(),
@@ -320,11 +408,27 @@ impl ParquetSummaryReader {
         let total_files = parquet_files.len();
         info!(file_count = total_files, "Processing parquet files for detailed sessions");
 
-        // Map to aggregate sessions across all files
-        let mut sessions_map: HashMap<String, SessionData> = HashMap::new();
+        // Sessions aggregated across all files, stored densely in first-seen
+        // order and found through a compact index. Messages of one session
+        // arrive in runs, so the last index is checked before hashing the id
+        let mut sessions_data: Vec<SessionData> = Vec::new();
+        let mut session_index: HashMap<String, usize> = HashMap::new();
+        let mut last_session: Option<usize> = None;
         
-        // Set for deduplication using messageId:requestId (like ccusage)
-        let mut seen_messages: HashSet<String> = HashSet::new();
+        // Set for deduplication using hashed messageId:requestId keys (like ccusage)
+        let mut seen_messages = DedupKeySet::default();
+
+        // Hardcoded rate vector per model name, resolved on first sight
+        let mut rates_by_model: HashMap<String, &'static [f64; 4]> = HashMap::new();
+
+        // Model priced most recently and its rates. Consecutive messages
+        // usually share a model, so the map is only consulted on a change
+        let mut last_priced_model = String::new();
+        let mut last_rates: Option<&'static [f64; 4]> = None;
+
+        // Day that messages with unparseable timestamps are attributed to,
+        // taken once per read instead of once per such message
+        let fallback_date = chrono::Utc::now().date_naive().to_string();
         
         // Debug counters
         let mut total_messages_seen = 0;
@@ -333,14 +437,17 @@ impl ParquetSummaryReader {
         let mut messages_with_usage = 0;
         let mut aug20_messages = 0;
 
+        // Decode files a batch at a time (in parallel when enabled) but merge
+        // them strictly in file order so dedup keeps the same first occurrence
+        let file_reads = parquet_files.chunks(read_batch_len()).flat_map(read_parquet_batch);
+
         // Process each parquet file
-        for (file_idx, parquet_file) in parquet_files.iter().enumerate() {
+        for (file_idx, (parquet_file, file_read)) in parquet_files.iter().zip(file_reads).enumerate() {
             debug!(file = %parquet_file.display(), "Reading messages from parquet file {}/{}", 
                    file_idx + 1, parquet_files.len());
             
             // Use claude-keeper library directly to read parquet data
-            info!("About to read parquet file: {}", parquet_file.display());
-            let messages: Vec<Value> = match read_parquet_with_library(parquet_file) {
+            let messages: Vec<Value> = match file_read {
                 Ok(data) => {
                     info!(file = %parquet_file.display(), "Successfully read {} messages from parquet", data.len());
                     data
@@ -363,22 +470,9 @@ impl ParquetSummaryReader {
             debug!(file = %parquet_file.display(), 
                    "Processing {} messages from parquet", messages.len());
             
-            // Count Aug 20 messages before processing
-            let aug20_before_processing = messages.iter()
-                .filter(|msg| {
-                    msg.get("timestamp")
-                        .and_then(|v| v.as_str())
-                        .map(|s| s.contains("2025-08-20"))
-                        .unwrap_or(false)
-                })
-                .count();
-            
-            if aug20_before_processing > 0 {
-                info!(file = %parquet_file.display(),
-                      "Found {} Aug 20 messages in parsed JSON array (before processing loop)", 
-                      aug20_before_processing);
-            }
-            
+            // Aug 20 messages are tallied inside the processing loop, where
+            // each message's timestamp is already looked up; the per-file log
+            // below reports their total alongside the skip reasons
             let mut file_aug20 = 0;
             let mut file_aug20_skipped_no_usage = 0;
             let mut file_aug20_skipped_dedup = 0;
@@ -389,8 +483,12 @@ impl ParquetSummaryReader {
                 total_messages_seen += 1;
                 file_total_processed += 1;
                 
+                // Look the nested message object up once; id, usage and model
+                // all live under it
+                let message = msg.get("message");
+
                 // Extract message ID and request ID for deduplication
-                let message_id = msg.get("message")
+                let message_id = message
                     .and_then(|m| m.get("id"))
                     .or_else(|| msg.get("messageId"))
                     .and_then(|v| v.as_str());
@@ -407,17 +505,15 @@ impl ParquetSummaryReader {
                 // Apply ccusage's actual deduplication approach:
                 // Try to deduplicate when both IDs available, but don't require them
                 if let (Some(mid), Some(rid)) = (message_id, request_id) {
-                    let dedup_key = format!("{}:{}", mid, rid);
-                    if seen_messages.contains(&dedup_key) {
+                    if !seen_messages.insert(dedup_key(mid, rid)) {
                         // Skip duplicate message
                         deduplicated_count += 1;
                         if is_aug20 {
                             file_aug20_skipped_dedup += 1;
-                            debug!("Skipping duplicate Aug 20 message: {}", dedup_key);
+                            debug!("Skipping duplicate Aug 20 message: {}:{}", mid, rid);
                         }
                         continue;
                     }
-                    seen_messages.insert(dedup_key);
                 } else {
                     // Count messages without dedup keys but still process them
                     no_dedup_key_count += 1;
@@ -427,27 +523,30 @@ impl ParquetSummaryReader {
                 let session_id = msg.get("session_id")
                     .or_else(|| msg.get("sessionId"))
                     .and_then(|v| v.as_str())
-                    .unwrap_or("unknown")
-                    .to_string();
+                    .unwrap_or("unknown");
 
                 let project_name = msg.get("project_name")
                     .or_else(|| msg.get("projectName"))
                     .and_then(|v| v.as_str())
-                    .unwrap_or("default")
-                    .to_string();
+                    .unwrap_or("default");
                 
                 // Get usage data - check message field first (where it actually is)
-                let usage = msg.get("message")
-                    .and_then(|m| m.get("usage"))
-                    .or_else(|| msg.get("usage"));
-                
                 // Skip if no usage data (like ccusage does)
-                if usage.is_none() {
-                    if is_aug20 {
-                        file_aug20_skipped_no_usage += 1;
+                let usage = match message
+                    .and_then(|m| m.get("usage"))
+                    .or_else(|| msg.get("usage"))
+                {
+                    Some(usage) => usage,
+                    None => {
+                        if is_aug20 {
+                            file_aug20_skipped_no_usage += 1;
+                        }
+                        continue;
                     }
-                    continue;
-                }
+                };
+                let token_counts = usage_token_counts(usage);
+                let [input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens] =
+                    token_counts;
                 
                 // Only count Aug 20 messages that have usage and weren't skipped
                 if is_aug20 {
@@ -462,31 +561,11 @@ impl ParquetSummaryReader {
                     }
                 }
 
-                let input_tokens = usage
-                    .and_then(|u| u.get("input_tokens"))
-                    .and_then(|v| v.as_u64())
-                    .unwrap_or(0) as u32;
-
-                let output_tokens = usage
-                    .and_then(|u| u.get("output_tokens"))
-                    .and_then(|v| v.as_u64())
-                    .unwrap_or(0) as u32;
-                
                 // ccusage doesn't filter messages based on token counts
                 // It processes ALL messages that have valid structure and usage data
                 // Even messages with zero tokens are included in calculations
                 
                 messages_with_usage += 1;
-
-                let cache_creation_tokens = usage
-                    .and_then(|u| u.get("cache_creation_input_tokens"))
-                    .and_then(|v| v.as_u64())
-                    .unwrap_or(0) as u32;
-
-                let cache_read_tokens = usage
-                    .and_then(|u| u.get("cache_read_input_tokens"))
-                    .and_then(|v| v.as_u64())
-                    .unwrap_or(0) as u32;
                 
                 // Debug: Log Aug 20 token extraction
                 if is_aug20 && aug20_messages <= 5 {
@@ -494,7 +573,7 @@ impl ParquetSummaryReader {
                           aug20_messages, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens);
                 }
 
-                let model = msg.get("message")
+                let model = message
                     .and_then(|m| m.get("model"))
                     .or_else(|| msg.get("model"))
                     .and_then(|v| v.as_str())
@@ -506,55 +585,73 @@ impl ParquetSummaryReader {
                     cost_val.as_f64().unwrap_or(0.0)
                 } else {
                     // Use hardcoded pricing as fallback since LiteLLM pricing is async
-                    // In the future, we could pre-fetch pricing data to avoid this
-                    crate::pricing::calculate_cost_simple(
-                        model,
-                        input_tokens,
-                        output_tokens,
-                        cache_creation_tokens,
-                        cache_read_tokens
-                    )
+                    // In the future, we could pre-fetch pricing data to avoid this.
+                    // The model's rates are resolved once and reused for later entries.
+                    let rates = match last_rates {
+                        Some(rates) if last_priced_model == model => rates,
+                        _ => {
+                            let rates = match rates_by_model.get(model) {
+                                Some(&rates) => rates,
+                                None => {
+                                    let rates = simple_rates(model);
+                                    rates_by_model.insert(model.to_string(), rates);
+                                    rates
+                                }
+                            };
+                            last_priced_model.clear();
+                            last_priced_model.push_str(model);
+                            last_rates = Some(rates);
+                            rates
+                        }
+                    };
+                    cost_dot(token_counts, rates)
                 };
 
-                // Parse date for daily aggregation
-                let date_str = if let Ok(ts) = TimestampParser::parse(timestamp_str) {
-                    ts.format("%Y-%m-%d").to_string()
-                } else {
-                    // Log when we can't parse timestamp
-                    if timestamp_str.contains("2025-08-20") {
-                        debug!("Failed to parse Aug 20 timestamp: {}", timestamp_str);
-                    }
-                    chrono::Utc::now().format("%Y-%m-%d").to_string()
+                // Date key for daily aggregation, borrowed from the timestamp
+                // itself for UTC timestamps so no string is built per message
+                let date_str: Cow<str> = match TimestampParser::utc_date_prefix(timestamp_str) {
+                    Some(date) => Cow::Borrowed(date),
+                    None => match TimestampParser::parse_date(timestamp_str) {
+                        Ok(date) => Cow::Owned(date),
+                        Err(_) => {
+                            // Log when we can't parse timestamp
+                            if is_aug20 {
+                                debug!("Failed to parse Aug 20 timestamp: {}", timestamp_str);
+                            }
+                            Cow::Borrowed(fallback_date.as_str())
+                        }
+                    },
                 };
 
-                // Get or create session
-                let session = sessions_map.entry(session_id.clone())
-                    .or_insert_with(|| SessionData::new(session_id.clone(), project_name.clone()));
-
-                // Update session totals
-                session.input_tokens += input_tokens;
-                session.output_tokens += output_tokens;
-                session.cache_creation_tokens += cache_creation_tokens;
-                session.cache_read_tokens += cache_read_tokens;
-                session.total_cost += cost;
-                session.last_activity = Some(timestamp_str.to_string());
-                session.models_used.insert(model.to_string());
-
-                // Update daily usage
-                let daily = session.daily_usage.entry(date_str.clone())
-                    .or_insert_with(|| DailyUsage {
-                        input_tokens: 0,
-                        output_tokens: 0,
-                        cache_creation_tokens: 0,
-                        cache_read_tokens: 0,
-                        cost: 0.0,
-                    });
-                
-                daily.input_tokens += input_tokens;
-                daily.output_tokens += output_tokens;
-                daily.cache_creation_tokens += cache_creation_tokens;
-                daily.cache_read_tokens += cache_read_tokens;
-                daily.cost += cost;
+                // Get or create session; ids are only allocated for new sessions
+                let idx = match last_session {
+                    Some(idx) if sessions_data[idx].session_id == session_id => idx,
+                    _ => {
+                        let idx = match session_index.get(session_id) {
+                            Some(&idx) => idx,
+                            None => {
+                                session_index.insert(session_id.to_string(), sessions_data.len());
+                                sessions_data.push(SessionData::new(
+                                    session_id.to_string(),
+                                    project_name.to_string(),
+                                ));
+                                sessions_data.len() - 1
+                            }
+                        };
+                        last_session = Some(idx);
+                        idx
+                    }
+                };
+                let session = &mut sessions_data[idx];
+
+                // Update session totals and daily usage
+                let tokens = UsageData {
+                    input_tokens,
+                    output_tokens,
+                    cache_creation_input_tokens: cache_creation_tokens,
+                    cache_read_input_tokens: cache_read_tokens,
+                };
+                let daily = session.record_usage(&date_str, model, timestamp_str, &tokens, cost);
                 
                 // Debug: Track Aug 20 cost accumulation
                 if date_str == "2025-08-20" {
@@ -577,14 +674,14 @@ impl ParquetSummaryReader {
         }
 
         // Convert to SessionOutput format
-        let mut sessions: Vec<SessionOutput> = sessions_map
+        // Session id and project were resolved when each session was first
+        // seen, so this only moves the aggregated fields into place
+        let mut sessions: Vec<SessionOutput> = sessions_data
             .into_iter()
-            .map(|(_, session_data)| {
+            .map(|session_data| {
                 // Debug: Log sessions with Aug 20 data
-                if session_data.daily_usage.contains_key("2025-08-20") {
-                    let aug20_cost = session_data.daily_usage.get("2025-08-20")
-                        .map(|d| d.cost)
-                        .unwrap_or(0.0);
+                if let Some(aug20) = session_data.daily_usage.get("2025-08-20") {
+                    let aug20_cost = aug20.cost;
                     info!(
                         "Session {} has Aug 20 data: ${:.2} (total session cost: ${:.2})",
                         &session_data.session_id[..20.min(session_data.session_id.len())],
@@ -118,7 +118,8 @@ pub struct ProcessedEntry {
 impl ProcessedEntry {
     pub fn new(entry: UsageEntry, parser: &FileParser, line_number: usize) -> Result<Self> {
         let timestamp = parser.parse_timestamp(&entry.timestamp)?;
-        let date = timestamp.format("%Y-%m-%d").to_string();
+        // NaiveDate's Display is YYYY-MM-DD and skips parsing a format string
+        let date = timestamp.date_naive().to_string();
         let total_tokens = Self::calculate_total_tokens(&entry);
 
         Ok(Self {
@@ -131,14 +132,7 @@ impl ProcessedEntry {
     }
 
     fn calculate_total_tokens(entry: &UsageEntry) -> u32 {
-        if let Some(usage) = &entry.message.usage {
-            usage.input_tokens
-                + usage.output_tokens
-                + usage.cache_creation_input_tokens
-                + usage.cache_read_input_tokens
-        } else {
-            0
-        }
+        entry.message.usage.as_ref().map_or(0, UsageData::total)
     }
 
     pub fn input_tokens(&self) -> u32 {
@@ -84,7 +84,8 @@
 //! ## Integration Points
 //!
 //! The pricing manager integrates with:
-//! - [`crate::dedup::DeduplicationEngine`] for cost calculation during processing
+//! - [`crate::ccusage_compat`] and [`crate::parquet::reader`] for cost calculation
+//!   during processing
 //! - [`crate::models::UsageData`] for token consumption data
 //! - External LiteLLM pricing API for current rates
 
@@ -225,30 +226,63 @@ impl PricingManager {
             None => return 0.0,
         };
 
-        let mut cost = 0.0;
+        cost_dot(
+            [
+                usage.input_tokens,
+                usage.output_tokens,
+                usage.cache_creation_input_tokens,
+                usage.cache_read_input_tokens,
+            ],
+            &pricing.rates(),
+        )
+    }
+}
 
-        // Input tokens cost
-        if let Some(input_cost) = pricing.input_cost_per_token {
-            cost += usage.input_tokens as f64 * input_cost;
-        }
+/// Per-token rates in `[input, output, cache_creation, cache_read]` order
+pub static OPUS_RATES: [f64; 4] = [0.000015, 0.000075, 0.00001875, 0.000001875]; // $15/$75/$18.75/$1.875 per 1M tokens
+pub static SONNET_RATES: [f64; 4] = [0.000003, 0.000015, 0.00000375, 0.0000003]; // $3/$15/$3.75/$0.30 per 1M tokens
+static HAIKU_RATES: [f64; 4] = [0.00000025, 0.00000125, 0.0000003125, 0.000000025];
 
-        // Output tokens cost
-        if let Some(output_cost) = pricing.output_cost_per_token {
-            cost += usage.output_tokens as f64 * output_cost;
-        }
+/// Rate vectors by model family, matched against the model name in this
+/// order; names that match no family are priced as Sonnet
+static FAMILY_RATES: [(&str, &[f64; 4]); 3] = [
+    ("opus", &OPUS_RATES),
+    ("sonnet", &SONNET_RATES),
+    ("haiku", &HAIKU_RATES),
+];
 
-        // Cache creation tokens cost
-        if let Some(cache_creation_cost) = pricing.cache_creation_input_token_cost {
-            cost += usage.cache_creation_input_tokens as f64 * cache_creation_cost;
-        }
+impl PricingData {
+    /// Flatten into a rate vector; missing prices are treated as free
+    pub fn rates(&self) -> [f64; 4] {
+        [
+            self.input_cost_per_token.unwrap_or(0.0),
+            self.output_cost_per_token.unwrap_or(0.0),
+            self.cache_creation_input_token_cost.unwrap_or(0.0),
+            self.cache_read_input_token_cost.unwrap_or(0.0),
+        ]
+    }
+}
 
-        // Cache read tokens cost
-        if let Some(cache_read_cost) = pricing.cache_read_input_token_cost {
-            cost += usage.cache_read_input_tokens as f64 * cache_read_cost;
-        }
+/// Cost as the dot product of a token vector and a rate vector
+#[inline]
+pub fn cost_dot(tokens: [u32; 4], rates: &[f64; 4]) -> f64 {
+    tokens
+        .iter()
+        .zip(rates.iter())
+        .map(|(&t, &r)| t as f64 * r)
+        .sum()
+}
 
-        cost
-    }
+/// Hardcoded rate vector for a model, chosen by family from its name
+///
+/// The choice depends only on the model name, so callers pricing many
+/// entries can resolve it once per model and reuse the result.
+pub fn simple_rates(model: &str) -> &'static [f64; 4] {
+    // Use hardcoded pricing based on model family - updated to match LiteLLM pricing
+    FAMILY_RATES
+        .iter()
+        .find(|(family, _)| model.contains(family))
+        .map_or(&SONNET_RATES, |&(_, rates)| rates)
 }
 
 /// Simple synchronous cost calculation using hardcoded pricing
@@ -260,35 +294,50 @@ pub fn calculate_cost_simple(
     cache_creation_tokens: u32,
     cache_read_tokens: u32,
 ) -> f64 {
-    // Use hardcoded pricing based on model name - updated to match LiteLLM pricing
-    let (input_cost_per_token, output_cost_per_token, cache_creation_cost, cache_read_cost) = 
-        if model.contains("opus-4") || model.contains("claude-opus-4") {
-            // Claude 4 Opus pricing from LiteLLM
-            (0.000015, 0.000075, 0.00001875, 0.000001875) // $15/$75/$18.75/$1.875 per 1M tokens
-        } else if model.contains("sonnet-4") || model.contains("claude-sonnet-4") {
-            // Claude 4 Sonnet pricing (similar to Opus)
-            (0.000003, 0.000015, 0.00000375, 0.0000003) // $3/$15/$3.75/$0.30 per 1M tokens
-        } else if model.contains("opus") {
-            // Claude 3 Opus
-            (0.000015, 0.000075, 0.00001875, 0.000001875)
-        } else if model.contains("sonnet") {
-            // Claude 3.5 Sonnet
-            (0.000003, 0.000015, 0.00000375, 0.0000003)
-        } else if model.contains("haiku") {
-            // Claude 3 Haiku
-            (0.00000025, 0.00000125, 0.0000003125, 0.000000025)
-        } else {
-            // Default to Sonnet pricing
-            (0.000003, 0.000015, 0.00000375, 0.0000003)
+    cost_dot(
+        [
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens,
+            cache_read_tokens,
+        ],
+        simple_rates(model),
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_cost_dot_matches_scalar_sum() {
+        let cost = cost_dot([1000, 2000, 500, 1500], &OPUS_RATES);
+        let expected =
+            1000.0 * 0.000015 + 2000.0 * 0.000075 + 500.0 * 0.00001875 + 1500.0 * 0.000001875;
+        assert!((cost - expected).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_missing_rates_are_free() {
+        let pricing = PricingData {
+            input_cost_per_token: Some(3e-06),
+            output_cost_per_token: None,
+            cache_creation_input_token_cost: None,
+            cache_read_input_token_cost: None,
         };
-    
-    let mut cost = 0.0;
-    cost += input_tokens as f64 * input_cost_per_token;
-    cost += output_tokens as f64 * output_cost_per_token;
-    
-    // Cache tokens use specific cache pricing
-    cost += cache_creation_tokens as f64 * cache_creation_cost;
-    cost += cache_read_tokens as f64 * cache_read_cost;
-    
-    cost
+        assert_eq!(pricing.rates(), [3e-06, 0.0, 0.0, 0.0]);
+        assert!((cost_dot([1000, 1000, 1000, 1000], &pricing.rates()) - 0.003).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_calculate_cost_simple_model_selection() {
+        let haiku = calculate_cost_simple("claude-3-haiku", 1_000_000, 0, 0, 0);
+        assert!((haiku - 0.25).abs() < 1e-9);
+        let opus = calculate_cost_simple("claude-opus-4-20250514", 0, 1_000_000, 0, 0);
+        assert!((opus - 75.0).abs() < 1e-9);
+        let sonnet = calculate_cost_simple("claude-3-5-sonnet", 0, 0, 0, 1_000_000);
+        assert!((sonnet - 0.3).abs() < 1e-9);
+        let unknown = calculate_cost_simple("unknown-model", 1_000_000, 0, 0, 0);
+        assert!((unknown - 3.0).abs() < 1e-9);
+    }
 }
@@ -98,9 +98,41 @@
 
 use crate::models::*;
 use colored::Colorize;
+use serde::Serialize;
 use std::collections::{HashMap, HashSet};
+use std::io::{self, BufWriter, Write};
 use tracing::{debug, info};
 
+#[derive(Serialize)]
+struct DailyReport<'a> {
+    daily: &'a [DailyData],
+}
+
+#[derive(Serialize)]
+struct MonthlyReport<'a> {
+    monthly: &'a [MonthlyData],
+}
+
+/// Serialize a report straight into locked stdout, skipping the intermediate
+/// `Value` tree and pretty-printed `String`
+///
+/// Stdout is line-buffered, so output goes through a `BufWriter` to avoid a
+/// write per line of pretty-printed JSON.
+pub(crate) fn write_json<T: Serialize>(report: &T) -> io::Result<()> {
+    let mut out = BufWriter::new(io::stdout().lock());
+    write_json_to(&mut out, report)?;
+    out.flush()
+}
+
+/// Serialize a report as pretty-printed JSON followed by a newline
+fn write_json_to<W: Write, T: Serialize>(out: &mut W, report: &T) -> io::Result<()> {
+    serde_json::to_writer_pretty(&mut *out, report)?;
+    out.write_all(b"\n")
+}
+
+/// Width of the rules above and below each report title
+const BANNER_WIDTH: usize = 80;
+
 pub struct ReportDisplayManager;
 
 impl Default for ReportDisplayManager {
@@ -118,45 +150,59 @@ impl ReportDisplayManager {
         let daily_data = self.process_daily_with_projects(data, limit);
 
         if json_output {
-            let output = serde_json::json!({"daily": daily_data});
-            match serde_json::to_string_pretty(&output) {
-                Ok(json_str) => println!("{}", json_str),
-                Err(e) => {
-                    eprintln!("Error serializing daily data to JSON: {}", e);
-                    return;
-                }
+            if let Err(e) = write_json(&DailyReport { daily: &daily_data }) {
+                eprintln!("Error serializing daily data to JSON: {}", e);
             }
             return;
         }
 
-        println!("\n{}", "=".repeat(80).bright_cyan());
-        println!(
-            "{}",
-            "Claude Code Usage Report - Daily with Project Breakdown (All Instances)"
-                .bright_white()
-                .bold()
-        );
-        println!("{}", "=".repeat(80).bright_cyan());
+        let mut out = BufWriter::new(io::stdout().lock());
+        if let Err(e) = Self::write_daily(&mut out, &daily_data).and_then(|_| out.flush()) {
+            eprintln!("Error writing daily report: {}", e);
+        }
+    }
 
-        let total_cost: f64 = daily_data.iter().map(|d| d.total_cost).sum();
-        let total_sessions: u32 = daily_data.iter().map(|d| d.total_sessions).sum();
+    /// Write a report title between two full-width rules; the coloured rule
+    /// is built once and written twice
+    fn write_banner(out: &mut impl Write, title: &str) -> io::Result<()> {
+        let rule = "=".repeat(BANNER_WIDTH).bright_cyan();
+        writeln!(out, "\n{}", rule)?;
+        writeln!(out, "{}", title.bright_white().bold())?;
+        writeln!(out, "{}", rule)
+    }
 
-        println!(
+    /// Write the daily report through a buffered writer so it reaches stdout
+    /// in a few large writes instead of one per line
+    fn write_daily(out: &mut impl Write, daily_data: &[DailyData]) -> io::Result<()> {
+        Self::write_banner(
+            out,
+            "Claude Code Usage Report - Daily with Project Breakdown (All Instances)",
+        )?;
+
+        // Both totals in one pass over the days
+        let (total_cost, total_sessions) =
+            daily_data.iter().fold((0.0, 0u32), |(cost, sessions), d| {
+                (cost + d.total_cost, sessions + d.total_sessions)
+            });
+
+        writeln!(
+            out,
             "\n{} {} days • {} sessions • {} total\n",
             "📊".bright_yellow(),
             daily_data.len().to_string().bright_white().bold(),
             total_sessions.to_string().bright_white().bold(),
             format!("${:.2}", total_cost).bright_green().bold()
-        );
+        )?;
 
-        for day in &daily_data {
-            println!(
+        for day in daily_data {
+            writeln!(
+                out,
                 "{} {} — {} ({} sessions)",
                 "📅".bright_blue(),
                 day.date.bright_white().bold(),
                 format!("${:.2}", day.total_cost).bright_green().bold(),
                 format!("{}", day.total_sessions).bright_white()
-            );
+            )?;
 
             // Show all projects
             for project in &day.projects {
@@ -165,76 +211,93 @@ impl ReportDisplayManager {
                 } else {
                     0.0
                 };
-                println!(
+                writeln!(
+                    out,
                     "   {}: {} ({}%, {} sessions)",
                     project.project.bright_cyan(),
                     format!("${:.2}", project.total_cost).bright_green(),
                     format!("{:.0}", percentage).bright_yellow(),
                     format!("{}", project.sessions).bright_white()
-                );
+                )?;
             }
 
-            println!(); // Empty line
+            writeln!(out)?; // Empty line
         }
+
+        Ok(())
     }
 
     pub fn display_monthly(&self, data: &[SessionOutput], limit: Option<usize>, json_output: bool) {
         let monthly_data = self.process_monthly_data(data, limit);
 
         if json_output {
-            let output = serde_json::json!({"monthly": monthly_data});
-            match serde_json::to_string_pretty(&output) {
-                Ok(json_str) => println!("{}", json_str),
-                Err(e) => {
-                    eprintln!("Error serializing monthly data to JSON: {}", e);
-                    return;
-                }
+            if let Err(e) = write_json(&MonthlyReport {
+                monthly: &monthly_data,
+            }) {
+                eprintln!("Error serializing monthly data to JSON: {}", e);
             }
             return;
         }
 
-        println!("\n{}", "=".repeat(80).bright_cyan());
-        println!(
-            "{}",
-            "Claude Code Usage Report - Monthly (All Instances)"
-                .bright_white()
-                .bold()
-        );
-        println!("{}", "=".repeat(80).bright_cyan());
-
-        let total_cost: f64 = monthly_data.iter().map(|m| m.total_cost).sum();
-        let total_sessions: u32 = monthly_data.iter().map(|m| m.total_sessions).sum();
+        let mut out = BufWriter::new(io::stdout().lock());
+        if let Err(e) = Self::write_monthly(&mut out, &monthly_data, limit).and_then(|_| out.flush()) {
+            eprintln!("Error writing monthly report: {}", e);
+        }
+    }
 
-        println!("\n{} Total Usage Summary:", "📊".bright_yellow());
-        println!(
+    /// Write the monthly report through a buffered writer
+    fn write_monthly(
+        out: &mut impl Write,
+        monthly_data: &[MonthlyData],
+        limit: Option<usize>,
+    ) -> io::Result<()> {
+        Self::write_banner(out, "Claude Code Usage Report - Monthly (All Instances)")?;
+
+        // Both totals in one pass over the months
+        let (total_cost, total_sessions) = monthly_data
+            .iter()
+            .fold((0.0, 0u32), |(cost, sessions), m| {
+                (cost + m.total_cost, sessions + m.total_sessions)
+            });
+
+        writeln!(out, "\n{} Total Usage Summary:", "📊".bright_yellow())?;
+        writeln!(
+            out,
             "   Records: {}",
             monthly_data.len().to_string().bright_white().bold()
-        );
-        println!(
+        )?;
+        writeln!(
+            out,
             "   Total Cost: {}",
             format!("${:.2}", total_cost).bright_green().bold()
-        );
-        println!(
+        )?;
+        writeln!(
+            out,
             "   Total Sessions: {}",
             total_sessions.to_string().bright_white().bold()
-        );
-        println!();
+        )?;
+        writeln!(out)?;
 
         let display_limit = limit.unwrap_or(10);
-        let recent_data: Vec<_> = monthly_data.iter().rev().take(display_limit).collect();
-        println!(
+        // Months are sorted oldest first, so the recent ones are a tail slice
+        let recent_data = &monthly_data[monthly_data.len().saturating_sub(display_limit)..];
+        writeln!(
+            out,
             "{} Recent monthly usage (last {}):",
             "📅".bright_blue(),
             recent_data.len().to_string().bright_white().bold()
-        );
-        for month in recent_data.iter().rev() {
-            println!(
+        )?;
+        for month in recent_data {
+            writeln!(
+                out,
                 "   {}: {} ({} sessions)",
                 month.month.bright_white().bold(),
                 format!("${:.2}", month.total_cost).bright_green(),
                 format!("{}", month.total_sessions).bright_white()
-            );
+            )?;
         }
+
+        Ok(())
     }
 
     fn process_daily_with_projects(
@@ -244,18 +307,28 @@ impl ReportDisplayManager {
     ) -> Vec<DailyData> {
         let display_limit = limit.unwrap_or(30);
 
-        // Create a map to store daily aggregated data
-        let mut daily_aggregates: HashMap<String, HashMap<String, DailyProject>> = HashMap::new();
+        // Only the last display_limit days are shown, so days outside that
+        // window are skipped during aggregation (YYYY-MM-DD keys compare
+        // chronologically as strings)
+        let today = chrono::Local::now().date_naive();
+        let first_day = (today - chrono::Duration::days(display_limit as i64 - 1)).to_string();
+        let last_day = today.to_string();
 
-        // Track which sessions have been counted for each date
-        let mut counted_sessions_per_day: HashMap<String, HashSet<String>> = HashMap::new();
+        // One flat map keyed by (date, project), so each day's usage is added
+        // with a single lookup; it is grouped into days only at the end.
+        // Keys borrow from the sessions; only new projects allocate a name
+        let mut daily_aggregates: HashMap<(&str, &str), DailyProject> = HashMap::new();
+
+        // Track which (date, session) pairs have been counted
+        let mut counted_sessions: HashSet<(&str, &str)> = HashSet::new();
 
         // Process each session's daily usage breakdown
         for session in session_data {
-            // Debug: log session with daily usage
-            if !session.daily_usage.is_empty() {
+            // Debug: log session with daily usage. The date list is only
+            // collected when debug logging is actually enabled
+            if !session.daily_usage.is_empty() && tracing::enabled!(tracing::Level::DEBUG) {
                 debug!("Session {} has {} daily entries", session.session_id, session.daily_usage.len());
-                let dates: Vec<String> = session.daily_usage.keys().cloned().collect();
+                let dates: Vec<&String> = session.daily_usage.keys().collect();
                 debug!("  Dates for session {}: {:?}", &session.session_id[..20.min(session.session_id.len())], dates);
                 for date in session.daily_usage.keys() {
                     if date.contains("2025-08-20") {
@@ -265,6 +338,10 @@ impl ReportDisplayManager {
             }
             
             for (date, daily_usage) in &session.daily_usage {
+                if date.as_str() < first_day.as_str() || date.as_str() > last_day.as_str() {
+                    continue;
+                }
+
                 // Debug: Track Aug 20 aggregation
                 if date == "2025-08-20" {
                     debug!(
@@ -274,10 +351,8 @@ impl ReportDisplayManager {
                     );
                 }
                 
-                let date_projects = daily_aggregates.entry(date.clone()).or_default();
-
-                let project = date_projects
-                    .entry(session.project_path.clone())
+                let project = daily_aggregates
+                    .entry((date.as_str(), session.project_path.as_str()))
                     .or_insert_with(|| DailyProject {
                         project: session.project_path.clone(),
                         sessions: 0,
@@ -287,30 +362,25 @@ impl ReportDisplayManager {
 
                 // Add tokens and cost for this day
                 project.total_cost += daily_usage.cost;
-                project.total_tokens += daily_usage.input_tokens
-                    + daily_usage.output_tokens
-                    + daily_usage.cache_creation_tokens
-                    + daily_usage.cache_read_tokens;
-            }
+                project.total_tokens += daily_usage.total_tokens();
 
-            // Count the session only once per day it was active
-            for date in session.daily_usage.keys() {
-                let counted_this_day = counted_sessions_per_day.entry(date.clone()).or_default();
-                if counted_this_day.insert(session.session_id.clone()) {
-                    // This session hasn't been counted for this day yet
-                    if let Some(date_projects) = daily_aggregates.get_mut(date) {
-                        if let Some(project) = date_projects.get_mut(&session.project_path) {
-                            project.sessions += 1;
-                        }
-                    }
+                // Count the session only once per day it was active
+                if counted_sessions.insert((date.as_str(), session.session_id.as_str())) {
+                    project.sessions += 1;
                 }
             }
         }
 
+        // Group the projects by day, moving them out of the flat map
+        let mut projects_by_day: HashMap<&str, Vec<DailyProject>> = HashMap::new();
+        for ((date, _), project) in daily_aggregates {
+            projects_by_day.entry(date).or_default().push(project);
+        }
+
         // Debug: Log Aug 20 final totals
-        if let Some(aug20_data) = daily_aggregates.get("2025-08-20") {
-            let aug20_total: f64 = aug20_data.values().map(|p| p.total_cost).sum();
-            let aug20_sessions: u32 = aug20_data.values().map(|p| p.sessions).sum();
+        if let Some(aug20_data) = projects_by_day.get("2025-08-20") {
+            let aug20_total: f64 = aug20_data.iter().map(|p| p.total_cost).sum();
+            let aug20_sessions: u32 = aug20_data.iter().map(|p| p.sessions).sum();
             info!(
                 "Aug 20 final aggregation: {} sessions, total cost: ${:.2}",
                 aug20_sessions,
@@ -321,21 +391,19 @@ impl ReportDisplayManager {
         // Generate the last N days, even if they have no data
         let mut result = Vec::new();
 
-        // Get today's date
-        let today = chrono::Local::now().date_naive();
-
         // Generate the last display_limit days
         for i in 0..display_limit {
             let target_date = today - chrono::Duration::days(i as i64);
-            let date_str = target_date.format("%Y-%m-%d").to_string();
+            let date_str = target_date.to_string();
 
-            if let Some(date_projects) = daily_aggregates.get(&date_str) {
+            if let Some(mut projects) = projects_by_day.remove(date_str.as_str()) {
                 // Process projects for this date
-                let mut projects: Vec<DailyProject> = date_projects.values().cloned().collect();
                 projects.sort_by(|a, b| a.project.cmp(&b.project));
 
-                let day_total: f64 = projects.iter().map(|p| p.total_cost).sum();
-                let day_sessions: u32 = projects.iter().map(|p| p.sessions).sum();
+                let (day_total, day_sessions) =
+                    projects.iter().fold((0.0, 0u32), |(cost, sessions), p| {
+                        (cost + p.total_cost, sessions + p.sessions)
+                    });
 
                 result.push(DailyData {
                     date: date_str,
@@ -364,50 +432,187 @@ impl ReportDisplayManager {
         session_data: &[SessionOutput],
         limit: Option<usize>,
     ) -> Vec<MonthlyData> {
-        let mut monthly_aggregates: HashMap<String, (f64, HashSet<String>)> = HashMap::new();
+        // Months are borrowed from the sessions, not copied per day
+        let mut monthly_aggregates: HashMap<&str, (f64, u32)> = HashMap::new();
+
+        // Months the current session has already been counted in. Each
+        // session appears once in the input, so counting it once per month
+        // it touched replaces a per-month set of session ids
+        let mut session_months: Vec<&str> = Vec::new();
 
         // Process each session
         for session in session_data {
+            session_months.clear();
+
             // For each day the session was active
             for (date, daily_usage) in &session.daily_usage {
                 // Extract month from date (YYYY-MM-DD -> YYYY-MM)
-                let month = if date.len() >= 7 {
-                    date[..7].to_string()
-                } else {
-                    "unknown".to_string()
-                };
+                let month = date.get(..7).unwrap_or("unknown");
 
-                let (cost, sessions) = monthly_aggregates
-                    .entry(month)
-                    .or_insert_with(|| (0.0, HashSet::new()));
+                let (cost, sessions) = monthly_aggregates.entry(month).or_insert((0.0, 0));
 
                 // Add cost for this day
                 *cost += daily_usage.cost;
 
-                // Track unique session for this month
-                sessions.insert(session.session_id.clone());
+                // Count the session once for this month
+                if !session_months.contains(&month) {
+                    session_months.push(month);
+                    *sessions += 1;
+                }
             }
         }
 
+        let mut months: Vec<(&str, (f64, u32))> = monthly_aggregates.into_iter().collect();
+
+        // Apply limit - show most recent months. Partition the newest months
+        // to the back first so only those are sorted and converted
+        let display_limit = limit.unwrap_or(10);
+        if months.len() > display_limit {
+            let skip_count = months.len() - display_limit;
+            months.select_nth_unstable_by_key(skip_count - 1, |(month, _)| *month);
+            months.drain(..skip_count);
+        }
+        months.sort_unstable_by_key(|(month, _)| *month);
+
         // Convert to MonthlyData
-        let mut result: Vec<MonthlyData> = monthly_aggregates
+        let result: Vec<MonthlyData> = months
             .into_iter()
-            .map(|(month, (total_cost, sessions))| MonthlyData {
-                month,
+            .map(|(month, (total_cost, total_sessions))| MonthlyData {
+                month: month.to_string(),
                 total_cost,
-                total_sessions: sessions.len() as u32,
+                total_sessions,
             })
             .collect();
 
-        result.sort_by(|a, b| a.month.cmp(&b.month));
+        result
+    }
+}
 
-        // Apply limit - show most recent months
-        let display_limit = limit.unwrap_or(10);
-        if result.len() > display_limit {
-            let skip_count = result.len() - display_limit;
-            result = result.into_iter().skip(skip_count).collect();
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn session(id: &str, days: &[(&str, f64)]) -> SessionOutput {
+        SessionOutput {
+            session_id: id.to_string(),
+            project_path: "project".to_string(),
+            input_tokens: 0,
+            output_tokens: 0,
+            cache_creation_tokens: 0,
+            cache_read_tokens: 0,
+            total_cost: 0.0,
+            last_activity: String::new(),
+            models_used: Vec::new(),
+            daily_usage: days
+                .iter()
+                .map(|&(date, cost)| {
+                    let usage = DailyUsage {
+                        cost,
+                        ..DailyUsage::default()
+                    };
+                    (date.to_string(), usage)
+                })
+                .collect(),
         }
+    }
 
-        result
+    #[test]
+    fn test_monthly_keeps_most_recent_months_in_order() {
+        let sessions = vec![
+            session("a", &[("2025-03-02", 1.0), ("2025-01-10", 2.0), ("2025-05-01", 4.0)]),
+            session("b", &[("2025-04-15", 8.0), ("2025-03-20", 16.0), ("2025-02-01", 32.0)]),
+        ];
+        let manager = ReportDisplayManager::new();
+
+        let months = manager.process_monthly_data(&sessions, Some(3));
+        let summary: Vec<_> = months
+            .iter()
+            .map(|m| (m.month.as_str(), m.total_cost, m.total_sessions))
+            .collect();
+        assert_eq!(
+            summary,
+            vec![("2025-03", 17.0, 2), ("2025-04", 8.0, 1), ("2025-05", 4.0, 1)]
+        );
+
+        assert!(manager.process_monthly_data(&sessions, Some(0)).is_empty());
+        assert_eq!(manager.process_monthly_data(&sessions, None).len(), 5);
+    }
+
+    #[test]
+    fn test_write_daily_lists_days_and_projects() {
+        let today = chrono::Local::now().date_naive().format("%Y-%m-%d").to_string();
+        let sessions = vec![session("a", &[(today.as_str(), 1.5)])];
+        let manager = ReportDisplayManager::new();
+        let daily = manager.process_daily_with_projects(&sessions, Some(1));
+
+        let mut out = Vec::new();
+        ReportDisplayManager::write_daily(&mut out, &daily).unwrap();
+        let text = String::from_utf8(out).unwrap();
+        assert_eq!(text.matches(&"=".repeat(BANNER_WIDTH)).count(), 2);
+        assert!(text.contains(&today));
+        assert!(text.contains("project"));
+        assert!(text.contains("$1.50"));
+    }
+
+    #[test]
+    fn test_daily_groups_projects_per_day() {
+        let today = chrono::Local::now().date_naive().to_string();
+        let mut other = session("b", &[(today.as_str(), 2.0)]);
+        other.project_path = "another".to_string();
+        let sessions = vec![
+            session("a", &[(today.as_str(), 1.0)]),
+            other,
+            session("c", &[(today.as_str(), 0.5)]),
+        ];
+
+        let daily = ReportDisplayManager::new().process_daily_with_projects(&sessions, Some(2));
+        assert_eq!(daily.len(), 2);
+        let projects: Vec<_> = daily[0]
+            .projects
+            .iter()
+            .map(|p| (p.project.as_str(), p.sessions, p.total_cost))
+            .collect();
+        assert_eq!(projects, vec![("another", 1, 2.0), ("project", 2, 1.5)]);
+        assert_eq!(daily[0].total_sessions, 3);
+        assert!(daily[1].projects.is_empty());
+    }
+
+    #[test]
+    fn test_json_report_is_pretty_printed() {
+        let monthly = vec![MonthlyData {
+            month: "2025-08".to_string(),
+            total_cost: 1.5,
+            total_sessions: 2,
+        }];
+        let report = MonthlyReport { monthly: &monthly };
+
+        let mut pretty = Vec::new();
+        write_json_to(&mut pretty, &report).unwrap();
+        let pretty = String::from_utf8(pretty).unwrap();
+        assert!(pretty.starts_with("{\n  \"monthly\": ["));
+        assert!(pretty.ends_with("}\n"));
+        assert_eq!(
+            serde_json::from_str::<serde_json::Value>(&pretty).unwrap()["monthly"][0]["totalCost"],
+            1.5
+        );
+    }
+
+    #[test]
+    fn test_write_monthly_lists_recent_months_oldest_first() {
+        let monthly: Vec<MonthlyData> = ["2025-06", "2025-07", "2025-08"]
+            .iter()
+            .map(|month| MonthlyData {
+                month: month.to_string(),
+                total_cost: 1.0,
+                total_sessions: 1,
+            })
+            .collect();
+
+        let mut out = Vec::new();
+        ReportDisplayManager::write_monthly(&mut out, &monthly, Some(2)).unwrap();
+        let text = String::from_utf8(out).unwrap();
+        let recent = &text[text.find("Recent monthly usage").unwrap()..];
+        assert!(!recent.contains("2025-06"));
+        assert!(recent.find("2025-07").unwrap() < recent.find("2025-08").unwrap());
     }
 }
@@ -1,5 +1,5 @@
 use anyhow::Result;
-use chrono::{DateTime, NaiveDateTime, Utc};
+use chrono::{DateTime, NaiveDate, NaiveDateTime, NaiveTime, Utc};
 
 /// Handles parsing timestamps from various formats used in Claude usage data
 pub struct TimestampParser;
@@ -8,25 +8,115 @@ impl TimestampParser {
     /// Parse a timestamp string into a DateTime<Utc>
     /// Handles both Z suffix and timezone info formats
     pub fn parse(timestamp_str: &str) -> Result<DateTime<Utc>> {
-        // Handle both Z suffix and timezone info
-        let timestamp = if timestamp_str.ends_with('Z') {
-            timestamp_str.replace('Z', "+00:00")
-        } else {
-            timestamp_str.to_string()
-        };
+        // Fast path for the fixed `YYYY-MM-DDTHH:MM:SS[.fff]Z` shape Claude writes
+        if let Some(dt) = Self::parse_utc_fixed(timestamp_str) {
+            return Ok(dt);
+        }
 
-        // Try parsing as ISO 8601
-        if let Ok(dt) = DateTime::parse_from_rfc3339(&timestamp) {
+        // Try parsing as ISO 8601 (RFC 3339 accepts both `Z` and numeric offsets)
+        if let Ok(dt) = DateTime::parse_from_rfc3339(timestamp_str) {
             return Ok(dt.with_timezone(&Utc));
         }
 
         // Try parsing as naive datetime and assume UTC
-        if let Ok(naive) = NaiveDateTime::parse_from_str(&timestamp, "%Y-%m-%dT%H:%M:%S%.f") {
+        if let Ok(naive) = NaiveDateTime::parse_from_str(timestamp_str, "%Y-%m-%dT%H:%M:%S%.f") {
             return Ok(DateTime::from_naive_utc_and_offset(naive, Utc));
         }
 
         anyhow::bail!("Failed to parse timestamp: {}", timestamp_str)
     }
+
+    /// Return the UTC calendar date (`YYYY-MM-DD`) of a timestamp.
+    ///
+    /// For UTC `Z` timestamps the date is sliced from the string instead of
+    /// being formatted from a parsed `DateTime`.
+    pub fn parse_date(timestamp_str: &str) -> Result<String> {
+        if let Some(date) = Self::utc_date_prefix(timestamp_str) {
+            return Ok(date.to_string());
+        }
+
+        // NaiveDate's Display is YYYY-MM-DD and skips parsing a format string
+        Ok(Self::parse(timestamp_str)?.date_naive().to_string())
+    }
+
+    /// Borrow the `YYYY-MM-DD` prefix of a valid UTC (`Z` or `+00:00`)
+    /// timestamp.
+    ///
+    /// Returns `None` for any other shape, including timestamps with non-zero
+    /// offsets whose UTC date may differ from their prefix.
+    pub fn utc_date_prefix(timestamp_str: &str) -> Option<&str> {
+        Self::parse_utc_fixed(timestamp_str).map(|_| &timestamp_str[..10])
+    }
+
+    /// Parse a `YYYY-MM-DD` day key by fixed byte offsets.
+    ///
+    /// Returns `None` for any other shape or an invalid calendar date.
+    pub fn parse_day_key(date_str: &str) -> Option<NaiveDate> {
+        let b = date_str.as_bytes();
+        if b.len() != 10 || b[4] != b'-' || b[7] != b'-' {
+            return None;
+        }
+        NaiveDate::from_ymd_opt(
+            ascii_digits(&b[0..4])? as i32,
+            ascii_digits(&b[5..7])?,
+            ascii_digits(&b[8..10])?,
+        )
+    }
+
+    /// Parse `YYYY-MM-DDTHH:MM:SS[.f{1,9}]` with a `Z` or `+00:00` suffix by
+    /// fixed byte offsets.
+    ///
+    /// The `+00:00` form is what `to_rfc3339` writes, so timestamps normalised
+    /// by the keeper integration stay on this path. Returns `None` for any
+    /// other shape so the caller can fall back to the general parsers.
+    fn parse_utc_fixed(timestamp_str: &str) -> Option<DateTime<Utc>> {
+        let b = timestamp_str.as_bytes();
+        let end = if b.ends_with(b"Z") {
+            b.len() - 1
+        } else if b.ends_with(b"+00:00") {
+            b.len() - 6
+        } else {
+            return None;
+        };
+        if end < 19
+            || b[4] != b'-'
+            || b[7] != b'-'
+            || b[10] != b'T'
+            || b[13] != b':'
+            || b[16] != b':'
+        {
+            return None;
+        }
+
+        let digits = |range: std::ops::Range<usize>| ascii_digits(&b[range]);
+
+        let nanos = if end == 19 {
+            0
+        } else if b[19] == b'.' {
+            let frac_len = end - 20;
+            if !(1..=9).contains(&frac_len) {
+                return None;
+            }
+            digits(20..end)? * 10u32.pow(9 - frac_len as u32)
+        } else {
+            return None;
+        };
+
+        let date = Self::parse_day_key(&timestamp_str[..10])?;
+        let time =
+            NaiveTime::from_hms_nano_opt(digits(11..13)?, digits(14..16)?, digits(17..19)?, nanos)?;
+        Some(DateTime::from_naive_utc_and_offset(
+            date.and_time(time),
+            Utc,
+        ))
+    }
+}
+
+/// Value of a run of ASCII digits, or `None` if any byte is not a digit
+fn ascii_digits(bytes: &[u8]) -> Option<u32> {
+    bytes.iter().try_fold(0u32, |acc, &c| {
+        c.is_ascii_digit().then(|| acc * 10 + u32::from(c - b'0'))
+    })
 }
 
 #[cfg(test)]
@@ -56,4 +146,78 @@ mod tests {
         let result = TimestampParser::parse("invalid");
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_fixed_path_matches_rfc3339() {
+        for ts in [
+            "2025-08-20T10:30:00Z",
+            "2025-08-20T10:30:00.1Z",
+            "2025-08-20T10:30:00.123Z",
+            "2025-08-20T23:59:59.123456789Z",
+            "2025-08-20T10:30:00+00:00",
+            "2025-08-20T10:30:00.123+00:00",
+        ] {
+            let fast = TimestampParser::parse_utc_fixed(ts).unwrap();
+            let general = DateTime::parse_from_rfc3339(ts)
+                .unwrap()
+                .with_timezone(&Utc);
+            assert_eq!(fast, general, "{}", ts);
+        }
+    }
+
+    #[test]
+    fn test_parse_date() {
+        assert_eq!(
+            TimestampParser::parse_date("2025-08-20T23:59:59.999Z").unwrap(),
+            "2025-08-20"
+        );
+        // Offsets are normalised to the UTC date
+        assert_eq!(
+            TimestampParser::parse_date("2025-08-21T01:30:00+02:00").unwrap(),
+            "2025-08-20"
+        );
+        assert!(TimestampParser::parse_date("invalid").is_err());
+    }
+
+    #[test]
+    fn test_parse_day_key() {
+        assert_eq!(
+            TimestampParser::parse_day_key("2025-08-20"),
+            NaiveDate::from_ymd_opt(2025, 8, 20)
+        );
+        assert_eq!(TimestampParser::parse_day_key("2025-02-30"), None);
+        assert_eq!(TimestampParser::parse_day_key("2025-8-20"), None);
+        assert_eq!(TimestampParser::parse_day_key("2025-08-20T00"), None);
+    }
+
+    #[test]
+    fn test_utc_date_prefix() {
+        assert_eq!(
+            TimestampParser::utc_date_prefix("2025-08-20T10:30:00.123Z"),
+            Some("2025-08-20")
+        );
+        assert_eq!(
+            TimestampParser::utc_date_prefix("2025-08-20T10:30:00.123+00:00"),
+            Some("2025-08-20")
+        );
+        assert_eq!(TimestampParser::utc_date_prefix("2025-08-21T01:30:00+02:00"), None);
+        assert_eq!(TimestampParser::utc_date_prefix("2025-02-30T10:30:00Z"), None);
+    }
+
+    #[test]
+    fn test_fixed_path_rejects_other_shapes() {
+        assert!(TimestampParser::parse_utc_fixed("2025-08-20T10:30:00+02:00").is_none());
+        assert!(TimestampParser::parse_utc_fixed("2025-13-20T10:30:00Z").is_none());
+        assert!(TimestampParser::parse_utc_fixed("2025-08-20T10:30:00.Z").is_none());
+        assert!(TimestampParser::parse_utc_fixed("2025-08-2xT10:30:00Z").is_none());
+        assert!(TimestampParser::parse_utc_fixed("2025-08-20T10:30:00Z+00:00").is_none());
+        assert!(TimestampParser::parse_utc_fixed("2025-08-20T10:30+00:00").is_none());
+
+        // Offsets still parse through the general path
+        let offset = TimestampParser::parse("2025-08-20T12:30:00+02:00").unwrap();
+        assert_eq!(
+            offset,
+            TimestampParser::parse("2025-08-20T10:30:00Z").unwrap()
+        );
+    }
 }
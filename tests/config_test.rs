@@ -19,6 +19,8 @@ mod config_tests {
         // Test processing defaults
         assert_eq!(config.processing.batch_size, 10);
         assert_eq!(config.processing.parallel_chunks, 4);
+        assert_eq!(config.processing.workers, 0);
+        assert_eq!(config.processing.parse_cache, true);
         assert_eq!(config.processing.max_retries, 3);
         assert_eq!(config.processing.progress_interval_mb, 10);
 
@@ -222,6 +222,8 @@ fn test_session_activity_creation() {
     assert_eq!(activity.project, "project"); // Should extract last path component
     assert_eq!(activity.tokens, 2250); // 1500 + 750 (half for output)
     assert_eq!(activity.cost, 0.25);
+    assert_eq!(activity.tokens_label, "+2250 tokens ");
+    assert_eq!(activity.cost_label, "($0.250)");
 }
 
 #[cfg(feature = "live")]